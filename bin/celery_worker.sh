@@ -8,6 +8,13 @@ CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-1}
 QUEUE=${1:-${CELERY_WORKER_QUEUE:=celery}}
 WORKER_NAME=${2:-${CELERY_WORKER_NAME:="${QUEUE}"@%n}}
 
+# The pool processes share their Prometheus metrics through this directory, it must
+# be empty at startup
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    rm -f "$PROMETHEUS_MULTIPROC_DIR"/*.db
+fi
+
 echo "Starting celery worker $WORKER_NAME with queue $QUEUE"
 exec celery --workdir src --app open_producten  worker \
     -Q $QUEUE \
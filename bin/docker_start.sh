@@ -22,6 +22,13 @@ done
 
 >&2 echo "Database is up."
 
+# The uwsgi processes share their Prometheus metrics through this directory, it must
+# be empty at startup
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    rm -f "$PROMETHEUS_MULTIPROC_DIR"/*.db
+fi
+
 # Apply database migrations
 >&2 echo "Apply database migrations"
 python src/manage.py migrate
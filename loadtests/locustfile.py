@@ -0,0 +1,51 @@
+"""
+Load test of the producten and producttypen APIs, see
+``docs/development/performance/load_tests.rst``.
+
+Run against a server with a seeded database::
+
+    locust -f loadtests/locustfile.py --host http://localhost:8000 --token <token>
+"""
+
+import os
+
+import report  # noqa: F401
+from locust import events
+from scenarios import (  # noqa: F401
+    CatalogusBezoeker,
+    MijnProductenGebruiker,
+    NachtelijkeExport,
+    ProductAanvrager,
+)
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument(
+        "--token",
+        default=os.getenv("OPEN_PRODUCTEN_TOKEN", ""),
+        is_secret=True,
+        help="The API token, defaults to the environment variable OPEN_PRODUCTEN_TOKEN.",
+    )
+    parser.add_argument(
+        "--export-interval",
+        type=float,
+        default=600,
+        help="The seconds between the starts of the exports, defaults to 600.",
+    )
+    parser.add_argument(
+        "--export-formaat",
+        choices=("ndjson", "csv"),
+        default="ndjson",
+        help="The format of the export.",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("LOADTEST_DATABASE_URL", ""),
+        is_secret=True,
+        help=(
+            "A Postgres url of the database under test to report the total database "
+            "time of the run, defaults to the environment variable "
+            "LOADTEST_DATABASE_URL."
+        ),
+    )
@@ -0,0 +1,163 @@
+"""
+Reporting of the latency percentiles, the errors and the database versus Python time
+per endpoint.
+
+Locust itself keeps the response times and failures, use ``--csv`` to write them. The
+database time per endpoint is taken from the ``Server-Timing`` header of the responses
+(the ``db`` and ``total`` metrics, in ms) when the server sends it. With
+``--database-url`` the time Postgres spent executing statements during the run is read
+from ``pg_stat_database`` as well, which does not depend on the header.
+"""
+
+import logging
+from collections import defaultdict
+
+from locust import events
+from locust.runners import WorkerRunner
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    """
+    Return the durations of a ``Server-Timing`` header by metric name.
+    """
+    durations = {}
+    for metric in header.split(","):
+        name, *params = (part.strip() for part in metric.split(";"))
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() != "dur":
+                continue
+            try:
+                durations[name] = float(value.strip().strip('"'))
+            except ValueError:
+                pass
+    return durations
+
+
+class ServerTimes:
+    """
+    The summed server side durations in ms per endpoint, as ``[requests, db, total]``.
+    """
+
+    def __init__(self):
+        self.times = defaultdict(lambda: [0, 0.0, 0.0])
+
+    def add(self, endpoint: str, db: float, total: float):
+        times = self.times[endpoint]
+        times[0] += 1
+        times[1] += db
+        times[2] += total
+
+    def merge(self, times: dict[str, list]):
+        for endpoint, (requests, db, total) in times.items():
+            self.times[endpoint][0] += requests
+            self.times[endpoint][1] += db
+            self.times[endpoint][2] += total
+
+    def pop(self) -> dict[str, list]:
+        times, self.times = dict(self.times), defaultdict(lambda: [0, 0.0, 0.0])
+        return times
+
+
+server_times = ServerTimes()
+database_time = {}
+
+
+def get_database_time(database_url: str) -> float:
+    """
+    Return the time in ms the database spent executing statements (Postgres 14+).
+    """
+    import psycopg2
+
+    with psycopg2.connect(database_url) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT active_time FROM pg_stat_database "
+                "WHERE datname = current_database()"
+            )
+            return cursor.fetchone()[0]
+
+
+@events.request.add_listener
+def on_request(request_type, name, response_time, response=None, **kwargs):
+    if response is None or "Server-Timing" not in response.headers:
+        return
+
+    durations = parse_server_timing(response.headers["Server-Timing"])
+    if "db" in durations:
+        server_times.add(
+            f"{request_type} {name}",
+            durations["db"],
+            durations.get("total", response_time),
+        )
+
+
+@events.report_to_master.add_listener
+def on_report_to_master(client_id, data):
+    data["server_times"] = server_times.pop()
+
+
+@events.worker_report.add_listener
+def on_worker_report(client_id, data):
+    server_times.merge(data.get("server_times", {}))
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    server_times.pop()
+    database_time.clear()
+    if environment.parsed_options.database_url:
+        database_time["start"] = get_database_time(
+            environment.parsed_options.database_url
+        )
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    if "start" in database_time:
+        database_time["stop"] = get_database_time(
+            environment.parsed_options.database_url
+        )
+    for line in get_report(environment.stats):
+        logger.info(line)
+
+
+def get_report(stats) -> list[str]:
+    times = server_times.times
+    lines = [
+        f"{'Endpoint':<50} {'reqs':>7} {'fails':>6} "
+        + " ".join(f"{f'p{int(p * 100)}':>7}" for p in PERCENTILES)
+        + f" {'db':>7} {'python':>7}"
+    ]
+    for (name, method), entry in sorted(stats.entries.items()):
+        endpoint = f"{method} {name}"
+        line = f"{endpoint[:50]:<50} {entry.num_requests:>7} {entry.num_failures:>6} "
+        line += " ".join(
+            f"{entry.get_response_time_percentile(p):>7.0f}" for p in PERCENTILES
+        )
+        if endpoint in times and times[endpoint][0]:
+            requests, db, total = times[endpoint]
+            line += f" {db / requests:>7.1f} {(total - db) / requests:>7.1f}"
+        lines.append(line)
+
+    total_time = sum(entry.total_response_time for entry in stats.entries.values())
+    if "stop" in database_time and total_time:
+        db = database_time["stop"] - database_time["start"]
+        lines.append(
+            f"Database: {db / 1000:.1f}s of {total_time / 1000:.1f}s response time "
+            f"({db / total_time:.0%}), the rest is spent in Python and the network."
+        )
+    lines.append(
+        "Latencies in ms, db and python are the averages of the Server-Timing header."
+    )
+    return lines
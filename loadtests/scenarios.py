@@ -0,0 +1,219 @@
+"""
+The users of the load test, together they model the traffic mix of production.
+
+=====================  ======  =====================================================
+User                   Weight  Traffic
+=====================  ======  =====================================================
+CatalogusBezoeker      6       Browsing the catalogue in Dutch and English, reading
+                               the content and actuele prijs of product typen.
+MijnProductenGebruiker 3       "My products" lookups of an eigenaar by bsn or kvk
+                               nummer and reading one of the producten.
+ProductAanvrager       1       Creating producten with eigenaren and the dataobject
+                               and verbruiksobject of the product type.
+NachtelijkeExport      1 user  Streaming the export of all producten, repeated every
+                               ``--export-interval`` seconds.
+=====================  ======  =====================================================
+"""
+
+import random
+import time
+
+from locust import HttpUser, between, task
+from locust.exception import StopUser
+from testdata import (
+    PRODUCTEN_API,
+    PRODUCTTYPEN_API,
+    TALEN,
+    get_bsn,
+    get_json_object,
+    get_testdata,
+)
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class ApiUser(HttpUser):
+    abstract = True
+
+    def on_start(self):
+        token = self.environment.parsed_options.token
+        if not token:
+            raise StopUser("Pass the API token with --token or OPEN_PRODUCTEN_TOKEN.")
+
+        self.client.headers["Authorization"] = f"Token {token}"
+        self.testdata = get_testdata(self.host, token)
+
+    def get(self, api: str, path: str, name: str, **kwargs):
+        return self.client.get(f"{api}/{path}", name=name, **kwargs)
+
+    def random_product_type(self) -> dict:
+        return random.choice(self.testdata.product_typen)
+
+
+class CatalogusBezoeker(ApiUser):
+    weight = 6
+    wait_time = between(1, 5)
+
+    def on_start(self):
+        super().on_start()
+        self.headers = {"Accept-Language": random.choice(TALEN)}
+
+    @task(4)
+    def producttypen(self):
+        self.get(
+            PRODUCTTYPEN_API,
+            "producttypen/",
+            name="producttypen/",
+            params={"page": random.randint(1, 5)},
+            headers=self.headers,
+        )
+
+    @task(1)
+    def zoeken(self):
+        self.get(
+            PRODUCTTYPEN_API,
+            "producttypen/",
+            name="producttypen/?keywords",
+            params={"keywords": random.choice(self.testdata.keywords)},
+            headers=self.headers,
+        )
+
+    @task(3)
+    def producttype(self):
+        product_type = self.random_product_type()
+        self.get(
+            PRODUCTTYPEN_API,
+            f"producttypen/{product_type['id']}/",
+            name="producttypen/[id]/",
+            headers=self.headers,
+        )
+
+    @task(3)
+    def content(self):
+        product_type = self.random_product_type()
+        self.get(
+            PRODUCTTYPEN_API,
+            f"producttypen/{product_type['id']}/content/",
+            name="producttypen/[id]/content/",
+            headers=self.headers,
+        )
+
+    @task(3)
+    def actuele_prijs(self):
+        product_type = self.random_product_type()
+        self.get(
+            PRODUCTTYPEN_API,
+            f"producttypen/{product_type['id']}/actuele-prijs/",
+            name="producttypen/[id]/actuele-prijs/",
+        )
+
+    @task(1)
+    def thema_boom(self):
+        self.get(PRODUCTTYPEN_API, "themas/boom/", name="themas/boom/")
+
+
+class MijnProductenGebruiker(ApiUser):
+    weight = 3
+    wait_time = between(2, 10)
+
+    @task(4)
+    def mijn_producten(self):
+        eigenaar = random.choice(self.testdata.eigenaren)
+        with self.get(
+            PRODUCTEN_API,
+            "producten/eigenaar/",
+            name="producten/eigenaar/",
+            params=eigenaar,
+            catch_response=True,
+        ) as response:
+            if response.status_code != 200:
+                response.failure(f"Status code {response.status_code}")
+            elif not response.json():
+                response.failure(f"No producten found for {list(eigenaar)}")
+
+    @task(1)
+    def mijn_producten_filter(self):
+        eigenaar = random.choice(self.testdata.eigenaren)
+        if "bsn" not in eigenaar:
+            return
+        self.get(
+            PRODUCTEN_API,
+            "producten/",
+            name="producten/?eigenaren__bsn",
+            params={"eigenaren__bsn": eigenaar["bsn"]},
+        )
+
+    @task(2)
+    def product(self):
+        self.get(
+            PRODUCTEN_API,
+            f"producten/{random.choice(self.testdata.producten)}/",
+            name="producten/[id]/",
+        )
+
+
+class ProductAanvrager(ApiUser):
+    weight = 1
+    wait_time = between(5, 15)
+
+    @task
+    def aanvragen(self):
+        product_type = self.random_product_type()
+        eigenaar = (
+            {"bsn": get_bsn()}
+            if random.random() < 0.5
+            else random.choice(self.testdata.eigenaren)
+        )
+        data = {
+            "product_type_id": product_type["id"],
+            "status": "initieel",
+            "prijs": f"{random.randint(1, 500)}.{random.randint(0, 99):02}",
+            "frequentie": "eenmalig",
+            "eigenaren": [eigenaar],
+        }
+        for veld in ("dataobject", "verbruiksobject"):
+            if schema := product_type[f"{veld}_schema"]:
+                data[veld] = get_json_object(schema["schema"])
+
+        with self.client.post(
+            f"{PRODUCTEN_API}/producten/",
+            json=data,
+            name="producten/",
+            catch_response=True,
+        ) as response:
+            if response.status_code != 201:
+                response.failure(
+                    f"Status code {response.status_code}: {response.text[:200]}"
+                )
+
+
+class NachtelijkeExport(ApiUser):
+    fixed_count = 1
+    duration = 0
+
+    def wait_time(self):
+        # the interval is from the start of one export to the start of the next
+        return max(self.environment.parsed_options.export_interval - self.duration, 0)
+
+    @task
+    def export(self):
+        formaat = self.environment.parsed_options.export_formaat
+        start = time.perf_counter()
+        with self.get(
+            PRODUCTEN_API,
+            "producten/export/",
+            name=f"producten/export/?formaat={formaat}",
+            params={"formaat": formaat},
+            stream=True,
+            catch_response=True,
+        ) as response:
+            length = sum(
+                len(chunk) for chunk in response.iter_content(EXPORT_CHUNK_SIZE)
+            )
+            # with stream=True locust only measures until the headers are received,
+            # the export is not done before the whole body has been read
+            self.duration = time.perf_counter() - start
+            response.request_meta["response_time"] = self.duration * 1000
+            response.request_meta["response_length"] = length
+            if response.status_code != 200:
+                response.failure(f"Status code {response.status_code}")
@@ -0,0 +1,139 @@
+"""
+The product typen, themas and eigenaren the scenarios pick from.
+
+The data is read once per locust process from the API of the server under test, so
+the scenarios work against any seeded database, e.g. one filled with
+``src/manage.py generate_dataset``.
+"""
+
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+import requests
+from gevent.lock import Semaphore
+
+PRODUCTTYPEN_API = "/producttypen/api/v0"
+PRODUCTEN_API = "/producten/api/v0"
+
+PAGE_SIZE = 200
+PRODUCTTYPEN_PAGES = 5
+PRODUCTEN_PAGES = 5
+
+TALEN = ("nl", "en")
+
+IDENTIFICATIES = ("bsn", "kvk_nummer", "klantnummer")
+
+
+@dataclass
+class Testdata:
+    product_typen: list[dict] = field(default_factory=list)
+    themas: list[str] = field(default_factory=list)
+    keywords: list[str] = field(default_factory=list)
+    eigenaren: list[dict] = field(default_factory=list)
+    producten: list[str] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, host: str, token: str) -> "Testdata":
+        session = requests.Session()
+        session.headers["Authorization"] = f"Token {token}"
+
+        def get_results(path: str, pages: int):
+            url, params = f"{host}{path}", {"page_size": PAGE_SIZE}
+            for _page in range(pages):
+                response = session.get(url, params=params)
+                response.raise_for_status()
+                data = response.json()
+                yield from data["results"]
+                # the next link contains the page size and the page or cursor
+                url, params = data.get("next"), None
+                if not url:
+                    break
+
+        testdata = cls()
+        for product_type in get_results(
+            f"{PRODUCTTYPEN_API}/producttypen/", PRODUCTTYPEN_PAGES
+        ):
+            testdata.product_typen.append(
+                {
+                    "id": product_type["id"],
+                    "toegestane_statussen": product_type["toegestane_statussen"],
+                    "dataobject_schema": product_type["dataobject_schema"],
+                    "verbruiksobject_schema": product_type["verbruiksobject_schema"],
+                }
+            )
+            testdata.keywords.extend(product_type["keywords"])
+
+        testdata.themas = [
+            thema["id"] for thema in get_results(f"{PRODUCTTYPEN_API}/themas/", 1)
+        ]
+
+        # the first pages are enough, paging through millions of producten is not
+        for product in get_results(f"{PRODUCTEN_API}/producten/", PRODUCTEN_PAGES):
+            testdata.producten.append(product["id"])
+            for eigenaar in product["eigenaren"]:
+                identificatie = {
+                    key: eigenaar[key]
+                    for key in (*IDENTIFICATIES, "vestigingsnummer")
+                    if eigenaar.get(key)
+                }
+                if identificatie:
+                    testdata.eigenaren.append(identificatie)
+
+        if not testdata.product_typen or not testdata.eigenaren:
+            raise RuntimeError(
+                f"No product typen or producten found on {host}, seed the database "
+                "first with `src/manage.py generate_dataset`."
+            )
+        return testdata
+
+
+_testdata = None
+_lock = Semaphore()
+
+
+def get_testdata(host: str, token: str) -> Testdata:
+    """
+    Return the test data of this locust process, all users share the same data.
+    """
+    global _testdata
+    with _lock:
+        if _testdata is None:
+            _testdata = Testdata.load(host, token)
+    return _testdata
+
+
+def get_bsn() -> str:
+    """
+    Return a random bsn that passes the eleven test.
+    """
+    while True:
+        digits = [random.randint(0, 9) for _i in range(8)]
+        check = sum(digit * (9 - i) for i, digit in enumerate(digits)) % 11
+        if check < 10 and any(digits):
+            return "".join(map(str, digits)) + str(check)
+
+
+def get_json_object(schema: dict):
+    """
+    Return a random value that is valid for a (simple) json schema.
+    """
+    if "enum" in schema:
+        return random.choice(schema["enum"])
+
+    match schema.get("type"):
+        case "object":
+            return {
+                key: get_json_object(value)
+                for key, value in schema.get("properties", {}).items()
+            }
+        case "array":
+            return [get_json_object(schema.get("items", {}))]
+        case "integer":
+            return random.randint(0, 100)
+        case "number":
+            return float(Decimal(random.uniform(0, 100)).quantize(Decimal("0.01")))
+        case "boolean":
+            return random.choice((True, False))
+        case _:
+            return random.choice(("AB-12-CD", "Amsterdam", "test"))
@@ -0,0 +1,9 @@
+"""
+Micro-benchmarks of the serializers and endpoints, run by the ``run_benchmarks``
+command against a generated dataset.
+
+Every benchmark records its wall time, the time spent in the database and the number
+of queries. A benchmark fails when it needs more queries than its budget, so N+1
+queries are found before they ship, and the results can be compared to a stored
+baseline to find slower serializers and filters.
+"""
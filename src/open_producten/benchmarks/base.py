@@ -0,0 +1,87 @@
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    query_budget: int
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, query_budget: int):
+    """
+    Register a benchmark. The decorated function prepares the data of the benchmark
+    and returns the function that is timed.
+    """
+
+    def decorator(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, query_budget)
+        return setup
+
+    return decorator
+
+
+def run_benchmark(benchmark: Benchmark, rounds: int) -> dict:
+    func = benchmark.setup()
+    # the first call fills the caches of imports, translations and the like
+    func()
+
+    tijden = []
+    sql_tijden = []
+    for _i in range(rounds):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            func()
+            tijden.append(time.perf_counter() - start)
+        sql_tijden.append(sum(float(query["time"]) for query in queries))
+
+    return {
+        "rounds": rounds,
+        "min": min(tijden),
+        "max": max(tijden),
+        "mean": statistics.mean(tijden),
+        "median": statistics.median(tijden),
+        "sql_median": statistics.median(sql_tijden),
+        "queries": len(queries),
+        "query_budget": benchmark.query_budget,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Return the regressions of the results: more queries than the budget or the
+    baseline, or a median that is more than ``tolerance`` slower than the baseline.
+    """
+    regressions = []
+
+    for name, result in results.items():
+        if result["queries"] > result["query_budget"]:
+            regressions.append(
+                f"{name}: {result['queries']} queries, the budget is "
+                f"{result['query_budget']}."
+            )
+
+        if name not in baseline:
+            continue
+
+        if result["queries"] > baseline[name]["queries"]:
+            regressions.append(
+                f"{name}: {result['queries']} queries, the baseline has "
+                f"{baseline[name]['queries']}."
+            )
+        if result["median"] > baseline[name]["median"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: median of {result['median'] * 1000:.1f}ms, the baseline "
+                f"has {baseline[name]['median'] * 1000:.1f}ms."
+            )
+
+    return regressions
@@ -0,0 +1,98 @@
+"""
+The list, detail and filter endpoints, including the authentication and the
+response rendering. The response cache of the producttypen endpoints is disabled by
+the ``run_benchmarks`` command, so every request is handled by the viewset.
+"""
+
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from open_producten.accounts.models import User
+from open_producten.producten.models import Eigenaar, Product
+from open_producten.producttypen.models import ProductType
+
+from .base import benchmark
+
+USERNAME = "benchmark"
+
+
+def get_client() -> APIClient:
+    user, _created = User.objects.get_or_create(username=USERNAME)
+    token, _created = Token.objects.get_or_create(user=user)
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+    return client
+
+
+def get(path: str, params: dict | None = None):
+    client = get_client()
+
+    def request():
+        response = client.get(path, params)
+        assert response.status_code == 200, response.status_code
+        # the streaming export is only rendered when it is consumed
+        return response.content
+
+    return request
+
+
+@benchmark("endpoint.producttypen.list", query_budget=16)
+def producttypen_list():
+    return get(reverse("producttype-list"))
+
+
+@benchmark("endpoint.producttypen.detail", query_budget=15)
+def producttypen_detail():
+    product_type = ProductType.objects.order_by("code").first()
+    return get(reverse("producttype-detail", args=[product_type.id]))
+
+
+@benchmark("endpoint.producttypen.filter.keywords", query_budget=16)
+def producttypen_filter_keywords():
+    keyword = ProductType.objects.order_by("code").first().keywords[0]
+    return get(reverse("producttype-list"), {"keywords": keyword})
+
+
+@benchmark("endpoint.themas.list", query_budget=5)
+def themas_list():
+    return get(reverse("thema-list"))
+
+
+@benchmark("endpoint.prijzen.list", query_budget=5)
+def prijzen_list():
+    return get(reverse("prijs-list"))
+
+
+@benchmark("endpoint.producten.list", query_budget=6)
+def producten_list():
+    return get(reverse("product-list"))
+
+
+@benchmark("endpoint.producten.detail", query_budget=8)
+def producten_detail():
+    product = Product.objects.order_by("id").first()
+    return get(reverse("product-detail", args=[product.id]))
+
+
+@benchmark("endpoint.producten.filter.bsn", query_budget=6)
+def producten_filter_bsn():
+    bsn = Eigenaar.objects.exclude(bsn="").order_by("id").first().bsn
+    return get(reverse("product-list"), {"eigenaren__bsn": bsn})
+
+
+@benchmark("endpoint.producten.filter.dataobject", query_budget=6)
+def producten_filter_dataobject():
+    product = Product.objects.filter(dataobject__isnull=False).order_by("id").first()
+    return get(
+        reverse("product-list"),
+        {"dataobject_attr": f"kenteken__exact__{product.dataobject['kenteken']}"},
+    )
+
+
+@benchmark("endpoint.producten.eigenaar", query_budget=4)
+def producten_eigenaar():
+    bsn = Eigenaar.objects.exclude(bsn="").order_by("id").first().bsn
+    return get(reverse("product-eigenaar"), {"bsn": bsn})
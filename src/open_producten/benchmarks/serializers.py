@@ -0,0 +1,65 @@
+"""
+``to_representation`` of the serializers over a batch of objects that are loaded up
+front like the viewsets do, so any query is an N+1 query of the serializer.
+"""
+
+from django.db.models import Prefetch
+
+from rest_framework.test import APIRequestFactory
+
+from open_producten.producten.models import Product
+from open_producten.producten.serializers.product import ProductSerializer
+from open_producten.producttypen.models import Prijs, ProductType, Thema
+from open_producten.producttypen.serializers import ProductTypeSerializer
+from open_producten.producttypen.serializers.prijs import PrijsSerializer
+from open_producten.producttypen.serializers.thema import ThemaSerializer
+
+from .base import benchmark
+
+AANTAL = 1000
+
+
+def get_context() -> dict:
+    request = APIRequestFactory().get("/")
+    request.LANGUAGE_CODE = "nl"
+    return {"request": request}
+
+
+def serialize(serializer_class, objects: list):
+    context = get_context()
+    return lambda: serializer_class(objects, many=True, context=context).data
+
+
+@benchmark("serializer.producttype", query_budget=0)
+def producttype_serializer():
+    product_typen = list(ProductType.objects.with_api_relations("nl")[:AANTAL])
+    return serialize(ProductTypeSerializer, product_typen)
+
+
+@benchmark("serializer.product", query_budget=0)
+def product_serializer():
+    producten = list(Product.objects.with_api_relations("nl")[:AANTAL])
+    return serialize(ProductSerializer, producten)
+
+
+@benchmark("serializer.thema", query_budget=0)
+def thema_serializer():
+    themas = list(
+        Thema.objects.prefetch_related(
+            Prefetch(
+                "product_typen",
+                queryset=ProductType.objects.select_related("uniforme_product_naam"),
+            )
+        )[:AANTAL]
+    )
+    return serialize(ThemaSerializer, themas)
+
+
+@benchmark("serializer.prijs", query_budget=0)
+def prijs_serializer():
+    prijzen = list(
+        Prijs.objects.prefetch_related("prijsopties", "prijsregels__dmn_config")[
+            :AANTAL
+        ]
+    )
+    return serialize(PrijsSerializer, prijzen)
@@ -0,0 +1,68 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.utils import translation
+
+import open_producten.benchmarks.endpoints  # noqa: F401
+import open_producten.benchmarks.serializers  # noqa: F401
+from open_producten.producten.tests.cases import RemoveJsonIndexesMixin
+
+from ..base import BENCHMARKS, compare, run_benchmark
+
+
+class TestQueryBudgets(RemoveJsonIndexesMixin, TransactionTestCase):
+    """
+    The query budgets hold for a small dataset as well, the timings are left to the
+    run_benchmarks command.
+    """
+
+    def setUp(self):
+        super().setUp()
+        call_command(
+            "generate_dataset",
+            seed=1,
+            product_typen=20,
+            producten=200,
+            stdout=StringIO(),
+        )
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=0)
+    def test_query_budgets(self):
+        with translation.override("nl"):
+            results = {
+                name: run_benchmark(benchmark, rounds=1)
+                for name, benchmark in BENCHMARKS.items()
+            }
+
+        self.assertEqual(compare(results, {}, tolerance=0), [])
+
+
+class TestCompare(SimpleTestCase):
+    def result(self, median=0.1, queries=1, query_budget=2):
+        return {"median": median, "queries": queries, "query_budget": query_budget}
+
+    def test_query_budget(self):
+        self.assertEqual(
+            compare({"a": self.result(queries=3)}, {}, tolerance=0.2),
+            ["a: 3 queries, the budget is 2."],
+        )
+
+    def test_baseline(self):
+        baseline = {"a": self.result(), "b": self.result()}
+
+        self.assertEqual(
+            compare(
+                {"a": self.result(median=0.11), "b": self.result(queries=2)},
+                baseline,
+                tolerance=0.2,
+            ),
+            ["b: 2 queries, the baseline has 1."],
+        )
+        self.assertEqual(
+            compare({"a": self.result(median=0.13)}, baseline, tolerance=0.2),
+            ["a: median of 130.0ms, the baseline has 100.0ms."],
+        )
+
+    def test_new_benchmark(self):
+        self.assertEqual(compare({"c": self.result()}, {}, tolerance=0.2), [])
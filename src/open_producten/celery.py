@@ -1,11 +1,30 @@
+import logging
+import os
+import time
 from pathlib import Path
 
 from django.conf import settings
 
-from celery import Celery, bootsteps
-from celery.signals import worker_ready, worker_shutdown
+from celery import Celery, bootsteps, states
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_ready,
+    worker_shutdown,
+)
+from prometheus_client import start_http_server
 
 from .setup import setup_env
+from .utils.metrics import (
+    NOTIFICATION_DISPATCH_DURATION,
+    NOTIFICATION_FAILURES,
+    TASK_DURATION,
+    TASK_QUEUE_DURATION,
+    get_registry,
+)
+
+logger = logging.getLogger(__name__)
 
 setup_env()
 
@@ -62,3 +81,65 @@ def worker_shutdown(**_):
 
 
 app.steps["worker"].add(LivenessProbe)
+
+
+#
+# Prometheus metrics of the tasks, see open_producten.utils.metrics
+#
+NOTIFICATION_TASK = "notifications_api_common.tasks.send_notification"
+
+
+class MetricsExporter(bootsteps.StartStopStep):
+    def __init__(self, worker, **kwargs):
+        self.server = None
+
+    def start(self, worker):
+        if not settings.CELERY_WORKER_METRICS_PORT:
+            return
+
+        if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+            logger.warning(
+                "PROMETHEUS_MULTIPROC_DIR is not set, the metrics of tasks that run in "
+                "child processes of the worker are not published."
+            )
+        self.server, _thread = start_http_server(
+            settings.CELERY_WORKER_METRICS_PORT, registry=get_registry()
+        )
+
+    def stop(self, worker):
+        if self.server is not None:
+            self.server.shutdown()
+
+
+@before_task_publish.connect
+def add_published_at(headers=None, **_):
+    # the headers end up in the request of the task
+    if headers is not None:
+        headers["published_at"] = time.time()
+
+
+@task_prerun.connect
+def task_started(task=None, **_):
+    task.request.started_at = time.perf_counter()
+    if published_at := getattr(task.request, "published_at", None):
+        TASK_QUEUE_DURATION.labels(task.name).observe(
+            max(time.time() - published_at, 0)
+        )
+
+
+@task_postrun.connect
+def task_finished(task=None, state=None, **_):
+    if started_at := getattr(task.request, "started_at", None):
+        TASK_DURATION.labels(task.name, state).observe(time.perf_counter() - started_at)
+
+    if task.name != NOTIFICATION_TASK:
+        return
+    if published_at := getattr(task.request, "published_at", None):
+        NOTIFICATION_DISPATCH_DURATION.labels(state).observe(
+            max(time.time() - published_at, 0)
+        )
+    if state in (states.FAILURE, states.RETRY):
+        NOTIFICATION_FAILURES.labels(str(state == states.FAILURE).lower()).inc()
+
+
+app.steps["worker"].add(MetricsExporter)
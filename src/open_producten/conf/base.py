@@ -12,6 +12,7 @@ LANGUAGE_CODE = "nl-nl"
 TIME_ZONE = "Europe/Amsterdam"  # note: this *may* affect the output of DRF datetimes
 
 INSTALLED_APPS += [
+    "django.contrib.postgres",
     # 'django.contrib.admindocs',
     # 'django.contrib.humanize',
     # 'django.contrib.sitemaps',
@@ -46,6 +47,13 @@ MIDDLEWARE.insert(
     MIDDLEWARE.index("django.middleware.common.CommonMiddleware"),
     "django.middleware.locale.LocaleMiddleware",
 )
+MIDDLEWARE.append("open_producten.logging.middleware.AuditLogBufferMiddleware")
+MIDDLEWARE.insert(0, "open_producten.utils.middleware.RequestInstrumentationMiddleware")
+MIDDLEWARE.insert(0, "open_producten.utils.middleware.PrometheusMetricsMiddleware")
+MIDDLEWARE.insert(
+    MIDDLEWARE.index("django.contrib.auth.middleware.AuthenticationMiddleware") + 1,
+    "open_producten.utils.middleware.RequestProfilingMiddleware",
+)
 
 #
 # CELERY
@@ -61,6 +69,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "open_producten.producten.tasks.set_product_states",
         "schedule": crontab(minute="0", hour="0"),
     },
+    "Synchronise json indexes": {
+        "task": "open_producten.producten.tasks.synchronise_json_indexes",
+        "schedule": crontab(minute="0", hour="2"),
+    },
     "Prune timeline logs": {
         "task": "open_producten.logging.tasks.prune_logs",
         "schedule": crontab(minute="0", hour="0", day_of_month="1"),
@@ -85,6 +97,146 @@ LOGIN_URLS = [reverse_lazy("admin:login")]
 # Default (connection timeout, read timeout) for the requests library (in seconds)
 REQUESTS_DEFAULT_TIMEOUT = (10, 30)
 
+# Maximum amount of compiled json schema validators that are kept in memory per process.
+JSON_SCHEMA_VALIDATOR_CACHE_SIZE = config(
+    "JSON_SCHEMA_VALIDATOR_CACHE_SIZE",
+    128,
+    help_text="Maximum number of compiled json schema validators kept in memory per process.",
+)
+
+# Responses of the producttypen, thema and content endpoints are cached in the "api"
+# cache, see open_producten.utils.cache.
+API_RESPONSE_CACHE_TIMEOUT = config(
+    "API_RESPONSE_CACHE_TIMEOUT",
+    300,
+    help_text=(
+        "Number of seconds the responses of the producttypen, thema and content "
+        "endpoints are cached. Changes invalidate the cached responses directly. "
+        "Set to 0 to disable the response cache."
+    ),
+)
+CACHES["api"] = {
+    "BACKEND": "django_redis.cache.RedisCache",
+    "LOCATION": f"redis://{CACHE_DEFAULT}",
+    "KEY_PREFIX": "api",
+    "OPTIONS": {
+        "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        "IGNORE_EXCEPTIONS": True,
+    },
+}
+
+# How audit log entries are written, see open_producten.logging.buffer.
+AUDIT_LOG_MODE = config(
+    "AUDIT_LOG_MODE",
+    "sync",
+    help_text=(
+        "How audit log entries are written. ``sync`` saves every entry directly, "
+        "``buffered`` writes the entries of a request at once after the transaction "
+        "commits and ``celery`` hands them to a Celery task that writes them."
+    ),
+)
+
+# Key of the keyed hash of the bsn of eigenaren, see Eigenaar.bsn_hash.
+EIGENAAR_BSN_HASH_KEY = config(
+    "EIGENAAR_BSN_HASH_KEY",
+    "",
+    help_text=(
+        "Secret key of the keyed hash (HMAC-SHA256) of the BSN of product owners. "
+        "When set, the hash is stored with every owner and the BSN filters look up "
+        "owners by the hash. Owners without a hash are found by their BSN until the "
+        "update_eigenaar_bsn_hashes command has run, run it after setting or "
+        "changing the key."
+    ),
+)
+
+# Query counts and timings per request, see open_producten.utils.middleware.
+REQUEST_INSTRUMENTATION = config(
+    "REQUEST_INSTRUMENTATION",
+    False,
+    help_text=(
+        "Count the queries and measure the database, serializer and total time of "
+        "every request. The numbers are logged and returned to staff users in a "
+        "``Server-Timing`` header."
+    ),
+)
+SLOW_REQUEST_THRESHOLD = config(
+    "SLOW_REQUEST_THRESHOLD",
+    1000,
+    help_text=(
+        "Number of milliseconds after which a request is written to the slow request "
+        "log, with the SQL statements that were executed more than once. Requires "
+        "``REQUEST_INSTRUMENTATION``."
+    ),
+)
+SLOW_REQUEST_QUERY_THRESHOLD = config(
+    "SLOW_REQUEST_QUERY_THRESHOLD",
+    100,
+    help_text=(
+        "Number of queries after which a request is written to the slow request log. "
+        "Requires ``REQUEST_INSTRUMENTATION``."
+    ),
+)
+LOGGING["handlers"]["slow_requests"] = {
+    "level": "INFO",
+    "class": "logging.handlers.RotatingFileHandler",
+    "filename": Path(LOGGING_DIR) / "slow_requests.log",
+    "formatter": "timestamped",
+    "maxBytes": 1024 * 1024 * 10,  # 10 MB
+    "backupCount": 10,
+}
+LOGGING["loggers"]["open_producten.utils.middleware.slow_requests"] = {
+    "handlers": ["console"] if LOG_STDOUT else ["slow_requests"],
+    "level": "INFO",
+    "propagate": False,
+}
+
+# Prometheus metrics, see open_producten.utils.metrics.
+PROMETHEUS_METRICS = config(
+    "PROMETHEUS_METRICS",
+    False,
+    help_text=(
+        "Publish Prometheus metrics of the requests, caches, audit logs and "
+        "notifications on ``/metrics``. Set ``PROMETHEUS_MULTIPROC_DIR`` to an empty "
+        "directory when running multiple processes."
+    ),
+)
+CELERY_WORKER_METRICS_PORT = config(
+    "CELERY_WORKER_METRICS_PORT",
+    0,
+    help_text=(
+        "Port on which a Celery worker publishes the Prometheus metrics of its tasks. "
+        "0 disables the exporter."
+    ),
+)
+
+# Profiles of single requests on demand, see open_producten.utils.middleware.
+REQUEST_PROFILING = config(
+    "REQUEST_PROFILING",
+    False,
+    help_text=(
+        "Allow staff users to profile a request with the ``X-Profiel`` header or the "
+        "``profiel`` query parameter. The profile is returned instead of the response "
+        "or stored in the admin."
+    ),
+)
+
+# The UPL csv that is synchronised by the 'Synchronise UPL' task.
+UPL_URL = config(
+    "UPL_URL",
+    "",
+    help_text=(
+        "URL of the UPL csv that is synchronised daily, e.g. "
+        "https://standaarden.overheid.nl/owms/oquery/UPL-actueel.csv. The file is "
+        "only downloaded and loaded when it changed, UPN's that are no longer in the "
+        "file are marked as removed. The synchronisation is disabled when empty."
+    ),
+)
+if UPL_URL:
+    CELERY_BEAT_SCHEDULE["Synchronise UPL"] = {
+        "task": "open_producten.producttypen.tasks.synchronise_upl",
+        "schedule": crontab(minute="0", hour="1"),
+    }
+
 ##############################
 #                            #
 # 3RD PARTY LIBRARY SETTINGS #
@@ -67,6 +67,7 @@ SESSION_ENGINE = "django.contrib.sessions.backends.db"
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "axes": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    "api": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
 }
 
 #
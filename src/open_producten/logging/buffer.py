@@ -0,0 +1,128 @@
+"""
+Buffered writing of audit log entries.
+
+Depending on the ``AUDIT_LOG_MODE`` setting, audit log entries are either saved
+directly (``sync``), or collected and written with a single ``bulk_create`` after the
+transaction commits (``buffered``), optionally in a Celery task (``celery``).
+
+Entries are only collected when the transaction they were recorded in commits, so the
+entries of rolled back changes are discarded together with those changes. Within a
+buffer the entries are written in the order they were recorded.
+"""
+
+import json
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from open_producten.utils.metrics import AUDIT_LOG_WRITE_DURATION
+
+from .constants import AuditLogModes, Events
+from .models import TimelineLogProxy
+
+__all__ = [
+    "buffered_audit_logs",
+    "record_audit_logs",
+    "flush_audit_logs",
+]
+
+logger = logging.getLogger(__name__)
+
+_buffer: ContextVar[list[TimelineLogProxy] | None] = ContextVar(
+    "audit_log_buffer", default=None
+)
+
+
+def get_audit_log_mode() -> AuditLogModes:
+    return AuditLogModes(settings.AUDIT_LOG_MODE)
+
+
+def bulk_create_audit_logs(logs: list[TimelineLogProxy]) -> None:
+    with AUDIT_LOG_WRITE_DURATION.labels(settings.AUDIT_LOG_MODE).time():
+        for log in logs:
+            log.prepare()
+        TimelineLogProxy.objects.bulk_create(logs)
+
+
+def serialize_audit_log(log: TimelineLogProxy) -> dict:
+    return {
+        "content_type_id": log.content_type_id,
+        "object_id": log.object_id,
+        "user_id": log.user_id,
+        "timestamp": log.timestamp.isoformat(),
+        # the JSON field encodes decimals, dates and uuids as strings as well
+        "extra_data": json.loads(json.dumps(log.extra_data, cls=DjangoJSONEncoder)),
+    }
+
+
+def record_audit_logs(logs: list[TimelineLogProxy]) -> None:
+    mode = get_audit_log_mode()
+    if mode == AuditLogModes.sync:
+        bulk_create_audit_logs(logs)
+        return
+
+    for log in logs:
+        log.timestamp = timezone.now()
+        assert log.extra_data is not None
+        # use the instance that is already loaded, the Celery task would otherwise
+        # fetch every object again to get its representation
+        log._cache_object_repr()
+        # the object no longer exists by the time the entry is written, don't keep
+        # the (unsaved) instance
+        if log.extra_data["event"] == Events.delete:
+            TimelineLogProxy.content_object.delete_cached_value(log)
+
+    buffer = _buffer.get()
+    if buffer is None:
+        transaction.on_commit(partial(flush_audit_logs, logs))
+    else:
+        transaction.on_commit(partial(buffer.extend, logs))
+
+
+def flush_audit_logs(logs: list[TimelineLogProxy]) -> None:
+    if not logs:
+        return
+
+    if get_audit_log_mode() == AuditLogModes.celery:
+        from .tasks import write_audit_logs
+
+        try:
+            write_audit_logs.delay([serialize_audit_log(log) for log in logs])
+            return
+        except Exception:
+            # don't lose the entries if the broker is unavailable
+            logger.exception(
+                "Could not schedule the writing of %d audit log entries, "
+                "writing them directly",
+                len(logs),
+            )
+
+    bulk_create_audit_logs(logs)
+
+
+@contextmanager
+def buffered_audit_logs():
+    """
+    Collect the audit log entries recorded in the block and write them at once.
+
+    The entries are written when the block exits, or when the transaction that is
+    active at that moment commits. Nested blocks are written by the outermost block.
+    """
+    if get_audit_log_mode() == AuditLogModes.sync or _buffer.get() is not None:
+        yield
+        return
+
+    buffer: list[TimelineLogProxy] = []
+    token = _buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+        # registered after the callbacks that collect the entries
+        transaction.on_commit(partial(flush_audit_logs, buffer))
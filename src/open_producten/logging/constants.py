@@ -10,3 +10,9 @@ class Events(models.TextChoices):
     delete = "delete", _("Record deleted")
     # Specific events
     download = "download", _("Downloaded")
+
+
+class AuditLogModes(models.TextChoices):
+    sync = "sync", _("Written directly")
+    buffered = "buffered", _("Buffered and written after the transaction commits")
+    celery = "celery", _("Buffered and written by a Celery task")
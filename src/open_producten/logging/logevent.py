@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import assert_never
+from typing import Iterable, assert_never
 
 from django.db import models
 
 from open_producten.accounts.models import User
 
+from .buffer import record_audit_logs
 from .constants import Events
 from .models import TimelineLogProxy
 from .typing import JSONObject, MetadataDict
@@ -22,10 +23,15 @@ __all__ = [
     "audit_api_update",
     "audit_api_delete",
     "audit_api_download",
+    "audit_api_create_bulk",
+    "audit_api_update_bulk",
+    # automation
+    "audit_automation_update",
+    "audit_automation_update_bulk",
 ]
 
 
-def _audit_event(
+def _build_audit_log(
     *,
     content_object: models.Model,
     event: Events,
@@ -33,7 +39,7 @@ def _audit_event(
     user_display: str = "",
     django_user: User | None = None,
     **kwargs,
-) -> None:
+) -> TimelineLogProxy:
     if django_user is None and not (user_id and user_display):
         raise ValueError(
             "Provide either a Django user, or non-empty 'user_id' and 'user_display' "
@@ -64,7 +70,7 @@ def _audit_event(
         },
     }
 
-    TimelineLogProxy.objects.create(
+    return TimelineLogProxy(
         content_object=content_object,
         extra_data={
             **metadata,
@@ -74,6 +80,43 @@ def _audit_event(
     )
 
 
+def _audit_event(**kwargs) -> None:
+    record_audit_logs([_build_audit_log(**kwargs)])
+
+
+def _bulk_audit_event(*, content_objects: Iterable[models.Model], **kwargs) -> None:
+    record_audit_logs(
+        [
+            _build_audit_log(content_object=content_object, **kwargs)
+            for content_object in content_objects
+        ]
+    )
+
+
+def _bulk_audit_api_event(
+    *,
+    event: Events,
+    objects: Iterable[tuple[models.Model, JSONObject]],
+    user_id: str,
+    user_display: str,
+    remarks: str,
+) -> None:
+    record_audit_logs(
+        [
+            _build_audit_log(
+                content_object=content_object,
+                event=event,
+                user_id=user_id,
+                user_display=user_display,
+                django_user=None,
+                object_data=object_data,
+                remarks=remarks,
+            )
+            for content_object, object_data in objects
+        ]
+    )
+
+
 # Admin tooling:
 
 
@@ -225,6 +268,51 @@ def audit_api_download(
     )
 
 
+def audit_api_create_bulk(
+    *,
+    objects: Iterable[tuple[models.Model, JSONObject]],
+    user_id: str,
+    user_display: str,
+    remarks: str,
+) -> None:
+    """
+    Audit the creation of multiple objects with a single query.
+
+    ``objects`` contains ``(content_object, object_data)`` pairs.
+    """
+    _bulk_audit_api_event(
+        event=Events.create,
+        objects=objects,
+        user_id=user_id,
+        user_display=user_display,
+        remarks=remarks,
+    )
+
+
+def audit_api_update_bulk(
+    *,
+    objects: Iterable[tuple[models.Model, JSONObject]],
+    user_id: str,
+    user_display: str,
+    remarks: str,
+) -> None:
+    """
+    Audit the update of multiple objects with a single query.
+
+    ``objects`` contains ``(content_object, object_data)`` pairs.
+    """
+    _bulk_audit_api_event(
+        event=Events.update,
+        objects=objects,
+        user_id=user_id,
+        user_display=user_display,
+        remarks=remarks,
+    )
+
+
+# Automation:
+
+
 def audit_automation_update(
     content_object: models.Model,
     remarks: str,
@@ -237,3 +325,17 @@ def audit_automation_update(
         django_user=None,
         remarks=remarks,
     )
+
+
+def audit_automation_update_bulk(
+    content_objects: Iterable[models.Model],
+    remarks: str,
+) -> None:
+    _bulk_audit_event(
+        content_objects=content_objects,
+        event=Events.update,
+        user_id="-",
+        user_display="Automation",
+        django_user=None,
+        remarks=remarks,
+    )
@@ -0,0 +1,14 @@
+from .buffer import buffered_audit_logs
+
+
+class AuditLogBufferMiddleware:
+    """
+    Write the audit log entries of a request at once, see ``AUDIT_LOG_MODE``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered_audit_logs():
+            return self.get_response(request)
@@ -28,6 +28,16 @@ class TimelineLogProxy(TimelineLog):
         verbose_name_plural = _("(audit) log entries")
 
     def save(self, *args, **kwargs):
+        self.prepare()
+        super().save(*args, **kwargs)
+
+    def prepare(self) -> None:
+        """
+        Validate the metadata and fill in the derived fields.
+
+        Called on save, and explicitly for log entries that are written with
+        ``bulk_create``, which bypasses ``save``.
+        """
         # there's a setting for this, but then makemigrations produces a new migration
         # in the third party package which is less than ideal...
         if self.template == "timeline_logger/default.txt":
@@ -44,14 +54,15 @@ class TimelineLogProxy(TimelineLog):
         self._validate_user_details()
         self._cache_object_repr()
 
-        super().save(*args, **kwargs)
-
     def _cache_object_repr(self) -> None:
         # cache the object representation so we can avoid querying the content_object
         # in the admin list page, which does wonders for performance
         assert self.extra_data is not None
         if not self.object_id or not self.content_type_id:
             return
+        # already cached for entries that are written after the object is deleted
+        if "_cached_object_repr" in self.extra_data:
+            return
         self.extra_data["_cached_object_repr"] = str(self.content_object)
 
     def _validate_event(self):
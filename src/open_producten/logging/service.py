@@ -13,11 +13,14 @@ from .logevent import (
     audit_admin_read,
     audit_admin_update,
     audit_api_create,
+    audit_api_create_bulk,
     audit_api_delete,
     audit_api_download,
     audit_api_read,
     audit_api_update,
+    audit_api_update_bulk,
     audit_automation_update,
+    audit_automation_update_bulk,
 )
 from .mixins import ModelOwnerMixin
 
@@ -45,8 +48,11 @@ __all__ = [
     "audit_api_update",
     "audit_api_delete",
     "audit_api_download",
+    "audit_api_create_bulk",
+    "audit_api_update_bulk",
     # * automation
     "audit_automation_update",
+    "audit_automation_update_bulk",
     # Model
     "ModelOwnerMixin",
 ]
@@ -1,8 +1,39 @@
 from django.core.management import call_command
+from django.db import InterfaceError, OperationalError, transaction
+from django.utils.dateparse import parse_datetime
 
 from open_producten.celery import app
 
+from .buffer import bulk_create_audit_logs
+from .models import TimelineLogProxy
+
 
 @app.task
 def prune_logs(keep_days):
     call_command("prune_timeline_logs", keep_days=keep_days)
+
+
+@app.task(
+    acks_late=True,
+    autoretry_for=(InterfaceError, OperationalError),
+    retry_backoff=True,
+    max_retries=None,
+)
+def write_audit_logs(entries: list[dict]):
+    logs = [
+        TimelineLogProxy(
+            content_type_id=entry["content_type_id"],
+            object_id=entry["object_id"],
+            user_id=entry["user_id"],
+            extra_data=entry["extra_data"],
+        )
+        for entry in entries
+    ]
+    # the timestamp is set on insert (auto_now_add), restore the moment the events
+    # happened in the same transaction, so a retry does not insert the entries twice
+    with transaction.atomic():
+        bulk_create_audit_logs(logs)
+
+        for log, entry in zip(logs, entries):
+            log.timestamp = parse_datetime(entry["timestamp"])
+        TimelineLogProxy.objects.bulk_update(logs, ["timestamp"])
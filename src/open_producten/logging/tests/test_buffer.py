@@ -0,0 +1,213 @@
+import datetime
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from freezegun import freeze_time
+from kombu.exceptions import OperationalError
+from prometheus_client import REGISTRY
+
+from open_producten.producten.tests.factories import ProductFactory
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+from ..buffer import buffered_audit_logs
+from ..constants import Events
+from ..logevent import audit_automation_update, audit_automation_update_bulk
+from ..models import TimelineLogProxy
+from ..tasks import write_audit_logs
+
+
+@override_settings(AUDIT_LOG_MODE="sync")
+class SyncModeTests(TestCase):
+
+    def test_written_directly(self):
+        product = ProductFactory.create()
+
+        with buffered_audit_logs():
+            audit_automation_update(product, "a")
+            self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_write_duration_is_measured(self):
+        product = ProductFactory.create()
+        labels = {"mode": "sync"}
+        count = REGISTRY.get_sample_value(
+            "open_producten_audit_log_write_duration_seconds_count", labels
+        )
+
+        audit_automation_update(product, "a")
+
+        self.assertEqual(
+            REGISTRY.get_sample_value(
+                "open_producten_audit_log_write_duration_seconds_count", labels
+            ),
+            (count or 0) + 1,
+        )
+
+
+@override_settings(AUDIT_LOG_MODE="buffered")
+class BufferedModeTests(TestCase):
+
+    def test_written_at_once_in_order(self):
+        products = ProductFactory.create_batch(3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_logs():
+                audit_automation_update(products[0], "a")
+                audit_automation_update_bulk(products[1:], "b")
+                self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(
+            list(
+                TimelineLogProxy.objects.order_by("pk").values_list(
+                    "object_id", "extra_data__remarks"
+                )
+            ),
+            [
+                (str(products[0].pk), "a"),
+                (str(products[1].pk), "b"),
+                (str(products[2].pk), "b"),
+            ],
+        )
+
+    def test_single_insert(self):
+        products = ProductFactory.create_batch(3)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with buffered_audit_logs():
+                for product in products:
+                    audit_automation_update(product, "a")
+
+        for callback in callbacks[:-1]:
+            callback()
+        with self.assertNumQueries(1):
+            callbacks[-1]()
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 3)
+
+    def test_rolled_back_entries_are_discarded(self):
+        product = ProductFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_logs():
+                audit_automation_update(product, "kept")
+                try:
+                    with transaction.atomic():
+                        audit_automation_update(product, "rolled back")
+                        raise ValueError
+                except ValueError:
+                    pass
+
+        self.assertEqual(
+            list(
+                TimelineLogProxy.objects.values_list("extra_data__remarks", flat=True)
+            ),
+            ["kept"],
+        )
+
+    def test_written_on_commit_without_buffer(self):
+        product = ProductFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            audit_automation_update(product, "a")
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+
+@override_settings(AUDIT_LOG_MODE="buffered", NOTIFICATIONS_DISABLED=True)
+class BufferedRequestTests(BaseApiTestCase):
+
+    def test_request_entries(self):
+        product = ProductFactory.create()
+        path = reverse("product-detail", args=[product.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(path)
+            self.client.delete(path)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual([log.event for log in logs], [Events.read, Events.delete])
+        self.assertEqual(
+            logs[1].get_related_object_repr(), f"{product.product_type.naam} instantie."
+        )
+
+
+@freeze_time("2024-01-01T12:00:00Z")
+@override_settings(AUDIT_LOG_MODE="celery")
+class CeleryModeTests(TestCase):
+
+    @patch("open_producten.logging.tasks.write_audit_logs.delay")
+    def test_task_writes_entries(self, mock_delay):
+        products = ProductFactory.create_batch(2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_logs():
+                audit_automation_update_bulk(products, "a")
+
+        mock_delay.assert_called_once()
+        self.assertFalse(TimelineLogProxy.objects.exists())
+
+        with freeze_time("2024-01-01T12:05:00Z"):
+            write_audit_logs(*mock_delay.call_args.args)
+
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual([log.content_object for log in logs], products)
+        self.assertEqual(
+            logs[0].timestamp,
+            datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(
+            logs[0].extra_data["_cached_object_repr"],
+            f"{products[0].product_type.naam} instantie.",
+        )
+
+    @patch("open_producten.logging.tasks.write_audit_logs.delay")
+    def test_task_queries_do_not_grow_with_entries(self, mock_delay):
+        for count in (2, 20):
+            products = ProductFactory.create_batch(count)
+            mock_delay.reset_mock()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                with buffered_audit_logs():
+                    audit_automation_update_bulk(products, "a")
+
+            # savepoint, insert, update, release savepoint
+            with self.assertNumQueries(4):
+                write_audit_logs(*mock_delay.call_args.args)
+
+    @patch("open_producten.logging.tasks.write_audit_logs.delay")
+    def test_task_writes_nothing_on_error(self, mock_delay):
+        product = ProductFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            audit_automation_update(product, "a")
+
+        with (
+            patch.object(
+                TimelineLogProxy.objects, "bulk_update", side_effect=OperationalError
+            ),
+            self.assertRaises(OperationalError),
+        ):
+            write_audit_logs(*mock_delay.call_args.args)
+
+        # the retry writes the entries once
+        self.assertFalse(TimelineLogProxy.objects.exists())
+
+    @patch(
+        "open_producten.logging.tasks.write_audit_logs.delay",
+        side_effect=OperationalError,
+    )
+    def test_written_directly_if_task_cannot_be_scheduled(self, mock_delay):
+        product = ProductFactory.create()
+
+        with (
+            self.assertLogs("open_producten.logging.buffer", "ERROR"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            audit_automation_update(product, "a")
+
+        mock_delay.assert_called_once()
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
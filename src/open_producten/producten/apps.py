@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ProductenConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "open_producten.producten"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        connect_signals()
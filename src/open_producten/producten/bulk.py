@@ -0,0 +1,241 @@
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from open_producten.logging.service import audit_automation_update_bulk
+from open_producten.producten.models import Eigenaar, Product
+from open_producten.producten.models.product import ACTIEF_REMARK, VERLOPEN_REMARK
+from open_producten.producten.serializers.product import BulkProductSerializer
+from open_producten.producttypen.models import ProductType
+from open_producten.producttypen.models.producttype import ProductStateChoices
+
+MAX_BULK_SIZE = 1000
+
+EIGENAAR_FIELDS = ("bsn", "bsn_hash", "kvk_nummer", "vestigingsnummer", "klantnummer")
+
+
+class BulkResultaat(models.TextChoices):
+    AANGEMAAKT = "aangemaakt", _("Aangemaakt")
+    BIJGEWERKT = "bijgewerkt", _("Bijgewerkt")
+    FOUT = "fout", _("Fout")
+
+
+class BulkConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = _(
+        "De producten zijn gelijktijdig door een ander verzoek opgeslagen, probeer het opnieuw."
+    )
+    default_code = "conflict"
+
+
+@dataclass
+class BulkItem:
+    index: int
+    serializer: BulkProductSerializer | None = None
+    fouten: dict = field(default_factory=dict)
+    product: Product | None = None
+
+    @property
+    def resultaat(self) -> str:
+        if self.fouten:
+            return BulkResultaat.FOUT
+        if self.serializer.instance is not None:
+            return BulkResultaat.BIJGEWERKT
+        return BulkResultaat.AANGEMAAKT
+
+
+def _parse_uuid(value) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+class ProductBulkImport:
+    """
+    Validate and save a batch of products with a fixed number of queries.
+
+    The product typen (with their json schemas) and the existing products for the
+    ``externe_referentie`` values, with their eigenaren, are loaded once for the whole
+    batch. Products and eigenaren are written with ``bulk_create``/``bulk_update``.
+    Only a product that refers to eigenaren of other products costs an extra query,
+    to report whether they exist.
+
+    The uniqueness of the ``externe_referentie`` values is checked in ``validate``, a
+    concurrent request can still create the same products before ``save``, which
+    then raises an ``IntegrityError``.
+    """
+
+    def __init__(self, data: list, context: dict, upsert: bool = False):
+        self.data = data
+        self.context = context
+        self.upsert = upsert
+        self.items = [BulkItem(index=index) for index in range(len(data))]
+
+    def _load_product_typen(self) -> dict:
+        ids = {
+            _parse_uuid(item.get("product_type_id"))
+            for item in self.data
+            if isinstance(item, dict)
+        }
+        return ProductType.objects.select_related(
+            "uniforme_product_naam", "verbruiksobject_schema", "dataobject_schema"
+        ).in_bulk(ids - {None})
+
+    def _load_existing_products(self) -> dict:
+        referenties = {
+            item.get("externe_referentie")
+            for item in self.data
+            if isinstance(item, dict)
+        }
+        return (
+            Product.objects.select_related("product_type__uniforme_product_naam")
+            .prefetch_related("eigenaren")
+            .in_bulk(referenties - {None, ""}, field_name="externe_referentie")
+        )
+
+    def validate(self) -> None:
+        self.items = [BulkItem(index=index) for index in range(len(self.data))]
+        context = self.context | {"product_typen": self._load_product_typen()}
+        existing = self._load_existing_products()
+        seen_referenties = set()
+
+        for item, data in zip(self.items, self.data):
+            referentie = (
+                data.get("externe_referentie") if isinstance(data, dict) else None
+            )
+            instance = None
+
+            if referentie:
+                if referentie in seen_referenties:
+                    item.fouten = {
+                        "externe_referentie": [
+                            _("Deze externe referentie komt meerdere keren voor.")
+                        ]
+                    }
+                    continue
+                seen_referenties.add(referentie)
+
+                if referentie in existing:
+                    if not self.upsert:
+                        item.fouten = {
+                            "externe_referentie": [
+                                _(
+                                    "Er bestaat al een product met deze externe referentie."
+                                )
+                            ]
+                        }
+                        continue
+                    instance = existing[referentie]
+
+            item.serializer = BulkProductSerializer(
+                instance=instance, data=data, context=context
+            )
+            if not item.serializer.is_valid():
+                item.fouten = item.serializer.errors
+
+    @property
+    def valid_items(self) -> list[BulkItem]:
+        return [item for item in self.items if not item.fouten]
+
+    @transaction.atomic()
+    def save(self) -> None:
+        now = timezone.now()
+        created, updated = [], []
+        automation_logs = defaultdict(list)
+        eigenaren_per_product = {}
+
+        for item in self.valid_items:
+            validated_data = dict(item.serializer.validated_data)
+            eigenaren = validated_data.pop("eigenaren", None)
+
+            product = item.serializer.instance or Product()
+            for attr, value in validated_data.items():
+                setattr(product, attr, value)
+
+            # Product.save is bypassed by bulk_create/bulk_update
+            if product.should_be_activated():
+                product.status = ProductStateChoices.ACTIEF
+                automation_logs[ACTIEF_REMARK].append(product)
+            if product.should_expire():
+                product.status = ProductStateChoices.VERLOPEN
+                automation_logs[VERLOPEN_REMARK].append(product)
+
+            if item.serializer.instance is None:
+                created.append(product)
+            else:
+                product.update_datum = now
+                updated.append(product)
+
+            if eigenaren is not None:
+                eigenaren_per_product[product] = eigenaren
+            item.product = product
+
+        self._created = set(created)
+        Product.objects.bulk_create(created)
+        if updated:
+            Product.objects.bulk_update(
+                updated,
+                [
+                    f.name
+                    for f in Product._meta.concrete_fields
+                    if not f.primary_key and f.name != "aanmaak_datum"
+                ],
+            )
+
+        self._save_eigenaren(eigenaren_per_product)
+        # the eigenaren were prefetched for the validation and have changed
+        for product in updated:
+            getattr(product, "_prefetched_objects_cache", {}).pop("eigenaren", None)
+
+        for remark, products in automation_logs.items():
+            audit_automation_update_bulk(products, remark)
+
+    def _save_eigenaren(self, eigenaren_per_product: dict) -> None:
+        existing = Eigenaar.objects.in_bulk(
+            [
+                eigenaar["id"]
+                for product, eigenaren in eigenaren_per_product.items()
+                if product not in self._created
+                for eigenaar in eigenaren
+                if eigenaar.get("id")
+            ]
+        )
+        to_create, to_update = [], []
+
+        for product, eigenaren in eigenaren_per_product.items():
+            for data in eigenaren:
+                data = dict(data)
+                # like ProductSerializer.create, ids are ignored for new products
+                eigenaar_id = data.pop("id", None)
+                if product in self._created or eigenaar_id not in existing:
+                    to_create.append(Eigenaar(product=product, **data))
+                else:
+                    eigenaar = existing[eigenaar_id]
+                    for attr, value in data.items():
+                        setattr(eigenaar, attr, value)
+                    to_update.append(eigenaar)
+
+        # eigenaren that are no longer given for an updated product are removed, like
+        # in ProductSerializer.update
+        Eigenaar.objects.filter(
+            product__in=[
+                product
+                for product in eigenaren_per_product
+                if product not in self._created
+            ]
+        ).exclude(id__in=[eigenaar.id for eigenaar in to_update]).delete()
+
+        # Eigenaar.save is bypassed by bulk_create/bulk_update
+        for eigenaar in (*to_create, *to_update):
+            eigenaar.set_bsn_hash()
+
+        Eigenaar.objects.bulk_create(to_create)
+        Eigenaar.objects.bulk_update(to_update, EIGENAAR_FIELDS)
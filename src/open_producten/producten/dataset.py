@@ -0,0 +1,465 @@
+"""
+A reproducible, seeded dataset of product typen and producten for benchmarks and load
+tests.
+
+The catalogue (product typen with their translations, prijzen, content and thema
+trees) is built with the factories of the tests and written with large
+``bulk_create`` batches. Building millions of objects with the factories would take
+hours, so the producten and eigenaren are generated as rows and loaded with ``COPY``.
+The same seed and sizes always give the same data, including the ids.
+"""
+
+import csv
+import io
+import json
+import random
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.db import connection, models, transaction
+from django.db.models import Q
+
+import factory
+import factory.random
+
+from open_producten.producttypen.models import (
+    ContentElement,
+    ContentLabel,
+    JsonSchema,
+    Prijs,
+    PrijsOptie,
+    ProductType,
+    Thema,
+    UniformeProductNaam,
+)
+from open_producten.producttypen.models.producttype import ProductStateChoices
+from open_producten.producttypen.models.upn import get_upn_hash
+from open_producten.producttypen.search import update_zoek_vectors
+from open_producten.producttypen.tests.factories import (
+    ContentElementFactory,
+    ContentLabelFactory,
+    PrijsFactory,
+    PrijsOptieFactory,
+    ProductTypeFactory,
+    ThemaFactory,
+    UniformeProductNaamFactory,
+    fake,
+)
+from open_producten.utils.cache import response_cache
+
+from .json_indexes import sync_json_indexes
+from .models import Eigenaar, Product
+from .models.eigenaar import get_bsn_hash
+from .models.product import PrijsFrequentieChoices
+
+DEFAULT_PRODUCT_TYPEN = 5_000
+DEFAULT_PRODUCTEN = 5_000_000
+
+BATCH_SIZE = 5_000
+COPY_BATCH_SIZE = 100_000
+
+TALEN = ("nl", "en")
+KEYWORDS_AANTAL = 200
+LABELS_AANTAL = 10
+CONTENT_PER_PRODUCT_TYPE = 3
+SUB_THEMAS = (4, 3)  # the amount of sub thema's per level of a thema tree
+PRODUCTEN_PER_EIGENAAR = 3
+FREQUENTIES = PrijsFrequentieChoices.values
+
+# the first product was created on this date, the others in the following two years
+BEGIN_DATUM = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+DATAOBJECT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "kenteken": {"type": "string"},
+        "persoon": {
+            "type": "object",
+            "properties": {"leeftijd": {"type": "integer"}},
+        },
+    },
+}
+VERBRUIKSOBJECT_SCHEMA = {
+    "type": "object",
+    "properties": {"uren": {"type": "integer"}},
+}
+
+
+class DatasetProductTypeFactory(ProductTypeFactory):
+    # the post generation hooks of ProductTypeFactory save the product type, the
+    # translations are written in bulk instead
+    naam = factory.Faker("catch_phrase")
+    samenvatting = factory.Faker("paragraph")
+
+
+class DatasetContentElementFactory(ContentElementFactory):
+    content = factory.Faker("paragraph")
+
+
+def get_bsn(nummer: int) -> str:
+    """
+    Return a valid bsn for every (small) number, different numbers give different
+    bsns.
+    """
+    for basis in (10_000_010 + nummer * 2, 10_000_010 + nummer * 2 + 1):
+        total = sum(int(num) * (9 - i) for i, num in enumerate(str(basis)))
+        # the last digit counts -1 in the 11 check
+        if total % 11 < 10:
+            return f"{basis}{total % 11}"
+    raise AssertionError("an odd basis always has a valid check digit")
+
+
+def copy_rows(model: type[models.Model], fields: list[str], rows: Iterable) -> None:
+    """
+    Load the rows, tuples with the values of the fields, with a single ``COPY``.
+    """
+    model_fields = [model._meta.get_field(name) for name in fields]
+    columns = ", ".join(connection.ops.quote_name(f.column) for f in model_fields)
+    not_null = ", ".join(
+        connection.ops.quote_name(f.column) for f in model_fields if not f.null
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(
+            json.dumps(value) if isinstance(value, dict) else value for value in row
+        )
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        # empty unquoted values are NULL, unless the column is not nullable
+        cursor.copy_expert(
+            f"COPY {model._meta.db_table} ({columns}) FROM STDIN "
+            f"WITH (FORMAT csv, FORCE_NOT_NULL ({not_null}))",
+            buffer,
+        )
+
+
+class DatasetGenerator:
+    def __init__(
+        self,
+        seed: int = 0,
+        product_typen: int = DEFAULT_PRODUCT_TYPEN,
+        producten: int = DEFAULT_PRODUCTEN,
+        log: Callable[[str], None] = lambda message: None,
+    ):
+        self.seed = seed
+        self.product_typen_aantal = product_typen
+        self.producten_aantal = producten
+        self.log = log
+        self.prefix = f"dataset-{seed}"
+        self.random = random.Random(seed)
+
+    def exists(self) -> bool:
+        return ProductType.objects.filter(code__startswith=f"{self.prefix}-").exists()
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def generate(self) -> None:
+        factory.random.reseed_random(self.seed)
+
+        with transaction.atomic():
+            self.create_catalogue()
+            self.log(f"Created {self.product_typen_aantal} product typen.")
+
+        self.create_producten()
+        self.log(f"Created {self.producten_aantal} producten.")
+
+        update_zoek_vectors(Q(code__startswith=f"{self.prefix}-"))
+        sync_json_indexes()
+        response_cache.clear()
+
+        with connection.cursor() as cursor:
+            for model in (ProductType, Thema, Prijs, ContentElement, Product, Eigenaar):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def create_catalogue(self) -> None:
+        upns = [
+            UniformeProductNaamFactory.build(
+                id=self.uuid(),
+                naam=f"{self.prefix} upn {i}",
+                uri=f"https://example.com/{self.prefix}/upn/{i}",
+            )
+            for i in range(self.product_typen_aantal)
+        ]
+        for upn in upns:
+            upn.hash = get_upn_hash(upn.naam, upn.uri)
+        UniformeProductNaam.objects.bulk_create(upns, batch_size=BATCH_SIZE)
+
+        dataobject_schema, verbruiksobject_schema = JsonSchema.objects.bulk_create(
+            [
+                JsonSchema(
+                    naam=f"{self.prefix} dataobject",
+                    schema=DATAOBJECT_SCHEMA,
+                    index_paden=["kenteken"],
+                ),
+                JsonSchema(
+                    naam=f"{self.prefix} verbruiksobject",
+                    schema=VERBRUIKSOBJECT_SCHEMA,
+                    index_paden=["uren"],
+                ),
+            ]
+        )
+        keywords = [f"{fake.word()} {i}" for i in range(KEYWORDS_AANTAL)]
+
+        product_typen = []
+        translations = []
+        for i, upn in enumerate(upns):
+            # every fifth product type has json objects
+            schemas = (
+                {
+                    "dataobject_schema": dataobject_schema,
+                    "verbruiksobject_schema": verbruiksobject_schema,
+                }
+                if i % 5 == 0
+                else {}
+            )
+            product_type = DatasetProductTypeFactory.build(
+                id=self.uuid(),
+                code=f"{self.prefix}-{i}",
+                uniforme_product_naam=upn,
+                keywords=self.random.sample(keywords, self.random.randint(1, 3)),
+                toegestane_statussen=self.random.sample(
+                    ProductStateChoices.values[1:], self.random.randint(1, 3)
+                ),
+                **schemas,
+            )
+            product_typen.append(product_type)
+            for language_code in TALEN:
+                suffix = "" if language_code == "nl" else f" ({language_code})"
+                translations.append(
+                    ProductType._parler_meta.root_model(
+                        master=product_type,
+                        language_code=language_code,
+                        naam=f"{product_type.naam}{suffix}",
+                        samenvatting=f"{product_type.samenvatting}{suffix}",
+                    )
+                )
+
+        ProductType.objects.bulk_create(product_typen, batch_size=BATCH_SIZE)
+        ProductType._parler_meta.root_model.objects.bulk_create(
+            translations, batch_size=BATCH_SIZE
+        )
+        self.product_typen = product_typen
+
+        self.create_themas()
+        self.create_prijzen()
+        self.create_content()
+
+    def create_themas(self) -> None:
+        hoofd_themas = max(1, self.product_typen_aantal // 100)
+        niveau = [
+            ThemaFactory.build(
+                id=self.uuid(), naam=f"{self.prefix} thema {i}", hoofd_thema=None
+            )
+            for i in range(hoofd_themas)
+        ]
+        themas = list(niveau)
+        for aantal in SUB_THEMAS:
+            niveau = [
+                ThemaFactory.build(
+                    id=self.uuid(),
+                    naam=f"{hoofd_thema.naam}.{i}",
+                    hoofd_thema=hoofd_thema,
+                )
+                for hoofd_thema in niveau
+                for i in range(aantal)
+            ]
+            themas.extend(niveau)
+
+        Thema.objects.bulk_create(themas, batch_size=BATCH_SIZE)
+        ProductType.themas.through.objects.bulk_create(
+            (
+                ProductType.themas.through(producttype=product_type, thema=thema)
+                for product_type in self.product_typen
+                for thema in self.random.sample(themas, self.random.randint(1, 2))
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+    def create_prijzen(self) -> None:
+        prijzen = [
+            PrijsFactory.build(
+                id=self.uuid(),
+                product_type=product_type,
+                actief_vanaf=BEGIN_DATUM.date() + timedelta(days=365 * i),
+            )
+            for product_type in self.product_typen
+            for i in range(self.random.randint(1, 3))
+        ]
+        Prijs.objects.bulk_create(prijzen, batch_size=BATCH_SIZE)
+        PrijsOptie.objects.bulk_create(
+            (
+                PrijsOptieFactory.build(id=self.uuid(), prijs=prijs)
+                for prijs in prijzen
+                for _i in range(self.random.randint(1, 3))
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+    def create_content(self) -> None:
+        labels = ContentLabel.objects.bulk_create(
+            ContentLabelFactory.build(id=self.uuid(), naam=f"{self.prefix} label {i}")
+            for i in range(LABELS_AANTAL)
+        )
+
+        elementen = []
+        translations = []
+        for product_type in self.product_typen:
+            for order in range(CONTENT_PER_PRODUCT_TYPE):
+                element = DatasetContentElementFactory.build(
+                    id=self.uuid(), product_type=product_type, order=order
+                )
+                elementen.append(element)
+                translations.extend(
+                    ContentElement._parler_meta.root_model(
+                        master=element,
+                        language_code=language_code,
+                        content=element.content,
+                    )
+                    for language_code in TALEN
+                )
+
+        ContentElement.objects.bulk_create(elementen, batch_size=BATCH_SIZE)
+        ContentElement._parler_meta.root_model.objects.bulk_create(
+            translations, batch_size=BATCH_SIZE
+        )
+        ContentElement.labels.through.objects.bulk_create(
+            (
+                ContentElement.labels.through(
+                    contentelement=element, contentlabel=self.random.choice(labels)
+                )
+                for element in elementen
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+    def create_producten(self) -> None:
+        # a few product typen have most of the producten
+        product_typen = self.product_typen
+        weights = [1 / (i + 1) for i in range(len(product_typen))]
+        eigenaren_aantal = max(1, self.producten_aantal // PRODUCTEN_PER_EIGENAAR)
+
+        product_fields = [
+            "id",
+            "product_type",
+            "gepubliceerd",
+            "aanmaak_datum",
+            "update_datum",
+            "start_datum",
+            "eind_datum",
+            "status",
+            "prijs",
+            "frequentie",
+            "dataobject",
+            "verbruiksobject",
+            "externe_referentie",
+        ]
+        eigenaar_fields = [
+            "id",
+            "product",
+            "bsn",
+            "bsn_hash",
+            "kvk_nummer",
+            "vestigingsnummer",
+            "klantnummer",
+        ]
+        for start in range(0, self.producten_aantal, COPY_BATCH_SIZE):
+            aantal = min(COPY_BATCH_SIZE, self.producten_aantal - start)
+            producten = []
+            eigenaren = []
+
+            for i, product_type in enumerate(
+                self.random.choices(product_typen, weights, k=aantal), start
+            ):
+                product = self.product_row(i, product_type)
+                producten.append([product[name] for name in product_fields])
+
+                eigenaar_nummers = [self.random.randrange(eigenaren_aantal)]
+                if self.random.random() < 0.1:
+                    eigenaar_nummers.append(self.random.randrange(eigenaren_aantal))
+                for nummer in eigenaar_nummers:
+                    eigenaar = self.eigenaar_row(nummer)
+                    eigenaar.update(id=self.uuid(), product=product["id"])
+                    eigenaren.append([eigenaar[name] for name in eigenaar_fields])
+
+            with transaction.atomic():
+                copy_rows(Product, product_fields, producten)
+                copy_rows(Eigenaar, eigenaar_fields, eigenaren)
+            self.log(f"Created {start + aantal} producten.")
+
+    def product_row(self, i: int, product_type: ProductType) -> dict:
+        aanmaak_datum = BEGIN_DATUM + timedelta(
+            seconds=self.random.randrange(2 * 365 * 24 * 3600)
+        )
+        start_datum = (
+            aanmaak_datum.date() + timedelta(days=self.random.randrange(30))
+            if self.random.random() < 0.5
+            else None
+        )
+        eind_datum = (
+            start_datum + timedelta(days=self.random.randrange(30, 3 * 365))
+            if start_datum and self.random.random() < 0.5
+            else None
+        )
+        json_objects = (
+            {
+                "dataobject": {
+                    "kenteken": f"{self.random.randrange(100):02}-"
+                    f"{self.random.choice('ABCDEFGHJKLMNPRSTVXZ') * 3}-"
+                    f"{self.random.randrange(10)}",
+                    "persoon": {"leeftijd": self.random.randint(18, 90)},
+                },
+                "verbruiksobject": {"uren": self.random.randrange(200)},
+            }
+            if product_type.dataobject_schema_id
+            else {"dataobject": None, "verbruiksobject": None}
+        )
+
+        return {
+            "id": self.uuid(),
+            "product_type": product_type.pk,
+            "gepubliceerd": self.random.random() < 0.9,
+            "aanmaak_datum": aanmaak_datum,
+            "update_datum": aanmaak_datum
+            + timedelta(seconds=self.random.randrange(30 * 24 * 3600)),
+            "start_datum": start_datum,
+            "eind_datum": eind_datum,
+            "status": self.random.choice(
+                [ProductStateChoices.INITIEEL, *product_type.toegestane_statussen]
+            ),
+            "prijs": Decimal(self.random.randrange(100, 100_000)) / 100,
+            "frequentie": self.random.choice(FREQUENTIES),
+            "externe_referentie": (
+                f"{self.prefix}-{i}" if self.random.random() < 0.5 else None
+            ),
+            **json_objects,
+        }
+
+    def eigenaar_row(self, nummer: int) -> dict:
+        """
+        The identifiers of eigenaar ``nummer``, the same number always gives the same
+        eigenaar.
+        """
+        eigenaar = {
+            "bsn": "",
+            "bsn_hash": "",
+            "kvk_nummer": "",
+            "vestigingsnummer": "",
+            "klantnummer": "",
+        }
+        soort = nummer % 10
+        if soort < 7:
+            eigenaar["bsn"] = get_bsn(nummer)
+            eigenaar["bsn_hash"] = get_bsn_hash(eigenaar["bsn"])
+        elif soort < 9:
+            eigenaar["kvk_nummer"] = f"{nummer % 100_000_000:08}"
+            if soort == 8:
+                eigenaar["vestigingsnummer"] = str(nummer)
+        else:
+            eigenaar["klantnummer"] = f"{self.prefix}-{nummer}"
+        return eigenaar
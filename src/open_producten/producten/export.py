@@ -0,0 +1,163 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from parler.utils import get_active_language_choices
+
+from open_producten.producten.models import Product
+from open_producten.producttypen.models import ProductType
+
+CHUNK_SIZE = 2000
+
+EIGENAAR_FIELDS = ("id", "bsn", "kvk_nummer", "vestigingsnummer", "klantnummer")
+
+CSV_COLUMNS = (
+    "id",
+    "product_type_id",
+    "product_type_code",
+    "product_type_naam",
+    "uniforme_product_naam",
+    "status",
+    "gepubliceerd",
+    "start_datum",
+    "eind_datum",
+    "prijs",
+    "frequentie",
+    "verbruiksobject",
+    "dataobject",
+    "eigenaren",
+    "aanmaak_datum",
+    "update_datum",
+)
+
+
+class ExportFormat(models.TextChoices):
+    NDJSON = "ndjson", "NDJSON"
+    CSV = "csv", "CSV"
+
+
+CONTENT_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def get_export_queryset(queryset, language_code: str):
+    """
+    Join the product type and prefetch the eigenaren & translations per chunk, so the
+    export does a fixed amount of queries per chunk instead of per product.
+    """
+    translation_model = ProductType._parler_meta.root_model
+    return (
+        queryset.select_related("product_type__uniforme_product_naam")
+        .prefetch_related(
+            models.Prefetch(
+                "product_type__translations",
+                queryset=translation_model.objects.filter(
+                    language_code__in=get_active_language_choices(language_code)
+                ),
+            ),
+            "eigenaren",
+        )
+        .order_by("pk")
+    )
+
+
+def product_to_row(product: Product) -> dict:
+    product_type = product.product_type
+    return {
+        "id": product.id,
+        "product_type": {
+            "id": product_type.id,
+            "code": product_type.code,
+            "naam": product_type.safe_translation_getter("naam", any_language=True),
+            "uniforme_product_naam": product_type.uniforme_product_naam.naam,
+        },
+        "status": product.status,
+        "gepubliceerd": product.gepubliceerd,
+        "start_datum": product.start_datum,
+        "eind_datum": product.eind_datum,
+        "prijs": product.prijs,
+        "frequentie": product.frequentie,
+        "verbruiksobject": product.verbruiksobject,
+        "dataobject": product.dataobject,
+        "eigenaren": [
+            {field: getattr(eigenaar, field) for field in EIGENAAR_FIELDS}
+            for eigenaar in product.eigenaren.all()
+        ],
+        "aanmaak_datum": product.aanmaak_datum,
+        "update_datum": product.update_datum,
+    }
+
+
+def iter_product_rows(
+    queryset, language_code: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[dict]:
+    # iterator() uses a server side cursor and runs the prefetches once per chunk
+    for product in get_export_queryset(queryset, language_code).iterator(
+        chunk_size=chunk_size
+    ):
+        yield product_to_row(product)
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def render_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    for row in rows:
+        yield _dumps(row) + "\n"
+
+
+class _Echo:
+    """File-like object that returns the written value instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def render_csv(rows: Iterable[dict]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+
+    for row in rows:
+        product_type = row["product_type"]
+        yield writer.writerow(
+            [
+                row["id"],
+                product_type["id"],
+                product_type["code"],
+                product_type["naam"],
+                product_type["uniforme_product_naam"],
+                row["status"],
+                row["gepubliceerd"],
+                row["start_datum"] or "",
+                row["eind_datum"] or "",
+                row["prijs"],
+                row["frequentie"],
+                _dumps(row["verbruiksobject"]) if row["verbruiksobject"] else "",
+                _dumps(row["dataobject"]) if row["dataobject"] else "",
+                _dumps(row["eigenaren"]),
+                row["aanmaak_datum"].isoformat(),
+                row["update_datum"].isoformat(),
+            ]
+        )
+
+
+RENDERERS = {
+    ExportFormat.NDJSON: render_ndjson,
+    ExportFormat.CSV: render_csv,
+}
+
+
+def export_products(
+    queryset,
+    export_format: str,
+    language_code: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[str]:
+    rows = iter_product_rows(queryset, language_code, chunk_size=chunk_size)
+    return RENDERERS[export_format](rows)
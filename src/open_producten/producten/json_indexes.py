@@ -0,0 +1,103 @@
+"""
+Expression indexes on attributes of the dataobject and verbruiksobject of products.
+
+A ``JsonSchema`` declares the paths of often filtered attributes in its
+``index_paden``. Every path gets an index on the json fields that the schema validates
+for at least one product type. The indexes use the expression of
+:func:`~open_producten.utils.filters.get_json_key_transform`, so the range filters of
+the ``*_attr`` query parameters can use them.
+"""
+
+import hashlib
+
+from django.db import connection, models
+
+from open_producten.producttypen.models import ProductType
+from open_producten.utils.filters import get_json_key_transform
+
+from .models import Product
+
+JSON_INDEX_PREFIX = "product_json_"
+
+# json fields of the products, mapped to the field of the product type with their schema
+JSON_FIELDS = {
+    "dataobject": "dataobject_schema",
+    "verbruiksobject": "verbruiksobject_schema",
+}
+
+
+def get_json_index_name(field_name: str, pad: str) -> str:
+    # index names are at most 30 characters
+    digest = hashlib.sha256(f"{field_name}:{pad}".encode()).hexdigest()[:12]
+    return f"{JSON_INDEX_PREFIX}{digest}"
+
+
+def get_json_indexes() -> dict[str, models.Index]:
+    """
+    Return the expression indexes declared by the json schemas, by name.
+    """
+    indexes = {}
+
+    for field_name, schema_field in JSON_FIELDS.items():
+        paden = (
+            ProductType.objects.filter(**{f"{schema_field}__isnull": False})
+            .values_list(f"{schema_field}__index_paden", flat=True)
+            .distinct()
+        )
+        for pad in {pad for index_paden in paden for pad in index_paden}:
+            name = get_json_index_name(field_name, pad)
+            indexes[name] = models.Index(
+                get_json_key_transform(field_name, pad.split("__")), name=name
+            )
+
+    return indexes
+
+
+def get_existing_json_indexes() -> dict[str, bool]:
+    """
+    Return the names of the expression indexes in the database, mapped to whether they
+    are valid. A concurrently created index that failed is left behind as invalid.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indrelid = %s::regclass AND c.relname LIKE %s
+            """,
+            [Product._meta.db_table, f"{JSON_INDEX_PREFIX}%"],
+        )
+        return dict(cursor.fetchall())
+
+
+def sync_json_indexes() -> tuple[list[str], list[str]]:
+    """
+    Create the missing expression indexes and remove the ones that are no longer
+    declared. Returns the names of the created and removed indexes.
+
+    Outside of a transaction the indexes are created and removed concurrently, so the
+    products can still be written meanwhile.
+    """
+    indexes = get_json_indexes()
+    existing = get_existing_json_indexes()
+
+    removed = sorted(
+        name for name, valid in existing.items() if name not in indexes or not valid
+    )
+    created = sorted(
+        name for name in indexes if name not in existing or name in removed
+    )
+
+    concurrently = not connection.in_atomic_block
+    with connection.schema_editor(atomic=False) as schema_editor:
+        for name in removed:
+            schema_editor.remove_index(
+                Product,
+                models.Index(fields=["pk"], name=name),
+                concurrently=concurrently,
+            )
+        for name in created:
+            schema_editor.add_index(Product, indexes[name], concurrently=concurrently)
+
+    return created, removed
@@ -0,0 +1,74 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.http import QueryDict
+from django.utils import translation
+
+from open_producten.producten.export import CHUNK_SIZE, ExportFormat, export_products
+from open_producten.producten.models import Product
+from open_producten.producten.viewsets.product import ProductFilterSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all products as NDJSON or CSV. The products can be filtered with the "
+        "same filters as the producten API, e.g. --filter status=actief."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--formaat",
+            choices=ExportFormat.values,
+            default=ExportFormat.NDJSON,
+            help="The format of the export.",
+        )
+        parser.add_argument(
+            "--output",
+            help="The file to write the export to, defaults to stdout.",
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            metavar="NAAM=WAARDE",
+            help="A filter of the producten API, can be given multiple times.",
+        )
+        parser.add_argument(
+            "--taal",
+            default="nl",
+            help="The language of the product type names.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help="The amount of products that are fetched from the database at once.",
+        )
+
+    def get_queryset(self, filters: list[str]):
+        data = QueryDict(mutable=True)
+        for _filter in filters:
+            name, sep, value = _filter.partition("=")
+            if not sep:
+                raise CommandError(f"Invalid filter '{_filter}', use NAAM=WAARDE.")
+            data.appendlist(name, value)
+
+        filterset = ProductFilterSet(data=data, queryset=Product.objects.all())
+        if not filterset.is_valid():
+            raise CommandError(f"Invalid filters: {filterset.errors.as_text()}")
+        return filterset.qs
+
+    def handle(self, *args, **options):
+        with translation.override(options["taal"]):
+            queryset = self.get_queryset(options["filter"])
+            lines = export_products(
+                queryset,
+                options["formaat"],
+                options["taal"],
+                chunk_size=options["chunk_size"],
+            )
+
+            if options["output"]:
+                with open(options["output"], "w", newline="") as output:
+                    output.writelines(lines)
+            else:
+                for line in lines:
+                    self.stdout.write(line, ending="")
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a reproducible dataset of product typen and producten for benchmarks "
+        "and load tests. The same seed and sizes always give the same data. Requires "
+        "the test requirements (factory-boy and Faker)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="The seed of the random data.",
+        )
+        parser.add_argument(
+            "--product-typen",
+            type=int,
+            default=None,
+            help="The amount of product typen, defaults to 5000.",
+        )
+        parser.add_argument(
+            "--producten",
+            type=int,
+            default=None,
+            help="The amount of producten, defaults to 5000000.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from open_producten.producten.dataset import DatasetGenerator
+        except ImportError as exc:
+            raise CommandError(
+                f"The dataset is built with the test factories: {exc}."
+            ) from exc
+
+        sizes = {
+            name: options[name]
+            for name in ("product_typen", "producten")
+            if options[name] is not None
+        }
+        if any(size < 0 for size in sizes.values()) or sizes.get("product_typen") == 0:
+            raise CommandError("Invalid amount of product typen or producten.")
+
+        generator = DatasetGenerator(
+            seed=options["seed"], log=self.stdout.write, **sizes
+        )
+        if generator.exists():
+            raise CommandError(
+                f"The dataset with seed {options['seed']} has already been generated."
+            )
+
+        generator.generate()
@@ -0,0 +1,141 @@
+import json
+import platform
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.utils import translation
+
+from open_producten.benchmarks.base import BENCHMARKS, compare, run_benchmark
+
+DEFAULT_PRODUCT_TYPEN = 1_000
+DEFAULT_PRODUCTEN = 50_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the micro-benchmarks of the serializers and endpoints against a generated "
+        "dataset in a test database. The results can be written as json and compared "
+        "to a baseline, regressions give a non-zero exit code. Requires the test "
+        "requirements (factory-boy and Faker)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="The json file to write the results to.",
+        )
+        parser.add_argument(
+            "--baseline",
+            help="A json file with earlier results to compare the results to.",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="How much slower than the baseline a benchmark may be, defaults to 0.25.",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=5,
+            help="The number of times every benchmark is run.",
+        )
+        parser.add_argument(
+            "--filter",
+            default="",
+            help="Only run the benchmarks of which the name contains this text.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--product-typen", type=int, default=DEFAULT_PRODUCT_TYPEN)
+        parser.add_argument("--producten", type=int, default=DEFAULT_PRODUCTEN)
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the test database with the dataset for the next run.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import open_producten.benchmarks.endpoints  # noqa: F401
+            import open_producten.benchmarks.serializers  # noqa: F401
+            from open_producten.producten.dataset import DatasetGenerator
+        except ImportError as exc:
+            raise CommandError(
+                f"The dataset is built with the test factories: {exc}."
+            ) from exc
+
+        benchmarks = [
+            benchmark
+            for name, benchmark in sorted(BENCHMARKS.items())
+            if options["filter"] in name
+        ]
+        baseline = {}
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)["benchmarks"]
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False, keepdb=options["keepdb"]
+        )
+        try:
+            generator = DatasetGenerator(
+                seed=options["seed"],
+                product_typen=options["product_typen"],
+                producten=options["producten"],
+                log=self.stdout.write,
+            )
+            if not generator.exists():
+                generator.generate()
+
+            results = {}
+            with (
+                translation.override("nl"),
+                override_settings(API_RESPONSE_CACHE_TIMEOUT=0),
+            ):
+                for benchmark in benchmarks:
+                    results[benchmark.name] = run_benchmark(
+                        benchmark, options["rounds"]
+                    )
+                    self.stdout.write(
+                        self.format_result(benchmark.name, results[benchmark.name])
+                    )
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options["keepdb"]
+            )
+            teardown_test_environment()
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(
+                    {
+                        "datum": datetime.now().isoformat(),
+                        "python": platform.python_version(),
+                        "dataset": {
+                            "seed": options["seed"],
+                            "product_typen": options["product_typen"],
+                            "producten": options["producten"],
+                        },
+                        "benchmarks": results,
+                    },
+                    f,
+                    indent=2,
+                )
+
+        if regressions := compare(results, baseline, options["tolerance"]):
+            raise CommandError("Regressions:\n" + "\n".join(regressions))
+
+    @staticmethod
+    def format_result(name: str, result: dict) -> str:
+        return (
+            f"{name:<45} median {result['median'] * 1000:8.1f}ms "
+            f"sql {result['sql_median'] * 1000:8.1f}ms "
+            f"queries {result['queries']:4}/{result['query_budget']}"
+        )
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from open_producten.producten.models import Eigenaar
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the keyed hash of the bsn of all eigenaren with the current "
+        "EIGENAAR_BSN_HASH_KEY. Run this after setting or changing the key."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="The amount of eigenaren that are updated at once.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        batch = []
+        updated = 0
+
+        eigenaren = (
+            Eigenaar.objects.exclude(bsn="", bsn_hash="")
+            .only("id", "bsn", "bsn_hash")
+            .iterator(chunk_size=batch_size)
+        )
+        for eigenaar in eigenaren:
+            bsn_hash = eigenaar.bsn_hash
+            eigenaar.set_bsn_hash()
+            if eigenaar.bsn_hash == bsn_hash:
+                continue
+
+            batch.append(eigenaar)
+            if len(batch) == batch_size:
+                Eigenaar.objects.bulk_update(batch, ["bsn_hash"])
+                updated += len(batch)
+                batch = []
+
+        Eigenaar.objects.bulk_update(batch, ["bsn_hash"])
+        updated += len(batch)
+
+        self.stdout.write(f"Updated the bsn hash of {updated} eigenaren.")
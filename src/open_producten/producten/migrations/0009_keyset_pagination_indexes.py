@@ -0,0 +1,25 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producten", "0008_alter_product_prijs_alter_product_product_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["aanmaak_datum", "id"], name="product_aanmaak_datum_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["update_datum", "id"], name="product_update_datum_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producten", "0009_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="externe_referentie",
+            field=models.CharField(
+                blank=True,
+                help_text="Unieke referentie van dit product in een extern systeem. Wordt gebruikt om producten bij te werken via het bulk endpoint.",
+                max_length=255,
+                null=True,
+                unique=True,
+                verbose_name="externe referentie",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:26
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producten", "0010_product_externe_referentie"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["dataobject"],
+                name="product_dataobject_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["verbruiksobject"],
+                name="product_verbruiksobject_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
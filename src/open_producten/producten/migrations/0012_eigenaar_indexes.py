@@ -0,0 +1,56 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producten", "0011_json_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eigenaar",
+            name="bsn_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Keyed hash van het BSN waarmee op BSN wordt gezocht, alleen gevuld als er een sleutel is ingesteld.",
+                max_length=64,
+                verbose_name="BSN hash",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eigenaar",
+            index=models.Index(
+                condition=models.Q(("bsn", ""), _negated=True),
+                fields=["bsn"],
+                name="eigenaar_bsn_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eigenaar",
+            index=models.Index(
+                condition=models.Q(("bsn_hash", ""), _negated=True),
+                fields=["bsn_hash"],
+                name="eigenaar_bsn_hash_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eigenaar",
+            index=models.Index(
+                condition=models.Q(("kvk_nummer", ""), _negated=True),
+                fields=["kvk_nummer", "vestigingsnummer"],
+                name="eigenaar_kvk_nummer_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eigenaar",
+            index=models.Index(
+                condition=models.Q(("klantnummer", ""), _negated=True),
+                fields=["klantnummer"],
+                name="eigenaar_klantnummer_idx",
+            ),
+        ),
+    ]
@@ -1,3 +1,7 @@
+import hashlib
+import hmac
+
+from django.conf import settings
 from django.core.validators import MinLengthValidator, RegexValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -12,6 +16,19 @@ from open_producten.utils.models import BaseModel
 from .product import Product
 
 
+def get_bsn_hash(bsn: str) -> str:
+    """
+    Return the keyed hash of a bsn, or an empty string when there is no bsn or no
+    ``EIGENAAR_BSN_HASH_KEY`` is configured.
+    """
+    if not bsn or not settings.EIGENAAR_BSN_HASH_KEY:
+        return ""
+
+    return hmac.new(
+        settings.EIGENAAR_BSN_HASH_KEY.encode(), bsn.encode(), hashlib.sha256
+    ).hexdigest()
+
+
 class Eigenaar(BaseModel):
 
     product = models.ForeignKey(
@@ -31,6 +48,16 @@ class Eigenaar(BaseModel):
         blank=True,
     )
 
+    bsn_hash = models.CharField(
+        _("BSN hash"),
+        help_text=_(
+            "Keyed hash van het BSN waarmee op BSN wordt gezocht, alleen gevuld als er een sleutel is ingesteld."
+        ),
+        max_length=64,
+        blank=True,
+        editable=False,
+    )
+
     kvk_nummer = models.CharField(
         _("KVK nummer"),
         help_text=_("Het kvk nummer van de product eigenaar"),
@@ -59,6 +86,13 @@ class Eigenaar(BaseModel):
         )
         validate_eigenaar_identifier(self.bsn, self.kvk_nummer, self.klantnummer)
 
+    def set_bsn_hash(self):
+        self.bsn_hash = get_bsn_hash(self.bsn)
+
+    def save(self, *args, **kwargs):
+        self.set_bsn_hash()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         if self.bsn:
             return f"BSN {self.bsn}"
@@ -76,3 +110,24 @@ class Eigenaar(BaseModel):
     class Meta:
         verbose_name = _("Eigenaar")
         verbose_name_plural = _("Eigenaren")
+        # most eigenaren have only one of the identifiers
+        indexes = [
+            models.Index(
+                fields=["bsn"], name="eigenaar_bsn_idx", condition=~models.Q(bsn="")
+            ),
+            models.Index(
+                fields=["bsn_hash"],
+                name="eigenaar_bsn_hash_idx",
+                condition=~models.Q(bsn_hash=""),
+            ),
+            models.Index(
+                fields=["kvk_nummer", "vestigingsnummer"],
+                name="eigenaar_kvk_nummer_idx",
+                condition=~models.Q(kvk_nummer=""),
+            ),
+            models.Index(
+                fields=["klantnummer"],
+                name="eigenaar_klantnummer_idx",
+                condition=~models.Q(klantnummer=""),
+            ),
+        ]
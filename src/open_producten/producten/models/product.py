@@ -1,10 +1,13 @@
 from datetime import date
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from parler.utils import get_active_language_choices
+
 from open_producten.logging.logevent import audit_automation_update
 from open_producten.producten.models.validators import validate_product_dates
 from open_producten.producttypen.models import ProductType
@@ -19,6 +22,47 @@ class PrijsFrequentieChoices(models.TextChoices):
     JAARLIJKS = "jaarlijks", _("Jaarlijks")
 
 
+ACTIEF_VANAF_STATUSSEN = (ProductStateChoices.INITIEEL, ProductStateChoices.GEREED)
+VERLOPEN_VANAF_STATUSSEN = (
+    ProductStateChoices.INITIEEL,
+    ProductStateChoices.GEREED,
+    ProductStateChoices.ACTIEF,
+)
+
+
+ACTIEF_REMARK = _("Status gezet naar ACTIEF vanwege de start datum.")
+VERLOPEN_REMARK = _("Status gezet naar VERLOPEN vanwege de eind datum.")
+
+
+class ProductQuerySet(models.QuerySet):
+    def to_activate(self, datum: date):
+        """Products that should be set to ACTIEF because of their start datum."""
+        return self.filter(start_datum__lte=datum, status__in=ACTIEF_VANAF_STATUSSEN)
+
+    def to_expire(self, datum: date):
+        """Products that should be set to VERLOPEN because of their eind datum."""
+        return self.filter(eind_datum__lte=datum, status__in=VERLOPEN_VANAF_STATUSSEN)
+
+    def with_api_relations(self, language_code=None):
+        """
+        Load the product type, its translations and the eigenaren up front, so
+        serializing the products costs a fixed number of queries.
+        """
+        translation_model = ProductType._parler_meta.root_model
+
+        return self.select_related(
+            "product_type__uniforme_product_naam"
+        ).prefetch_related(
+            models.Prefetch(
+                "product_type__translations",
+                queryset=translation_model.objects.filter(
+                    language_code__in=get_active_language_choices(language_code)
+                ),
+            ),
+            "eigenaren",
+        )
+
+
 class Product(BasePublishableModel):
     product_type = models.ForeignKey(
         ProductType,
@@ -87,9 +131,43 @@ class Product(BasePublishableModel):
         ),
     )
 
+    externe_referentie = models.CharField(
+        _("externe referentie"),
+        max_length=255,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text=_(
+            "Unieke referentie van dit product in een extern systeem. Wordt gebruikt om producten bij te werken via het bulk endpoint."
+        ),
+    )
+
+    objects = ProductQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Product")
         verbose_name_plural = _("Producten")
+        indexes = [
+            # keyset pagination
+            models.Index(
+                fields=["aanmaak_datum", "id"], name="product_aanmaak_datum_id_idx"
+            ),
+            models.Index(
+                fields=["update_datum", "id"], name="product_update_datum_id_idx"
+            ),
+            # json containment filters, the attributes of which a json schema declares
+            # index paden also get an expression index, see json_indexes
+            GinIndex(
+                fields=["dataobject"],
+                name="product_dataobject_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+            GinIndex(
+                fields=["verbruiksobject"],
+                name="product_verbruiksobject_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ]
 
     def clean(self):
         validate_product_dates(self.start_datum, self.eind_datum)
@@ -99,32 +177,28 @@ class Product(BasePublishableModel):
         self.handle_eind_datum()
         super().save(*args, **kwargs)
 
-    def handle_start_datum(self):
-        if (
+    def should_be_activated(self) -> bool:
+        return bool(
             self.start_datum
             and self.start_datum <= date.today()
-            and self.status
-            in (ProductStateChoices.INITIEEL, ProductStateChoices.GEREED)
-        ):
-            audit_automation_update(
-                self, _("Status gezet naar ACTIEF vanwege de start datum.")
-            )
-            self.status = ProductStateChoices.ACTIEF
+            and self.status in ACTIEF_VANAF_STATUSSEN
+        )
 
-    def handle_eind_datum(self):
-        if (
+    def should_expire(self) -> bool:
+        return bool(
             self.eind_datum
             and self.eind_datum <= date.today()
-            and self.status
-            in (
-                ProductStateChoices.INITIEEL,
-                ProductStateChoices.GEREED,
-                ProductStateChoices.ACTIEF,
-            )
-        ):
-            audit_automation_update(
-                self, _("Status gezet naar VERLOPEN vanwege de eind datum.")
-            )
+            and self.status in VERLOPEN_VANAF_STATUSSEN
+        )
+
+    def handle_start_datum(self):
+        if self.should_be_activated():
+            audit_automation_update(self, ACTIEF_REMARK)
+            self.status = ProductStateChoices.ACTIEF
+
+    def handle_eind_datum(self):
+        if self.should_expire():
+            audit_automation_update(self, VERLOPEN_REMARK)
             self.status = ProductStateChoices.VERLOPEN
 
     def __str__(self):
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
@@ -5,6 +7,9 @@ from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
 from rest_framework import serializers
 
 from open_producten.producten.models import Eigenaar, Product
+from open_producten.producten.models.validators import (
+    validate_eigenaar_vestingsnummer_only_with_kvk,
+)
 from open_producten.producten.serializers.eigenaar import EigenaarSerializer
 from open_producten.producten.serializers.validators import (
     DataObjectValidator,
@@ -133,3 +138,105 @@ class ProductSerializer(serializers.ModelSerializer):
             ).delete()
 
         return product
+
+
+class PreloadedProductTypeField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves the product type from the ``product_typen`` mapping in the serializer
+    context, so a batch of products does not query the product type per product.
+    """
+
+    def to_internal_value(self, data):
+        try:
+            return self.context["product_typen"][uuid.UUID(str(data))]
+        except ValueError:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+class BulkProductSerializer(ProductSerializer):
+    product_type_id = PreloadedProductTypeField(
+        write_only=True, queryset=ProductType.objects.all(), source="product_type"
+    )
+
+    class Meta(ProductSerializer.Meta):
+        # uniqueness of the externe referentie is checked once for the whole batch
+        extra_kwargs = {"externe_referentie": {"validators": []}}
+
+    def validate_externe_referentie(self, value):
+        return value or None
+
+
+class ProductBulkResultaatSerializer(serializers.Serializer):
+    index = serializers.IntegerField(
+        help_text=_("De positie van het product in het verzoek.")
+    )
+    resultaat = serializers.ChoiceField(
+        choices=["aangemaakt", "bijgewerkt", "fout"],
+        help_text=_("Het resultaat voor dit product."),
+    )
+    product = ProductSerializer(allow_null=True, help_text=_("Het opgeslagen product."))
+    fouten = serializers.DictField(
+        allow_null=True,
+        help_text=_("De validatie fouten van dit product."),
+    )
+
+
+class EigenaarProductSerializer(ProductSerializer):
+    """
+    A product of an eigenaar, the product type is given once for its group.
+    """
+
+    product_type = None
+    product_type_id = None
+
+    class Meta(ProductSerializer.Meta):
+        fields = None
+        exclude = ("product_type",)
+
+
+class EigenaarProductTypeSerializer(NestedProductTypeSerializer):
+    naam = serializers.CharField(
+        read_only=True, help_text=_("naam van het producttype.")
+    )
+
+    class Meta(NestedProductTypeSerializer.Meta):
+        fields = ("id", "naam", *NestedProductTypeSerializer.Meta.fields[1:])
+
+
+class EigenaarProductenSerializer(serializers.Serializer):
+    product_type = EigenaarProductTypeSerializer(
+        help_text=_("Het product type van de producten.")
+    )
+    producten = EigenaarProductSerializer(
+        many=True, help_text=_("De producten van de eigenaar met dit product type.")
+    )
+
+
+class EigenaarProductenParametersSerializer(serializers.Serializer):
+    bsn = serializers.CharField(required=False, help_text=_("Het BSN van de eigenaar."))
+    kvk_nummer = serializers.CharField(
+        required=False, help_text=_("Het kvk nummer van de eigenaar.")
+    )
+    vestigingsnummer = serializers.CharField(
+        required=False,
+        help_text=_(
+            "Het vestigingsnummer van de eigenaar, alleen in combinatie met een kvk nummer."
+        ),
+    )
+    klantnummer = serializers.CharField(
+        required=False, help_text=_("Het klantnummer van de eigenaar.")
+    )
+
+    def validate(self, attrs):
+        if not (
+            attrs.get("bsn") or attrs.get("kvk_nummer") or attrs.get("klantnummer")
+        ):
+            raise serializers.ValidationError(
+                _("Een bsn, kvk nummer of klantnummer is vereist.")
+            )
+        validate_eigenaar_vestingsnummer_only_with_kvk(
+            attrs.get("kvk_nummer"), attrs.get("vestigingsnummer")
+        )
+        return attrs
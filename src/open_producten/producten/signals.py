@@ -0,0 +1,44 @@
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from open_producten.producttypen.models import JsonSchema, ProductType
+
+from .json_indexes import get_existing_json_indexes
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_json_index_sync() -> None:
+    from .tasks import synchronise_json_indexes
+
+    try:
+        synchronise_json_indexes.delay()
+    except Exception:
+        # the indexes are also synchronised daily
+        logger.exception("Could not schedule the synchronisation of the json indexes")
+
+
+def json_schema_changed(sender, instance, raw=False, **kwargs):
+    if not raw and (instance.index_paden or get_existing_json_indexes()):
+        transaction.on_commit(schedule_json_index_sync)
+
+
+def product_type_changed(sender, instance, raw=False, **kwargs):
+    # a product type that no longer uses a schema is handled by the daily sync
+    schema_ids = [instance.dataobject_schema_id, instance.verbruiksobject_schema_id]
+    if (
+        not raw
+        and any(schema_ids)
+        and JsonSchema.objects.filter(pk__in=schema_ids)
+        .exclude(index_paden=[])
+        .exists()
+    ):
+        transaction.on_commit(schedule_json_index_sync)
+
+
+def connect_signals():
+    post_save.connect(json_schema_changed, sender=JsonSchema)
+    post_delete.connect(json_schema_changed, sender=JsonSchema)
+    post_save.connect(product_type_changed, sender=ProductType)
@@ -1,15 +1,92 @@
+import logging
+from datetime import date
+
 from django.db import transaction
+from django.utils import timezone
 
 from open_producten.celery import app
+from open_producten.logging.service import audit_automation_update_bulk
+from open_producten.producten.json_indexes import sync_json_indexes
 from open_producten.producten.models import Product
+from open_producten.producten.models.product import ACTIEF_REMARK, VERLOPEN_REMARK
+from open_producten.producttypen.models.producttype import ProductStateChoices
+from open_producten.utils.locks import advisory_lock
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+
+
+def _update_status_in_chunks(queryset, status: str, remarks: str) -> int:
+    """
+    Set ``status`` on every product in ``queryset`` using one UPDATE per chunk.
+
+    Each chunk runs in its own short transaction. Updated products no longer match
+    the queryset, so the next chunk is always taken from the start.
+    """
+    updated = 0
+    while True:
+        with transaction.atomic():
+            products = list(
+                queryset.select_related("product_type")
+                .prefetch_related("product_type__translations")
+                .select_for_update(of=("self",))
+                .order_by("pk")[:CHUNK_SIZE]
+            )
+            if not products:
+                return updated
+
+            Product.objects.filter(pk__in=[product.pk for product in products]).update(
+                status=status, update_datum=timezone.now()
+            )
+            audit_automation_update_bulk(products, remarks)
 
+        updated += len(products)
 
-def updated_based_on_dates():
-    for product in Product.objects.all():
-        product.save()
+
+def updated_based_on_dates(datum: date | None = None) -> tuple[int, int]:
+    datum = datum or date.today()
+
+    activated = _update_status_in_chunks(
+        Product.objects.to_activate(datum),
+        ProductStateChoices.ACTIEF,
+        ACTIEF_REMARK,
+    )
+    expired = _update_status_in_chunks(
+        Product.objects.to_expire(datum),
+        ProductStateChoices.VERLOPEN,
+        VERLOPEN_REMARK,
+    )
+    return activated, expired
 
 
 @app.task
-@transaction.atomic()
 def set_product_states():
-    updated_based_on_dates()
+    with advisory_lock("set_product_states") as acquired:
+        if not acquired:
+            logger.info("set_product_states is already running, skipping this run.")
+            return
+
+        activated, expired = updated_based_on_dates()
+        logger.info(
+            "Updated product statuses: %d set to actief, %d set to verlopen.",
+            activated,
+            expired,
+        )
+
+
+@app.task
+def synchronise_json_indexes():
+    with advisory_lock("synchronise_json_indexes") as acquired:
+        if not acquired:
+            logger.info(
+                "synchronise_json_indexes is already running, skipping this run."
+            )
+            return
+
+        created, removed = sync_json_indexes()
+        logger.info(
+            "Synchronised the json indexes of the products: %d created, %d removed.",
+            len(created),
+            len(removed),
+        )
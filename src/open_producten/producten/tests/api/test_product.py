@@ -77,6 +77,7 @@ class TestProduct(BaseApiTestCase):
             "status": product.status,
             "verbruiksobject": None,
             "dataobject": None,
+            "externe_referentie": None,
             "gepubliceerd": False,
             "start_datum": None,
             "eind_datum": None,
@@ -131,6 +132,7 @@ class TestProduct(BaseApiTestCase):
             "status": product.status,
             "verbruiksobject": {"naam": "Test"},
             "dataobject": None,
+            "externe_referentie": None,
             "gepubliceerd": False,
             "start_datum": None,
             "eind_datum": None,
@@ -215,6 +217,7 @@ class TestProduct(BaseApiTestCase):
             "status": product.status,
             "verbruiksobject": None,
             "dataobject": {"naam": "Test"},
+            "externe_referentie": None,
             "gepubliceerd": False,
             "start_datum": None,
             "eind_datum": None,
@@ -647,6 +650,7 @@ class TestProduct(BaseApiTestCase):
                 "status": product1.status,
                 "verbruiksobject": None,
                 "dataobject": None,
+                "externe_referentie": None,
                 "gepubliceerd": False,
                 "start_datum": None,
                 "eind_datum": None,
@@ -680,6 +684,7 @@ class TestProduct(BaseApiTestCase):
                 "status": product2.status,
                 "verbruiksobject": None,
                 "dataobject": None,
+                "externe_referentie": None,
                 "gepubliceerd": False,
                 "start_datum": None,
                 "eind_datum": None,
@@ -725,6 +730,7 @@ class TestProduct(BaseApiTestCase):
             "status": product.status,
             "verbruiksobject": None,
             "dataobject": None,
+            "externe_referentie": None,
             "gepubliceerd": False,
             "start_datum": None,
             "eind_datum": None,
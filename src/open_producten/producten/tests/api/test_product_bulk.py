@@ -0,0 +1,427 @@
+import datetime
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from freezegun import freeze_time
+from notifications_api_common.models import NotificationsConfig
+from rest_framework import status
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from open_producten.logging.constants import Events
+from open_producten.logging.models import TimelineLogProxy
+from open_producten.producten.bulk import ProductBulkImport
+from open_producten.producten.models import Eigenaar, Product
+from open_producten.producten.tests.factories import EigenaarFactory, ProductFactory
+from open_producten.producttypen.models.producttype import ProductStateChoices
+from open_producten.producttypen.tests.factories import (
+    JsonSchemaFactory,
+    ProductTypeFactory,
+)
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+@freeze_time("2024-01-01")
+@override_settings(NOTIFICATIONS_DISABLED=True)
+class TestProductBulk(BaseApiTestCase):
+    path = reverse_lazy("product-bulk")
+
+    def setUp(self):
+        super().setUp()
+        self.product_type = ProductTypeFactory.create(toegestane_statussen=["gereed"])
+
+    def product_data(self, **kwargs):
+        return {
+            "product_type_id": str(self.product_type.id),
+            "status": "initieel",
+            "prijs": "20.20",
+            "frequentie": "eenmalig",
+            "eigenaren": [{"kvk_nummer": "12345678"}],
+        } | kwargs
+
+    def test_bulk_create(self):
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(externe_referentie="A"),
+                self.product_data(externe_referentie="B", prijs="10.00"),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Product.objects.count(), 2)
+        self.assertEqual(Eigenaar.objects.count(), 2)
+
+        self.assertEqual(
+            [(r["index"], r["resultaat"], r["fouten"]) for r in response.data],
+            [(0, "aangemaakt", None), (1, "aangemaakt", None)],
+        )
+        product = Product.objects.get(externe_referentie="B")
+        self.assertEqual(response.data[1]["product"]["id"], str(product.id))
+        self.assertEqual(response.data[1]["product"]["prijs"], "10.00")
+        self.assertEqual(
+            response.data[1]["product"]["eigenaren"][0]["kvk_nummer"], "12345678"
+        )
+
+    def test_bulk_create_returns_errors_per_product(self):
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(),
+                self.product_data(product_type_id="abc"),
+                self.product_data(status="gereed", eigenaren=[]),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Product.objects.count(), 1)
+        self.assertEqual(
+            [r["resultaat"] for r in response.data], ["aangemaakt", "fout", "fout"]
+        )
+        self.assertIsNone(response.data[1]["product"])
+        self.assertEqual(list(response.data[1]["fouten"]), ["product_type_id"])
+        self.assertEqual(list(response.data[2]["fouten"]), ["eigenaren"])
+
+    def test_bulk_create_with_unknown_product_type(self):
+        response = self.client.post(
+            self.path,
+            [self.product_data(product_type_id="00000000-0000-0000-0000-000000000000")],
+        )
+
+        self.assertEqual(response.data[0]["resultaat"], "fout")
+        self.assertEqual(
+            response.data[0]["fouten"]["product_type_id"][0].code, "does_not_exist"
+        )
+
+    def test_bulk_create_validates_json_schema(self):
+        self.product_type.verbruiksobject_schema = JsonSchemaFactory.create(
+            schema={
+                "type": "object",
+                "properties": {"uren": {"type": "integer"}},
+                "required": ["uren"],
+            }
+        )
+        self.product_type.save()
+
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(verbruiksobject={"uren": 1}),
+                self.product_data(verbruiksobject={"uren": "veel"}),
+            ],
+        )
+
+        self.assertEqual(
+            [r["resultaat"] for r in response.data], ["aangemaakt", "fout"]
+        )
+        self.assertIn("verbruiksobject", response.data[1]["fouten"])
+
+    def test_bulk_create_sets_status_based_on_dates(self):
+        self.product_type.toegestane_statussen = ["gereed", "actief"]
+        self.product_type.save()
+
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(
+                    status="gereed", start_datum=str(datetime.date(2024, 1, 1))
+                )
+            ],
+        )
+
+        self.assertEqual(response.data[0]["product"]["status"], "actief")
+        product = Product.objects.get()
+        self.assertEqual(product.status, ProductStateChoices.ACTIEF)
+        self.assertTrue(
+            TimelineLogProxy.objects.filter(
+                object_id=product.id,
+                extra_data__acting_user__display_name="Automation",
+            ).exists()
+        )
+
+    def test_bulk_create_with_existing_externe_referentie(self):
+        ProductFactory.create(externe_referentie="A")
+
+        response = self.client.post(
+            self.path, [self.product_data(externe_referentie="A")]
+        )
+
+        self.assertEqual(response.data[0]["resultaat"], "fout")
+        self.assertIn("externe_referentie", response.data[0]["fouten"])
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_bulk_with_duplicate_externe_referentie(self):
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(externe_referentie="A"),
+                self.product_data(externe_referentie="A"),
+            ],
+            QUERY_STRING="upsert=true",
+        )
+
+        self.assertEqual(
+            [r["resultaat"] for r in response.data], ["aangemaakt", "fout"]
+        )
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_bulk_upsert(self):
+        with freeze_time("2023-12-01"):
+            existing = ProductFactory.create(
+                product_type=self.product_type, externe_referentie="A", prijs="1.00"
+            )
+        kept = EigenaarFactory.create(product=existing, kvk_nummer="11111111")
+        EigenaarFactory.create(product=existing, kvk_nummer="22222222")
+
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(
+                    externe_referentie="A",
+                    prijs="30.00",
+                    eigenaren=[
+                        {"id": str(kept.id), "kvk_nummer": "33333333"},
+                        {"bsn": "111222333"},
+                    ],
+                ),
+                self.product_data(externe_referentie="B"),
+            ],
+            QUERY_STRING="upsert=true",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [r["resultaat"] for r in response.data], ["bijgewerkt", "aangemaakt"]
+        )
+        existing.refresh_from_db()
+        self.assertEqual(str(existing.prijs), "30.00")
+        self.assertGreater(existing.update_datum, existing.aanmaak_datum)
+        self.assertEqual(
+            set(existing.eigenaren.values_list("kvk_nummer", "bsn")),
+            {("33333333", ""), ("", "111222333")},
+        )
+        self.assertEqual(existing.eigenaren.get(kvk_nummer="33333333").id, kept.id)
+        self.assertEqual(Product.objects.count(), 2)
+
+    def test_bulk_new_product_ignores_eigenaar_ids(self):
+        other = EigenaarFactory.create(kvk_nummer="11111111")
+
+        self.client.post(
+            self.path,
+            [
+                self.product_data(
+                    eigenaren=[{"id": str(other.id), "kvk_nummer": "22222222"}]
+                )
+            ],
+        )
+
+        other.refresh_from_db()
+        self.assertEqual(other.kvk_nummer, "11111111")
+        self.assertEqual(Eigenaar.objects.count(), 2)
+
+    def test_bulk_audit_logs(self):
+        ProductFactory.create(product_type=self.product_type, externe_referentie="A")
+
+        self.client.post(
+            self.path,
+            [
+                self.product_data(externe_referentie="A"),
+                self.product_data(externe_referentie="B"),
+                self.product_data(externe_referentie="C"),
+            ],
+            QUERY_STRING="upsert=true",
+        )
+
+        self.assertEqual(
+            TimelineLogProxy.objects.filter(extra_data__event=Events.create).count(), 2
+        )
+        log = TimelineLogProxy.objects.get(extra_data__event=Events.update)
+        self.assertEqual(log.content_object.externe_referentie, "A")
+
+    def test_bulk_requires_list(self):
+        response = self.client.post(self.path, self.product_data())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.path, [])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("open_producten.producten.viewsets.product.MAX_BULK_SIZE", 2)
+    def test_bulk_max_size(self):
+        response = self.client.post(self.path, [self.product_data()] * 3)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Product.objects.count(), 0)
+
+    def test_bulk_query_count_does_not_depend_on_batch_size(self):
+        def count_queries(size):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    self.path, [self.product_data() for _ in range(size)]
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(context)
+
+        self.assertEqual(count_queries(2), count_queries(20))
+
+    def test_bulk_upsert_query_count_does_not_depend_on_batch_size(self):
+        def count_queries(size, prefix):
+            data = []
+            for i in range(size):
+                product = ProductFactory.create(
+                    product_type=self.product_type, externe_referentie=f"{prefix}{i}"
+                )
+                eigenaar = EigenaarFactory.create(
+                    product=product, kvk_nummer="11111111"
+                )
+                data.append(
+                    self.product_data(
+                        externe_referentie=f"{prefix}{i}",
+                        eigenaren=[{"id": str(eigenaar.id), "kvk_nummer": "22222222"}],
+                    )
+                )
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.path, data, QUERY_STRING="upsert=true")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual({r["resultaat"] for r in response.data}, {"bijgewerkt"})
+            return len(context)
+
+        self.assertEqual(count_queries(2, "A"), count_queries(20, "B"))
+
+    def test_bulk_upsert_with_eigenaar_of_other_product(self):
+        existing = ProductFactory.create(
+            product_type=self.product_type, externe_referentie="A"
+        )
+        other = EigenaarFactory.create(kvk_nummer="11111111")
+
+        response = self.client.post(
+            self.path,
+            [
+                self.product_data(
+                    externe_referentie="A",
+                    eigenaren=[
+                        {"id": str(other.id), "kvk_nummer": "22222222"},
+                        {"id": str(existing.id), "kvk_nummer": "22222222"},
+                    ],
+                )
+            ],
+            QUERY_STRING="upsert=true",
+        )
+
+        self.assertEqual(
+            response.data[0]["fouten"]["eigenaren"],
+            [
+                f"Eigenaar id {other.id} op index 0 is niet onderdeel van het Product object.",
+                f"Eigenaar id {existing.id} op index 1 bestaat niet.",
+            ],
+        )
+
+    def test_bulk_concurrent_create_is_reported_per_product(self):
+        load_existing_products = ProductBulkImport._load_existing_products
+        calls = []
+
+        def load_after_concurrent_create(bulk_import):
+            # the first validation runs before the other request saved product A
+            calls.append(bulk_import)
+            if len(calls) == 1:
+                ProductFactory.create(
+                    product_type=self.product_type, externe_referentie="A"
+                )
+                return {}
+            return load_existing_products(bulk_import)
+
+        with patch.object(
+            ProductBulkImport,
+            "_load_existing_products",
+            load_after_concurrent_create,
+        ):
+            response = self.client.post(
+                self.path,
+                [
+                    self.product_data(externe_referentie="A"),
+                    self.product_data(externe_referentie="B"),
+                ],
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [r["resultaat"] for r in response.data], ["fout", "aangemaakt"]
+        )
+        self.assertEqual(Product.objects.count(), 2)
+
+    def test_bulk_conflict(self):
+        ProductFactory.create(product_type=self.product_type, externe_referentie="A")
+
+        with patch.object(
+            ProductBulkImport, "_load_existing_products", return_value={}
+        ):
+            response = self.client.post(
+                self.path, [self.product_data(externe_referentie="A")]
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["detail"].code, "conflict")
+        self.assertEqual(Product.objects.count(), 1)
+
+
+@freeze_time("2024-2-2T00:00:00Z")
+@override_settings(NOTIFICATIONS_DISABLED=False)
+class TestProductBulkNotifications(BaseApiTestCase):
+    path = reverse_lazy("product-bulk")
+
+    @classmethod
+    def setUpTestData(cls):
+        service, _ = Service.objects.update_or_create(
+            api_root="https://notificaties-api.vng.cloud/api/v1/",
+            defaults=dict(
+                api_type=APITypes.nrc,
+                client_id="test",
+                secret="test",
+                user_id="test",
+                user_representation="Test",
+            ),
+        )
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = service
+        config.save()
+
+        cls.product_type = ProductTypeFactory.create(toegestane_statussen=["gereed"])
+
+    @patch("notifications_api_common.viewsets.send_notification.delay")
+    def test_send_notif_per_product(self, mock_task):
+        ProductFactory.create(product_type=self.product_type, externe_referentie="A")
+        data = {
+            "product_type_id": str(self.product_type.id),
+            "status": "initieel",
+            "prijs": "20.20",
+            "frequentie": "eenmalig",
+            "eigenaren": [{"bsn": "111222333"}],
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.path,
+                [
+                    data | {"externe_referentie": "A"},
+                    data | {"externe_referentie": "B"},
+                    data | {"prijs": "abc"},
+                ],
+                QUERY_STRING="upsert=true",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(mock_task.call_count, 2)
+
+        messages = [call.args[0] for call in mock_task.call_args_list]
+        self.assertEqual([m["actie"] for m in messages], ["update", "create"])
+        self.assertEqual(
+            [m["resourceUrl"] for m in messages],
+            [r["product"]["url"] for r in response.json()[:2]],
+        )
+        self.assertEqual(
+            messages[1]["kenmerken"]["productType.code"], self.product_type.code
+        )
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from freezegun import freeze_time
+from rest_framework import status
+
+from open_producten.logging.constants import Events
+from open_producten.logging.models import TimelineLogProxy
+from open_producten.producten.tests.factories import ProductFactory
+from open_producten.producten.viewsets.product import ProductViewSet
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+@override_settings(NOTIFICATIONS_DISABLED=True)
+class TestProductConditionalGet(BaseApiTestCase):
+    def setUp(self):
+        super().setUp()
+        with freeze_time("2024-01-01"):
+            self.product = ProductFactory.create()
+        self.path = reverse("product-detail", args=[self.product.id])
+
+    def test_not_modified(self):
+        etag = self.client.get(self.path)["ETag"]
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["Last-Modified"], "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    def test_not_modified_is_audited(self):
+        etag = self.client.get(self.path)["ETag"]
+
+        self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(
+            TimelineLogProxy.objects.filter(
+                object_id=self.product.id, extra_data__event=Events.read
+            ).count(),
+            2,
+        )
+
+    def test_product_type_change_changes_etag(self):
+        etag = self.client.get(self.path)["ETag"]
+
+        self.product.product_type.save()
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_cursor_pagination_has_no_etag(self):
+        response = self.client.get(reverse("product-list"), {"paginatie": "cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+
+    def test_list_costs_one_extra_query(self):
+        ProductFactory.create_batch(2)
+        path = reverse("product-list")
+
+        with patch.object(ProductViewSet, "conditional_get_fields", ()):
+            with CaptureQueriesContext(connection) as without_etag:
+                self.client.get(path)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+
+        self.assertIn("ETag", response)
+        # the aggregate of the validators, without a distinct count as the fields
+        # don't follow a multi-valued relation
+        self.assertEqual(len(queries), len(without_etag) + 1)
+        [aggregate] = [
+            query["sql"]
+            for query in queries
+            if 'MAX("producten_product"' in query["sql"]
+        ]
+        self.assertNotIn("DISTINCT", aggregate)
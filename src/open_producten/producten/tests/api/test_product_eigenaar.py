@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from open_producten.producten.tests.factories import EigenaarFactory, ProductFactory
+from open_producten.producttypen.tests.factories import ProductTypeFactory
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+class TestProductEigenaar(BaseApiTestCase):
+    path = reverse_lazy("product-eigenaar")
+
+    def setUp(self):
+        super().setUp()
+        self.parkeren = ProductTypeFactory.create(code="a-parkeren", naam="Parkeren")
+        self.afval = ProductTypeFactory.create(code="b-afval", naam="Afval")
+
+        self.vergunning = ProductFactory.create(product_type=self.parkeren)
+        EigenaarFactory.create(product=self.vergunning, bsn="111222333")
+        self.container = ProductFactory.create(product_type=self.afval)
+        EigenaarFactory.create(product=self.container, bsn="111222333")
+        EigenaarFactory.create(product=self.container, bsn="999990019")
+
+        self.bedrijf = ProductFactory.create(product_type=self.afval)
+        EigenaarFactory.create(
+            product=self.bedrijf, kvk_nummer="11122333", vestigingsnummer="1"
+        )
+
+    def get(self, params):
+        response = self.client.get(self.path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_read_without_credentials_returns_error(self):
+        response = APIClient().get(self.path, {"bsn": "111222333"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_identifier_is_required(self):
+        for params in ({}, {"vestigingsnummer": "1"}):
+            with self.subTest(params):
+                response = self.client.get(self.path, params)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_vestigingsnummer_requires_kvk_nummer(self):
+        response = self.client.get(
+            self.path, {"klantnummer": "123", "vestigingsnummer": "1"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("vestigingsnummer", response.data)
+
+    def test_grouped_by_product_type(self):
+        data = self.get({"bsn": "111222333"})
+
+        self.assertEqual(
+            [
+                (groep["product_type"]["naam"], [p["id"] for p in groep["producten"]])
+                for groep in data
+            ],
+            [
+                ("Parkeren", [str(self.vergunning.id)]),
+                ("Afval", [str(self.container.id)]),
+            ],
+        )
+        self.assertEqual(data[0]["product_type"]["code"], "a-parkeren")
+        self.assertCountEqual(
+            [eigenaar["bsn"] for eigenaar in data[1]["producten"][0]["eigenaren"]],
+            ["111222333", "999990019"],
+        )
+        self.assertNotIn("product_type", data[1]["producten"][0])
+
+    def test_kvk_nummer(self):
+        data = self.get({"kvk_nummer": "11122333", "vestigingsnummer": "1"})
+
+        self.assertEqual(data[0]["producten"][0]["id"], str(self.bedrijf.id))
+        self.assertEqual(
+            self.get({"kvk_nummer": "11122333", "vestigingsnummer": "2"}), []
+        )
+
+    def test_unknown_eigenaar(self):
+        self.assertEqual(self.get({"bsn": "123456782"}), [])
+
+    @override_settings(EIGENAAR_BSN_HASH_KEY="geheim")
+    def test_bsn_hash(self):
+        for product in (self.vergunning, self.container):
+            for eigenaar in product.eigenaren.all():
+                eigenaar.save()
+
+        data = self.get({"bsn": "111222333"})
+
+        self.assertEqual(len(data), 2)
+
+    @override_settings(EIGENAAR_BSN_HASH_KEY="geheim")
+    def test_bsn_without_hash(self):
+        # before update_eigenaar_bsn_hashes has run
+        data = self.get({"bsn": "111222333"})
+
+        self.assertEqual(len(data), 2)
+
+    def test_constant_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get({"bsn": "111222333"})
+
+        for product_type in ProductTypeFactory.create_batch(3):
+            for _i in range(3):
+                EigenaarFactory.create(
+                    product=ProductFactory.create(product_type=product_type),
+                    bsn="111222333",
+                )
+
+        # the token, the products, the translations and the eigenaren
+        self.assertEqual(len(queries), 4)
+        with self.assertNumQueries(len(queries)):
+            data = self.get({"bsn": "111222333"})
+
+        self.assertEqual(len(data), 5)
+
+    def test_maximum_number_of_products(self):
+        with patch(
+            "open_producten.producten.viewsets.product.MAX_EIGENAAR_PRODUCTEN", 2
+        ):
+            self.assertEqual(len(self.get({"bsn": "111222333"})), 2)
+
+            EigenaarFactory.create(
+                product=ProductFactory.create(product_type=self.afval),
+                bsn="111222333",
+            )
+            response = self.client.get(self.path, {"bsn": "111222333"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("meer dan 2 producten", str(response.data[0]))
@@ -0,0 +1,119 @@
+import csv
+import json
+from io import StringIO
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from freezegun import freeze_time
+from rest_framework import status
+
+from open_producten.producten.tests.factories import EigenaarFactory, ProductFactory
+from open_producten.producttypen.tests.factories import ProductTypeFactory
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+@freeze_time("2024-01-01")
+@override_settings(NOTIFICATIONS_DISABLED=True, PRODUCTEN_API_MAJOR_VERSION=0)
+class TestProductExport(BaseApiTestCase):
+    path = reverse_lazy("product-export")
+
+    def setUp(self):
+        super().setUp()
+        self.product_type = ProductTypeFactory.create(
+            naam="parkeervergunning", code="PV"
+        )
+        self.product = ProductFactory.create(
+            product_type=self.product_type,
+            status="initieel",
+            prijs="20.20",
+            frequentie="eenmalig",
+            dataobject={"kenteken": "AB-123-C"},
+        )
+        self.eigenaar = EigenaarFactory.create(
+            product=self.product, kvk_nummer="12345678"
+        )
+
+    def read_ndjson(self, response):
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_ndjson(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            self.read_ndjson(response),
+            [
+                {
+                    "id": str(self.product.id),
+                    "product_type": {
+                        "id": str(self.product_type.id),
+                        "code": "PV",
+                        "naam": "parkeervergunning",
+                        "uniforme_product_naam": self.product_type.uniforme_product_naam.naam,
+                    },
+                    "status": "initieel",
+                    "gepubliceerd": False,
+                    "start_datum": None,
+                    "eind_datum": None,
+                    "prijs": "20.20",
+                    "frequentie": "eenmalig",
+                    "verbruiksobject": None,
+                    "dataobject": {"kenteken": "AB-123-C"},
+                    "eigenaren": [
+                        {
+                            "id": str(self.eigenaar.id),
+                            "bsn": "",
+                            "kvk_nummer": "12345678",
+                            "vestigingsnummer": "",
+                            "klantnummer": "",
+                        }
+                    ],
+                    "aanmaak_datum": "2024-01-01T00:00:00Z",
+                    "update_datum": "2024-01-01T00:00:00Z",
+                }
+            ],
+        )
+
+    def test_export_csv(self):
+        response = self.client.get(self.path, {"formaat": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.DictReader(StringIO(b"".join(response.streaming_content).decode()))
+        )
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id"], str(self.product.id))
+        self.assertEqual(rows[0]["product_type_naam"], "parkeervergunning")
+        self.assertEqual(rows[0]["dataobject"], '{"kenteken": "AB-123-C"}')
+        self.assertEqual(json.loads(rows[0]["eigenaren"])[0]["kvk_nummer"], "12345678")
+
+    def test_export_uses_product_filters(self):
+        ProductFactory.create(product_type=self.product_type, status="gereed")
+
+        response = self.client.get(self.path, {"status": "initieel"})
+
+        self.assertEqual(
+            [row["id"] for row in self.read_ndjson(response)], [str(self.product.id)]
+        )
+
+    def test_export_with_invalid_formaat_returns_error(self):
+        response = self.client.get(self.path, {"formaat": "xml"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data), ["formaat"])
+
+    def test_export_queries_do_not_depend_on_amount_of_products(self):
+        for _i in range(10):
+            product = ProductFactory.create(product_type=ProductTypeFactory.create())
+            EigenaarFactory.create(product=product, bsn="111222333")
+
+        # token, products, product type translations, eigenaren
+        with self.assertNumQueries(4):
+            response = self.client.get(self.path)
+            rows = self.read_ndjson(response)
+
+        self.assertEqual(len(rows), 11)
@@ -2,13 +2,15 @@ from datetime import date
 from decimal import Decimal
 from uuid import uuid4
 
+from django.test import override_settings
 from django.urls import reverse_lazy
 
 from freezegun import freeze_time
 from rest_framework import status
 
+from open_producten.producten.models import Eigenaar
 from open_producten.producten.models.product import PrijsFrequentieChoices
-from open_producten.producten.tests.factories import ProductFactory
+from open_producten.producten.tests.factories import EigenaarFactory, ProductFactory
 from open_producten.producttypen.models.producttype import ProductStateChoices
 from open_producten.utils.tests.cases import BaseApiTestCase
 
@@ -255,3 +257,187 @@ class TestProductFilters(BaseApiTestCase):
             self.assertEqual(
                 response.data["results"][0]["update_datum"], "2025-06-07T02:00:00+02:00"
             )
+
+
+class TestProductJsonFilters(BaseApiTestCase):
+
+    path = reverse_lazy("product-list")
+
+    def setUp(self):
+        super().setUp()
+        self.auto = ProductFactory.create(
+            dataobject={"kenteken": "AB-123-C", "persoon": {"leeftijd": 42}},
+            verbruiksobject={"uren": 10},
+        )
+        self.fiets = ProductFactory.create(
+            dataobject={"kenteken": "12", "persoon": {"leeftijd": "17"}},
+            verbruiksobject={"uren": 5},
+        )
+        ProductFactory.create()
+
+    def ids(self, params):
+        response = self.client.get(self.path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {result["id"] for result in response.data["results"]}
+
+    def test_dataobject_filter(self):
+        self.assertEqual(
+            self.ids({"dataobject": '{"persoon": {"leeftijd": 42}}'}),
+            {str(self.auto.id)},
+        )
+        self.assertEqual(self.ids({"dataobject": '{"kenteken": "XX"}'}), set())
+
+    def test_dataobject_filter_with_invalid_json(self):
+        response = self.client.get(self.path, {"dataobject": "{kenteken"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("dataobject", response.data)
+
+    def test_verbruiksobject_filter(self):
+        self.assertEqual(
+            self.ids({"verbruiksobject": '{"uren": 5}'}), {str(self.fiets.id)}
+        )
+
+    def test_dataobject_attr_exact(self):
+        self.assertEqual(
+            self.ids({"dataobject_attr": "kenteken__exact__AB-123-C"}),
+            {str(self.auto.id)},
+        )
+        self.assertEqual(
+            self.ids({"dataobject_attr": "persoon__leeftijd__exact__42"}),
+            {str(self.auto.id)},
+        )
+
+    def test_dataobject_attr_exact_matches_numbers_and_strings(self):
+        self.assertEqual(
+            self.ids({"dataobject_attr": "persoon__leeftijd__exact__17"}),
+            {str(self.fiets.id)},
+        )
+        self.assertEqual(
+            self.ids({"dataobject_attr": "kenteken__exact__12"}), {str(self.fiets.id)}
+        )
+
+    def test_dataobject_attr_range(self):
+        with self.subTest("numbers"):
+            self.assertEqual(
+                self.ids({"dataobject_attr": "persoon__leeftijd__gte__18"}),
+                {str(self.auto.id)},
+            )
+            # the string "17" is not compared with a number
+            self.assertEqual(
+                self.ids({"dataobject_attr": "persoon__leeftijd__lt__100"}),
+                {str(self.auto.id)},
+            )
+
+        with self.subTest("strings"):
+            self.assertEqual(
+                self.ids({"dataobject_attr": "kenteken__gt__AA"}),
+                {str(self.auto.id)},
+            )
+            self.assertEqual(
+                self.ids({"dataobject_attr": "persoon__leeftijd__lte__2"}),
+                set(),
+            )
+            self.assertEqual(
+                self.ids({"dataobject_attr": "persoon__leeftijd__lte__2x"}),
+                {str(self.fiets.id)},
+            )
+
+    def test_multiple_dataobject_attrs(self):
+        self.assertEqual(
+            self.ids(
+                {
+                    "dataobject_attr": [
+                        "kenteken__exact__AB-123-C",
+                        "persoon__leeftijd__lt__40",
+                    ]
+                }
+            ),
+            set(),
+        )
+
+    def test_verbruiksobject_attr(self):
+        self.assertEqual(
+            self.ids({"verbruiksobject_attr": "uren__gt__5"}), {str(self.auto.id)}
+        )
+
+    def test_attr_with_invalid_format(self):
+        for value in ("kenteken", "kenteken__AB", "kenteken__bevat__AB", "__exact__a"):
+            with self.subTest(value):
+                response = self.client.get(self.path, {"dataobject_attr": value})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(
+            self.path, {"dataobject_attr": ["kenteken", "kenteken__exact__AB"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestProductEigenaarFilters(BaseApiTestCase):
+
+    path = reverse_lazy("product-list")
+
+    def setUp(self):
+        super().setUp()
+        self.persoon = ProductFactory.create()
+        EigenaarFactory.create(product=self.persoon, bsn="111222333")
+        EigenaarFactory.create(product=self.persoon, klantnummer="123")
+        self.bedrijf = ProductFactory.create()
+        EigenaarFactory.create(
+            product=self.bedrijf, kvk_nummer="11122333", vestigingsnummer="1"
+        )
+        EigenaarFactory.create(product=ProductFactory.create(), bsn="999990019")
+
+    def ids(self, params):
+        response = self.client.get(self.path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result["id"] for result in response.data["results"]]
+
+    def test_bsn_filter(self):
+        self.assertEqual(
+            self.ids({"eigenaren__bsn": "111222333"}), [str(self.persoon.id)]
+        )
+
+    @override_settings(EIGENAAR_BSN_HASH_KEY="geheim")
+    def test_bsn_filter_with_hash(self):
+        # eigenaren without a hash (update_eigenaar_bsn_hashes has not run yet) are
+        # found by their bsn
+        self.assertEqual(
+            self.ids({"eigenaren__bsn": "111222333"}), [str(self.persoon.id)]
+        )
+
+        for eigenaar in Eigenaar.objects.all():
+            eigenaar.save()
+
+        # hashed eigenaren are found by the hash
+        Eigenaar.objects.filter(bsn="111222333").update(bsn="")
+        self.assertEqual(
+            self.ids({"eigenaren__bsn": "111222333"}), [str(self.persoon.id)]
+        )
+        self.assertEqual(self.ids({"eigenaren__bsn": "123456782"}), [])
+
+    def test_kvk_nummer_filter(self):
+        self.assertEqual(
+            self.ids({"eigenaren__kvk_nummer": "11122333"}), [str(self.bedrijf.id)]
+        )
+        self.assertEqual(
+            self.ids(
+                {
+                    "eigenaren__kvk_nummer": "11122333",
+                    "eigenaren__vestigingsnummer": "2",
+                }
+            ),
+            [],
+        )
+
+    def test_klantnummer_filter(self):
+        self.assertEqual(
+            self.ids({"eigenaren__klantnummer": "123"}), [str(self.persoon.id)]
+        )
+
+    def test_product_with_multiple_matching_eigenaren_is_returned_once(self):
+        EigenaarFactory.create(product=self.persoon, bsn="111222333")
+
+        self.assertEqual(
+            self.ids({"eigenaren__bsn": "111222333"}), [str(self.persoon.id)]
+        )
@@ -0,0 +1,118 @@
+import base64
+import datetime
+import json
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from freezegun import freeze_time
+from rest_framework import status
+
+from open_producten.producten.models import Product
+from open_producten.producten.tests.factories import ProductFactory
+from open_producten.producttypen.tests.factories import ProductTypeFactory
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+@override_settings(NOTIFICATIONS_DISABLED=True, PRODUCTEN_API_MAJOR_VERSION=0)
+class TestProductCursorPagination(BaseApiTestCase):
+    path = reverse_lazy("product-list")
+
+    def setUp(self):
+        super().setUp()
+        product_type = ProductTypeFactory.create()
+
+        # two products share an aanmaak_datum to check the id tie breaker
+        self.products = []
+        for day in (1, 2, 2, 3, 4):
+            with freeze_time(datetime.datetime(2024, 1, day)):
+                self.products.append(ProductFactory.create(product_type=product_type))
+        self.products.sort(key=lambda product: (product.aanmaak_datum, product.id))
+
+    def get_ids(self, response):
+        return [product["id"] for product in response.data["results"]]
+
+    def expected_ids(self, products):
+        return [str(product.id) for product in products]
+
+    def test_pages_forward_and_backward(self):
+        response = self.client.get(self.path, {"paginatie": "cursor", "page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[:2]))
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[2:4]))
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[4:]))
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[2:4]))
+
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[:2]))
+        self.assertIsNone(response.data["previous"])
+
+    def test_pages_on_update_datum(self):
+        with freeze_time(datetime.datetime(2024, 2, 1)):
+            self.products[0].save()
+
+        response = self.client.get(
+            self.path,
+            {"paginatie": "cursor", "sortering": "update_datum", "page_size": 4},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[1:]))
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.get_ids(response), self.expected_ids(self.products[:1]))
+
+    def test_does_not_count(self):
+        # token & page
+        with self.assertNumQueries(2):
+            self.client.get(
+                self.path, {"paginatie": "cursor", "page_size": 1, "status": "actief"}
+            )
+
+    def test_page_number_pagination_is_default(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], Product.objects.count())
+
+    def test_invalid_cursor_returns_error(self):
+        response = self.client.get(self.path, {"paginatie": "cursor", "cursor": "abc"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_with_invalid_id_returns_error(self):
+        for value in ("nope", 1, None):
+            with self.subTest(value):
+                cursor = base64.urlsafe_b64encode(
+                    json.dumps(
+                        {
+                            "f": "aanmaak_datum",
+                            "v": "2024-01-01T00:00:00",
+                            "i": value,
+                            "r": False,
+                        }
+                    ).encode()
+                ).decode()
+
+                response = self.client.get(
+                    self.path, {"paginatie": "cursor", "cursor": cursor}
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_sortering_returns_error(self):
+        response = self.client.get(
+            self.path, {"paginatie": "cursor", "sortering": "status"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data), ["sortering"])
@@ -0,0 +1,21 @@
+from django.db import connection, models
+
+from open_producten.producten.json_indexes import get_existing_json_indexes
+from open_producten.producten.models import Product
+
+
+class RemoveJsonIndexesMixin:
+    """
+    Remove the expression indexes that ``sync_json_indexes`` created in a
+    ``TransactionTestCase``. Flushing the database removes the json schemas but not
+    the indexes, which would otherwise be left behind for the next tests and for
+    test runs with ``--keepdb``.
+    """
+
+    def tearDown(self):
+        with connection.schema_editor() as schema_editor:
+            for name in get_existing_json_indexes():
+                schema_editor.remove_index(
+                    Product, models.Index(fields=["pk"], name=name)
+                )
+        super().tearDown()
@@ -0,0 +1,95 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+from open_producten.producten.dataset import get_bsn
+from open_producten.producten.models import Eigenaar, Product
+from open_producten.producten.models.validators import validate_bsn
+from open_producten.producten.tests.cases import RemoveJsonIndexesMixin
+from open_producten.producttypen.models import (
+    ContentElement,
+    ContentLabel,
+    JsonSchema,
+    Prijs,
+    ProductType,
+    ProductTypeZoekIndex,
+    Thema,
+    UniformeProductNaam,
+)
+
+
+class TestGenerateDataset(RemoveJsonIndexesMixin, TransactionTestCase):
+    def generate(self, seed=1):
+        call_command(
+            "generate_dataset",
+            seed=seed,
+            product_typen=20,
+            producten=500,
+            stdout=StringIO(),
+        )
+
+    def test_generate_dataset(self):
+        self.generate()
+
+        self.assertEqual(ProductType.objects.count(), 20)
+        self.assertEqual(ProductType._parler_meta.root_model.objects.count(), 40)
+        self.assertEqual(ProductTypeZoekIndex.objects.count(), 40)
+        self.assertEqual(ContentElement.objects.count(), 60)
+        self.assertTrue(Prijs.objects.exists())
+        # a hoofd thema with 4 sub thema's with 3 sub thema's each
+        self.assertEqual(Thema.objects.count(), 17)
+        self.assertEqual(len(Thema.objects.boom()), 1)
+
+        self.assertEqual(Product.objects.count(), 500)
+        self.assertGreaterEqual(Eigenaar.objects.count(), 500)
+        self.assertTrue(Product.objects.filter(dataobject__has_key="kenteken").exists())
+
+        # the eigenaren have multiple producten
+        bsn = Eigenaar.objects.exclude(bsn="").values_list("bsn", flat=True)[0]
+        self.assertGreater(Product.objects.filter(eigenaren__bsn=bsn).count(), 1)
+
+    def test_reproducible(self):
+        def dataset():
+            return (
+                list(ProductType.objects.values_list("id", "code", "keywords")),
+                list(Product.objects.values_list("id", "product_type", "prijs")),
+                list(Eigenaar.objects.values_list("id", "bsn", "kvk_nummer")),
+            )
+
+        self.generate()
+        expected = dataset()
+
+        with connection.cursor() as cursor:
+            tables = ", ".join(
+                model._meta.db_table
+                for model in (
+                    Product,
+                    ProductType,
+                    Thema,
+                    UniformeProductNaam,
+                    JsonSchema,
+                    ContentLabel,
+                )
+            )
+            cursor.execute(f"TRUNCATE {tables} CASCADE")
+        self.generate()
+
+        self.assertEqual(dataset(), expected)
+
+    def test_already_generated(self):
+        self.generate()
+
+        with self.assertRaises(CommandError):
+            self.generate()
+
+        self.generate(seed=2)
+        self.assertEqual(ProductType.objects.count(), 40)
+
+    def test_get_bsn(self):
+        bsns = {get_bsn(nummer) for nummer in range(1000)}
+
+        self.assertEqual(len(bsns), 1000)
+        for bsn in bsns:
+            validate_bsn(bsn)
@@ -1,8 +1,23 @@
+import hashlib
+import hmac
+from decimal import Decimal
+from io import StringIO
+
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
 from django.utils.translation import gettext as _
 
+from open_producten.producten.models import Eigenaar, Product
+from open_producten.producten.models.eigenaar import get_bsn_hash
+from open_producten.producten.models.product import PrijsFrequentieChoices
 from open_producten.producten.tests.factories import EigenaarFactory, ProductFactory
+from open_producten.producttypen.tests.factories import ProductTypeFactory
+from open_producten.utils.filters import filter_exists
+
+# large enough for the planner to prefer an index over a sequential scan
+EIGENAREN_AANTAL = 3000
 
 
 class TestEigenaar(TestCase):
@@ -105,3 +120,83 @@ class TestEigenaar(TestCase):
                 kvk_nummer="12345678", vestigingsnummer="123"
             )
             self.assertEqual(str(eigenaar), "KVK 12345678 vestigingsnummer 123")
+
+
+class TestEigenaarBsnHash(TestCase):
+    def test_no_hash_without_key(self):
+        eigenaar = EigenaarFactory.create(bsn="111222333")
+
+        self.assertEqual(eigenaar.bsn_hash, "")
+
+    @override_settings(EIGENAAR_BSN_HASH_KEY="geheim")
+    def test_hash_with_key(self):
+        eigenaar = EigenaarFactory.create(bsn="111222333")
+
+        self.assertEqual(
+            eigenaar.bsn_hash,
+            hmac.new(b"geheim", b"111222333", hashlib.sha256).hexdigest(),
+        )
+        self.assertEqual(EigenaarFactory.create(klantnummer="123").bsn_hash, "")
+
+        with override_settings(EIGENAAR_BSN_HASH_KEY="anders"):
+            self.assertNotEqual(get_bsn_hash("111222333"), eigenaar.bsn_hash)
+
+    def test_update_eigenaar_bsn_hashes(self):
+        eigenaar = EigenaarFactory.create(bsn="111222333")
+        EigenaarFactory.create(klantnummer="123")
+        out = StringIO()
+
+        with override_settings(EIGENAAR_BSN_HASH_KEY="geheim"):
+            call_command("update_eigenaar_bsn_hashes", stdout=out)
+
+            eigenaar.refresh_from_db()
+            self.assertEqual(eigenaar.bsn_hash, get_bsn_hash("111222333"))
+            self.assertEqual(out.getvalue(), "Updated the bsn hash of 1 eigenaren.\n")
+
+        # the hashes are removed when the key is no longer configured
+        call_command("update_eigenaar_bsn_hashes", stdout=StringIO())
+
+        eigenaar.refresh_from_db()
+        self.assertEqual(eigenaar.bsn_hash, "")
+
+
+class TestEigenaarIndexes(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        product_type = ProductTypeFactory.create()
+        producten = Product.objects.bulk_create(
+            Product(
+                product_type=product_type,
+                prijs=Decimal("10"),
+                frequentie=PrijsFrequentieChoices.EENMALIG,
+            )
+            for _i in range(EIGENAREN_AANTAL)
+        )
+        Eigenaar.objects.bulk_create(
+            (
+                Eigenaar(product=product, bsn=f"{i:09}", bsn_hash=f"{i:064}")
+                if i % 3 == 0
+                else (
+                    Eigenaar(product=product, kvk_nummer=f"{i:08}")
+                    if i % 3 == 1
+                    else Eigenaar(product=product, klantnummer=str(i))
+                )
+            )
+            for i, product in enumerate(producten)
+        )
+        with connection.cursor() as cursor:
+            for model in (Product, Eigenaar):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def test_filters_use_indexes(self):
+        for lookups, index in (
+            ({"eigenaren__bsn": f"{3:09}"}, "eigenaar_bsn_idx"),
+            ({"eigenaren__bsn_hash": f"{3:064}"}, "eigenaar_bsn_hash_idx"),
+            ({"eigenaren__kvk_nummer": f"{4:08}"}, "eigenaar_kvk_nummer_idx"),
+            ({"eigenaren__klantnummer": "5"}, "eigenaar_klantnummer_idx"),
+        ):
+            with self.subTest(index):
+                queryset = filter_exists(Product.objects.all(), **lookups)
+
+                self.assertIn(index, queryset.explain())
+                self.assertEqual(queryset.count(), 1)
@@ -0,0 +1,63 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from open_producten.producttypen.tests.factories import ProductTypeFactory
+
+from .factories import ProductFactory
+
+
+class TestExportProducten(TestCase):
+    def setUp(self):
+        product_type = ProductTypeFactory.create(naam="parkeervergunning")
+        product_type.set_current_language("en")
+        product_type.naam = "parking permit"
+        product_type.save()
+
+        self.actief = ProductFactory.create(product_type=product_type, status="actief")
+        self.gereed = ProductFactory.create(product_type=product_type, status="gereed")
+
+    def call_command(self, *args):
+        out = StringIO()
+        call_command("export_producten", *args, stdout=out)
+        return out.getvalue()
+
+    def test_export_to_stdout(self):
+        rows = [json.loads(line) for line in self.call_command().splitlines()]
+
+        self.assertEqual(
+            {row["id"] for row in rows}, {str(self.actief.id), str(self.gereed.id)}
+        )
+        self.assertEqual(rows[0]["product_type"]["naam"], "parkeervergunning")
+
+    def test_export_with_filter_and_taal(self):
+        rows = [
+            json.loads(line)
+            for line in self.call_command(
+                "--filter", "status=actief", "--taal", "en"
+            ).splitlines()
+        ]
+
+        self.assertEqual([row["id"] for row in rows], [str(self.actief.id)])
+        self.assertEqual(rows[0]["product_type"]["naam"], "parking permit")
+
+    def test_export_csv_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "producten.csv"
+            self.call_command("--formaat", "csv", "--output", str(path))
+
+            lines = path.read_text().splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("id,product_type_id"))
+
+    def test_export_with_invalid_filter(self):
+        with self.assertRaises(CommandError):
+            self.call_command("--filter", "status")
+
+        with self.assertRaises(CommandError):
+            self.call_command("--filter", "prijs=abc")
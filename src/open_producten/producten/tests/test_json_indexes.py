@@ -0,0 +1,136 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+
+from open_producten.producttypen.tests.factories import (
+    JsonSchemaFactory,
+    ProductTypeFactory,
+)
+from open_producten.utils.filters import get_json_attr_filter
+
+from ..json_indexes import (
+    get_existing_json_indexes,
+    get_json_index_name,
+    get_json_indexes,
+    sync_json_indexes,
+)
+from ..models import Product
+from ..models.product import PrijsFrequentieChoices
+
+# large enough for the planner to prefer an index over a sequential scan
+PRODUCTEN_AANTAL = 2000
+
+
+class TestJsonIndexes(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataobject_schema = JsonSchemaFactory.create(
+            schema={}, index_paden=["kenteken", "persoon__leeftijd"]
+        )
+        cls.verbruiksobject_schema = JsonSchemaFactory.create(
+            schema={}, index_paden=["uren"]
+        )
+        # not used by a product type
+        JsonSchemaFactory.create(schema={}, index_paden=["ongebruikt"])
+
+        cls.product_type = ProductTypeFactory.create(
+            dataobject_schema=cls.dataobject_schema,
+            verbruiksobject_schema=cls.verbruiksobject_schema,
+        )
+
+    def test_get_json_indexes(self):
+        self.assertEqual(
+            set(get_json_indexes()),
+            {
+                get_json_index_name("dataobject", "kenteken"),
+                get_json_index_name("dataobject", "persoon__leeftijd"),
+                get_json_index_name("verbruiksobject", "uren"),
+            },
+        )
+
+    def test_sync_json_indexes(self):
+        created, removed = sync_json_indexes()
+
+        self.assertEqual(created, sorted(get_json_indexes()))
+        self.assertEqual(removed, [])
+        self.assertEqual(get_existing_json_indexes(), {name: True for name in created})
+
+        with self.subTest("nothing changed"):
+            self.assertEqual(sync_json_indexes(), ([], []))
+
+        with self.subTest("pad removed"):
+            self.dataobject_schema.index_paden = ["kenteken"]
+            self.dataobject_schema.save()
+
+            self.assertEqual(
+                sync_json_indexes(),
+                ([], [get_json_index_name("dataobject", "persoon__leeftijd")]),
+            )
+
+    def test_filters_use_indexes(self):
+        sync_json_indexes()
+        Product.objects.bulk_create(
+            Product(
+                product_type=self.product_type,
+                prijs=Decimal("10"),
+                frequentie=PrijsFrequentieChoices.EENMALIG,
+                dataobject={"kenteken": f"K-{i}", "persoon": {"leeftijd": i % 100}},
+                verbruiksobject={"uren": i},
+            )
+            for i in range(PRODUCTEN_AANTAL)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Product._meta.db_table}")
+            # the rows are added to the pending list of the gin indexes, which is
+            # merged into the index by (auto)vacuum
+            for index in ("product_dataobject_idx", "product_verbruiksobject_idx"):
+                cursor.execute("SELECT gin_clean_pending_list(%s::regclass)", [index])
+
+        for field_name, value, index in (
+            ("dataobject", "kenteken__exact__K-10", "product_dataobject_idx"),
+            (
+                "dataobject",
+                "persoon__leeftijd__gte__99",
+                get_json_index_name("dataobject", "persoon__leeftijd"),
+            ),
+            (
+                "dataobject",
+                "kenteken__lt__K-100",
+                get_json_index_name("dataobject", "kenteken"),
+            ),
+            (
+                "verbruiksobject",
+                "uren__lt__10",
+                get_json_index_name("verbruiksobject", "uren"),
+            ),
+        ):
+            with self.subTest(value):
+                queryset = Product.objects.filter(
+                    get_json_attr_filter(field_name, value)
+                )
+
+                self.assertIn(index, queryset.explain())
+
+        self.assertEqual(
+            Product.objects.filter(
+                get_json_attr_filter("dataobject", "persoon__leeftijd__gte__99")
+            ).count(),
+            20,
+        )
+
+    @patch("open_producten.producten.tasks.synchronise_json_indexes.delay")
+    def test_changes_schedule_sync(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dataobject_schema.save()
+        self.assertEqual(mock_delay.call_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product_type.save()
+        self.assertEqual(mock_delay.call_count, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductTypeFactory.create()
+            JsonSchemaFactory.create(schema={})
+        self.assertEqual(mock_delay.call_count, 2)
@@ -9,12 +9,15 @@ from freezegun import freeze_time
 
 from open_producten.producttypen.tests.factories import ProductTypeFactory
 
+from ...logging.models import TimelineLogProxy
 from ...producttypen.models.producttype import ProductStateChoices
+from ..models import Product
 from ..models.validators import (
     validate_product_eind_datum,
     validate_product_start_datum,
     validate_product_status,
 )
+from ..tasks import set_product_states
 from .factories import ProductFactory
 
 
@@ -169,6 +172,88 @@ class TestProductStateTask(TestCase):
                 mock_audit_automation_update.assert_not_called()
 
 
+@freeze_time("2024-1-1")
+class TestSetProductStatesTask(TestCase):
+    def setUp(self):
+        self.product_type = ProductTypeFactory.create(
+            toegestane_statussen=["actief", "verlopen"]
+        )
+
+    def _create_product(self, **kwargs):
+        # bypass Product.save so the product is still waiting for its transition
+        product = ProductFactory.create(product_type=self.product_type)
+        Product.objects.filter(pk=product.pk).update(**kwargs)
+        product.refresh_from_db()
+        return product
+
+    def test_products_are_set_to_actief_and_verlopen(self):
+        to_activate = self._create_product(
+            status="gereed", start_datum=date(2023, 12, 1)
+        )
+        to_expire = self._create_product(status="actief", eind_datum=date(2024, 1, 1))
+        untouched = self._create_product(status="gereed", start_datum=date(2024, 2, 1))
+
+        set_product_states()
+
+        to_activate.refresh_from_db()
+        to_expire.refresh_from_db()
+        self.assertEqual(to_activate.status, "actief")
+        self.assertEqual(to_expire.status, "verlopen")
+
+        update_datum = untouched.update_datum
+        untouched.refresh_from_db()
+        self.assertEqual(untouched.status, "gereed")
+        self.assertEqual(untouched.update_datum, update_datum)
+
+    def test_product_is_activated_and_expired_in_one_run(self):
+        product = self._create_product(
+            status="initieel",
+            start_datum=date(2023, 1, 1),
+            eind_datum=date(2023, 6, 1),
+        )
+
+        set_product_states()
+
+        product.refresh_from_db()
+        self.assertEqual(product.status, "verlopen")
+        self.assertEqual(
+            list(
+                TimelineLogProxy.objects.filter(object_id=product.pk)
+                .order_by("pk")
+                .values_list("extra_data__remarks", flat=True)
+            ),
+            [
+                "Status gezet naar ACTIEF vanwege de start datum.",
+                "Status gezet naar VERLOPEN vanwege de eind datum.",
+            ],
+        )
+
+    @patch("open_producten.producten.tasks.CHUNK_SIZE", 2)
+    def test_products_are_updated_in_chunks(self):
+        for _i in range(5):
+            self._create_product(status="initieel", start_datum=date(2023, 1, 1))
+
+        set_product_states()
+
+        self.assertEqual(Product.objects.filter(status="actief").count(), 5)
+        logs = TimelineLogProxy.objects.all()
+        self.assertEqual(logs.count(), 5)
+        self.assertEqual(
+            logs[0].extra_data["acting_user"],
+            {"identifier": "-", "display_name": "Automation"},
+        )
+
+    @patch("open_producten.producten.tasks.advisory_lock")
+    def test_task_is_skipped_when_already_running(self, advisory_lock_mock):
+        advisory_lock_mock.return_value.__enter__.return_value = False
+        product = self._create_product(status="initieel", start_datum=date(2023, 1, 1))
+
+        set_product_states()
+
+        product.refresh_from_db()
+        self.assertEqual(product.status, "initieel")
+
+
 class TestProductValidateMethods(TestCase):
     def test_validate_product_start_datum_raises_when_start_datum_is_set_and_actief_not_in_toegestane_statussen(
         self,
@@ -1,16 +1,77 @@
+from django.conf import settings
+from django.core.validators import RegexValidator
+from django.db import IntegrityError, models, transaction
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
 import django_filters
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from notifications_api_common.tasks import send_notification
 from notifications_api_common.viewsets import NotificationViewSetMixin
+from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.response import Response
 
-from open_producten.logging.api_tools import AuditTrailViewSetMixin
+from open_producten.logging.api_tools import (
+    AuditTrailViewSetMixin,
+    extract_audit_parameters,
+)
+from open_producten.logging.serializing import serialize_instance
+from open_producten.logging.service import audit_api_create_bulk, audit_api_update_bulk
+from open_producten.producten.bulk import (
+    MAX_BULK_SIZE,
+    BulkConflict,
+    BulkResultaat,
+    ProductBulkImport,
+)
+from open_producten.producten.export import CONTENT_TYPES, ExportFormat, export_products
 from open_producten.producten.kanalen import KANAAL_PRODUCTEN
 from open_producten.producten.models import Product
-from open_producten.producten.serializers.product import ProductSerializer
-from open_producten.utils.filters import FilterSet, TranslationFilter
+from open_producten.producten.models.eigenaar import get_bsn_hash
+from open_producten.producten.serializers.product import (
+    BulkProductSerializer,
+    EigenaarProductenParametersSerializer,
+    EigenaarProductenSerializer,
+    ProductBulkResultaatSerializer,
+    ProductSerializer,
+)
+from open_producten.utils.filters import (
+    JSON_ATTR_REGEX,
+    FilterSet,
+    JsonFilter,
+    TranslationFilter,
+    filter_exists,
+    get_json_attr_filter,
+)
+from open_producten.utils.pagination import OptionalKeysetPagination
 from open_producten.utils.views import OrderedModelViewSet
 
+MAX_EIGENAAR_PRODUCTEN = 500
+
+
+def get_eigenaar_filter(**identificatie: str) -> models.Q:
+    """
+    Return the filter of the products with an eigenaar that has all given
+    identifiers. A bsn is looked up by its keyed hash when ``EIGENAAR_BSN_HASH_KEY``
+    is configured, eigenaren without a hash yet (before
+    ``update_eigenaar_bsn_hashes`` has run) are still found by their bsn.
+    """
+    lookups = {
+        f"eigenaren__{name}": value for name, value in identificatie.items() if value
+    }
+    bsn = lookups.pop("eigenaren__bsn", None)
+    if bsn and settings.EIGENAAR_BSN_HASH_KEY:
+        return models.Q(**lookups) & (
+            models.Q(eigenaren__bsn_hash=get_bsn_hash(bsn))
+            | models.Q(eigenaren__bsn_hash="", eigenaren__bsn=bsn)
+        )
+    if bsn:
+        lookups["eigenaren__bsn"] = bsn
+    return models.Q(**lookups)
+
 
 class ProductFilterSet(FilterSet):
     uniforme_product_naam = django_filters.CharFilter(
@@ -25,6 +86,54 @@ class ProductFilterSet(FilterSet):
         help_text=_("Naam van het product type."),
     )
 
+    dataobject = JsonFilter(
+        help_text=_(
+            'Producten waarvan het dataobject het meegegeven json object bevat, bijvoorbeeld `{"kenteken": "AB-123-C"}`.'
+        ),
+    )
+
+    dataobject_attr = django_filters.CharFilter(
+        method="filter_by_json_attr",
+        validators=[RegexValidator(JSON_ATTR_REGEX)],
+        help_text=_(
+            "Filter op een attribuut van het dataobject met het formaat `pad__operator__waarde`, bijvoorbeeld `kenteken__exact__AB-123-C` of `persoon__leeftijd__gte__18`. Geneste attributen worden gescheiden door `__`. De operatoren zijn `exact`, `gt`, `gte`, `lt` en `lte`, waarbij getallen als getal en andere waarden als tekst worden vergeleken. Kan meerdere keren worden meegegeven."
+        ),
+    )
+
+    verbruiksobject = JsonFilter(
+        help_text=_(
+            'Producten waarvan het verbruiksobject het meegegeven json object bevat, bijvoorbeeld `{"uren": 10}`.'
+        ),
+    )
+
+    verbruiksobject_attr = django_filters.CharFilter(
+        method="filter_by_json_attr",
+        validators=[RegexValidator(JSON_ATTR_REGEX)],
+        help_text=_(
+            "Filter op een attribuut van het verbruiksobject met het formaat `pad__operator__waarde`, bijvoorbeeld `uren__gte__10`. Geneste attributen worden gescheiden door `__`. De operatoren zijn `exact`, `gt`, `gte`, `lt` en `lte`, waarbij getallen als getal en andere waarden als tekst worden vergeleken. Kan meerdere keren worden meegegeven."
+        ),
+    )
+
+    eigenaren__bsn = django_filters.CharFilter(
+        method="filter_by_bsn",
+        help_text=_("Producten met een eigenaar met dit BSN."),
+    )
+
+    def filter_by_bsn(self, queryset, name, value):
+        return filter_exists(queryset, get_eigenaar_filter(bsn=value))
+
+    def filter_by_json_attr(self, queryset, name, value):
+        field_name = name.removesuffix("_attr")
+
+        for val in self.request.GET.getlist(name):
+            try:
+                queryset = queryset.filter(get_json_attr_filter(field_name, val))
+            except ValueError:
+                raise ParseError(
+                    _("Invalid format for {name} query parameter.").format(name=name)
+                )
+        return queryset
+
     class Meta:
         model = Product
         fields = {
@@ -38,6 +147,9 @@ class ProductFilterSet(FilterSet):
             "eind_datum": ["exact", "gte", "lte"],
             "aanmaak_datum": ["exact", "gte", "lte"],
             "update_datum": ["exact", "gte", "lte"],
+            "eigenaren__kvk_nummer": ["exact"],
+            "eigenaren__vestigingsnummer": ["exact"],
+            "eigenaren__klantnummer": ["exact"],
         }
 
 
@@ -69,4 +181,236 @@ class ProductViewSet(
     lookup_url_field = "id"
     serializer_class = ProductSerializer
     filterset_class = ProductFilterSet
+    pagination_class = OptionalKeysetPagination
     notifications_kanaal = KANAAL_PRODUCTEN
+    conditional_get_fields = ("update_datum", "product_type__update_datum")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            # with_api_relations prefetches the product type translations of the
+            # active language (and its fallbacks) only, which is all these responses
+            # show. The notifications of the write actions resolve the product from
+            # its url instead of this queryset, so the prefetches would not be used
+            # there.
+            return queryset.with_api_relations()
+        return queryset
+
+    @extend_schema(
+        "producten_export",
+        summary="Alle PRODUCTEN exporteren.",
+        description=(
+            "Streamt alle PRODUCTEN als NDJSON (een json object per regel) of CSV. "
+            "Deze lijst kan gefilterd worden met dezelfde query-string parameters als de lijst van PRODUCTEN."
+        ),
+        filters=True,
+        parameters=[
+            OpenApiParameter(
+                name="formaat",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=ExportFormat.values,
+                default=ExportFormat.NDJSON,
+                description="Het formaat van de export.",
+            ),
+        ],
+        responses={
+            (200, CONTENT_TYPES[ExportFormat.NDJSON]): OpenApiTypes.STR,
+            (200, CONTENT_TYPES[ExportFormat.CSV]): OpenApiTypes.STR,
+        },
+    )
+    @action(detail=False, url_path="export", pagination_class=None)
+    def export(self, request):
+        export_format = request.query_params.get("formaat", ExportFormat.NDJSON)
+        if export_format not in ExportFormat.values:
+            raise ValidationError(
+                {
+                    "formaat": _("Ongeldig formaat, kies uit: {formats}.").format(
+                        formats=", ".join(ExportFormat.values)
+                    )
+                }
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            export_products(queryset, export_format, request.LANGUAGE_CODE),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="producten.{export_format}"'
+        )
+        return response
+
+    @extend_schema(
+        "producten_eigenaar",
+        summary="Alle PRODUCTEN van een eigenaar opvragen, gegroepeerd per PRODUCTTYPE.",
+        description=(
+            "Geeft alle PRODUCTEN met een eigenaar met het meegegeven bsn, kvk nummer "
+            "(en vestigingsnummer) of klantnummer, gegroepeerd per PRODUCTTYPE. Meerdere "
+            "identificaties moeten bij dezelfde eigenaar horen. Een eigenaar met meer dan "
+            "{max} PRODUCTEN geeft een 400, deze PRODUCTEN kunnen gepagineerd worden "
+            "opgevraagd met de filters van de lijst van PRODUCTEN, bijvoorbeeld "
+            "`eigenaren__bsn`."
+        ).format(max=MAX_EIGENAAR_PRODUCTEN),
+        parameters=[EigenaarProductenParametersSerializer],
+        responses=EigenaarProductenSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        serializer_class=EigenaarProductenSerializer,
+        filter_backends=(),
+        pagination_class=None,
+    )
+    def eigenaar(self, request):
+        parameters = EigenaarProductenParametersSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+
+        producten = filter_exists(
+            self.get_queryset(), get_eigenaar_filter(**parameters.validated_data)
+        ).with_api_relations(request.LANGUAGE_CODE)
+        producten = producten.order_by("product_type__code", "-aanmaak_datum", "id")
+
+        # the response is not paginated, fetch one more to detect owners with too many
+        producten = list(producten[: MAX_EIGENAAR_PRODUCTEN + 1])
+        if len(producten) > MAX_EIGENAAR_PRODUCTEN:
+            raise ValidationError(
+                _(
+                    "De eigenaar heeft meer dan {max} producten, vraag deze gepagineerd op "
+                    "met de filters van de lijst van producten."
+                ).format(max=MAX_EIGENAAR_PRODUCTEN)
+            )
+
+        groepen = {}
+        for product in producten:
+            groepen.setdefault(
+                product.product_type_id,
+                {"product_type": product.product_type, "producten": []},
+            )["producten"].append(product)
+
+        serializer = self.get_serializer(list(groepen.values()), many=True)
+        return Response(serializer.data)
+
+    @extend_schema(
+        "producten_bulk",
+        summary="Maak meerdere PRODUCTEN aan of werk ze bij.",
+        description=(
+            "Valideert en slaat maximaal {max} PRODUCTEN in een keer op. Elk product wordt "
+            "afzonderlijk gevalideerd, de resultaten worden per product in dezelfde volgorde "
+            "als het verzoek teruggegeven. Met `upsert=true` worden bestaande PRODUCTEN met "
+            "dezelfde `externe_referentie` bijgewerkt in plaats van als fout teruggegeven. "
+            "Als een ander verzoek gelijktijdig PRODUCTEN met dezelfde `externe_referentie` "
+            "opslaat wordt een 409 teruggegeven, het verzoek kan dan opnieuw worden verstuurd."
+        ).format(max=MAX_BULK_SIZE),
+        parameters=[
+            OpenApiParameter(
+                name="upsert",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                default=False,
+                description="Werk bestaande PRODUCTEN bij op basis van de `externe_referentie`.",
+            ),
+        ],
+        request=BulkProductSerializer(many=True),
+        responses=ProductBulkResultaatSerializer(many=True),
+    )
+    @action(detail=False, methods=["post"], url_path="bulk", pagination_class=None)
+    def bulk(self, request):
+        if not isinstance(request.data, list):
+            raise ParseError(_("Verwacht een lijst met producten."))
+        if not 0 < len(request.data) <= MAX_BULK_SIZE:
+            raise ParseError(
+                _("Een bulk verzoek moet 1 tot {max} producten bevatten.").format(
+                    max=MAX_BULK_SIZE
+                )
+            )
+
+        upsert = request.query_params.get("upsert", "false").lower() in ("true", "1")
+        bulk_import = ProductBulkImport(
+            request.data, self.get_serializer_context(), upsert=upsert
+        )
+        try:
+            data = self._save_bulk(bulk_import)
+        except IntegrityError:
+            # a concurrent request saved products with the same externe_referentie,
+            # the validation reports them per product (or updates them with upsert)
+            try:
+                data = self._save_bulk(bulk_import)
+            except IntegrityError:
+                raise BulkConflict()
+
+        return Response(data)
+
+    def _save_bulk(self, bulk_import: ProductBulkImport) -> list:
+        bulk_import.validate()
+
+        with transaction.atomic():
+            bulk_import.save()
+            models.prefetch_related_objects(
+                [item.product for item in bulk_import.valid_items], "eigenaren"
+            )
+
+            data = ProductBulkResultaatSerializer(
+                [
+                    {
+                        "index": item.index,
+                        "resultaat": item.resultaat,
+                        "product": item.product,
+                        "fouten": item.fouten or None,
+                    }
+                    for item in bulk_import.items
+                ],
+                many=True,
+                context=self.get_serializer_context(),
+            ).data
+
+            self._audit_bulk(bulk_import)
+            self._notify_bulk(data, bulk_import)
+
+        return data
+
+    def _audit_bulk(self, bulk_import: ProductBulkImport):
+        user_id, user_repr, remarks = extract_audit_parameters(self.request)
+        for resultaat, audit in (
+            (BulkResultaat.AANGEMAAKT, audit_api_create_bulk),
+            (BulkResultaat.BIJGEWERKT, audit_api_update_bulk),
+        ):
+            audit(
+                objects=[
+                    (item.product, serialize_instance(item.product))
+                    for item in bulk_import.valid_items
+                    if item.resultaat == resultaat
+                ],
+                user_id=user_id,
+                user_display=user_repr,
+                remarks=remarks,
+            )
+
+    def _notify_bulk(self, data: list[dict], bulk_import: ProductBulkImport):
+        """
+        Send a create or update notification per saved product, like the single
+        product endpoints do, once the transaction is committed.
+        """
+        if get_setting("NOTIFICATIONS_DISABLED") or not bulk_import.valid_items:
+            return
+
+        messages = []
+        for item in bulk_import.valid_items:
+            message = self.construct_message(
+                data[item.index]["product"], instance=item.product
+            )
+            message["actie"] = (
+                "create" if item.resultaat == BulkResultaat.AANGEMAAKT else "update"
+            )
+            messages.append(message)
+
+        if NotificationsConfig.get_client() is None:
+            msg = "Not notifying, Notifications API configuration is broken or absent."
+            if get_setting("NOTIFICATIONS_GUARANTEE_DELIVERY"):
+                raise RuntimeError(msg)
+            return
+
+        def _send():
+            for message in messages:
+                send_notification.delay(message)
+
+        transaction.on_commit(_send)
@@ -7,13 +7,14 @@ from .link import LinkAdmin
 from .prijs import PrijsAdmin
 from .producttype import ProductTypeAdmin
 from .thema import ThemaAdmin
-from .upn import UniformeProductNaamAdmin
+from .upn import UniformeProductNaamAdmin, UplSynchronisatieAdmin
 
 __all__ = [
     "ProductTypeAdmin",
     "BestandAdmin",
     "LinkAdmin",
     "UniformeProductNaamAdmin",
+    "UplSynchronisatieAdmin",
     "PrijsAdmin",
     "ThemaAdmin",
     "ContentLabelAdmin",
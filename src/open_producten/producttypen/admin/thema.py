@@ -61,19 +61,19 @@ class ThemaAdmin(admin.ModelAdmin):
             return reverse("admin:producttypen_producttype_change", args=(instance.id,))
 
         def get_current_product_type_themas(instance):
-            return ", ".join(instance.themas.values_list("naam", flat=True))
-
-        errors = []
-        for product_type in ProductType.objects.filter(themas__in=objs).distinct():
-            if product_type.themas.count() <= objs.count():
-                errors.append(
-                    format_html(
-                        "Product Type <a href='{}'>{}</a> moet aan een minimaal één thema zijn gelinkt. Huidige thema's: {}.",
-                        get_product_type_url(product_type),
-                        product_type,
-                        get_current_product_type_themas(product_type),
-                    )
-                )
+            return ", ".join(thema.naam for thema in instance.themas.all())
+
+        errors = [
+            format_html(
+                "Product Type <a href='{}'>{}</a> moet aan een minimaal één thema zijn gelinkt. Huidige thema's: {}.",
+                get_product_type_url(product_type),
+                product_type,
+                get_current_product_type_themas(product_type),
+            )
+            for product_type in ProductType.objects.without_other_themas(
+                objs
+            ).prefetch_related("translations", "themas")
+        ]
         if errors:
             return [], [], [], errors
         return super().get_deleted_objects(objs, request)
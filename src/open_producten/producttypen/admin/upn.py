@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from ..models import UniformeProductNaam
+from ..models import UniformeProductNaam, UplSynchronisatie
 
 
 @admin.register(UniformeProductNaam)
@@ -17,3 +17,35 @@ class UniformeProductNaamAdmin(admin.ModelAdmin):
 
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+@admin.register(UplSynchronisatie)
+class UplSynchronisatieAdmin(admin.ModelAdmin):
+    list_display = (
+        "gestart_op",
+        "status",
+        "aangemaakt",
+        "gewijzigd",
+        "verwijderd",
+        "duur",
+    )
+    list_filter = ("status", "gestart_op")
+    date_hierarchy = "gestart_op"
+    readonly_fields = (
+        "url",
+        "gestart_op",
+        "duur",
+        "status",
+        "etag",
+        "last_modified",
+        "aangemaakt",
+        "gewijzigd",
+        "verwijderd",
+        "foutmelding",
+    )
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_add_permission(self, request):
+        return False
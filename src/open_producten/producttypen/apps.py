@@ -8,7 +8,10 @@ class ProducttypenConfig(AppConfig):
     name = "open_producten.producttypen"
 
     def ready(self):
+        from .signals import connect_signals
+
         unregister_camelize_filter_extension()
+        connect_signals()
 
 
 def unregister_camelize_filter_extension():
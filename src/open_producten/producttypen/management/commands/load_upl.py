@@ -1,24 +1,20 @@
 import csv
 import os
-from dataclasses import dataclass
-from io import StringIO
+import time
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 
 import requests
 
-from open_producten.producttypen.models import (
-    UniformeProductNaam as UniformProductNaamModel,
+from open_producten.producttypen.upl import (
+    UplError,
+    UplLoader,
+    UplResult,
+    download_upl,
+    read_upl,
 )
 
 
-@dataclass
-class UniformProductName:
-    name: str
-    uri: str
-
-
 def _check_if_csv_extension(path: str):
     _, extension = os.path.splitext(path)
     file_format = extension[1:]
@@ -56,86 +52,58 @@ class Command(BaseCommand):
             raise CommandError("Either --file or --url must be specified.")
 
         self.stdout.write(f"Importing upn from {file if file else url}...")
+        start = time.perf_counter()
 
         try:
             if file:
-                created_count, update_count, removed_count = self._parse_csv_file(file)
+                result = self._parse_csv_file(file)
             else:
-                created_count, update_count, removed_count = self._parse_csv_url(url)
+                result = self._parse_csv_url(url)
         except CommandError:
             raise
+        except UplError as e:
+            raise CommandError(str(e))
         except Exception as e:
             raise CommandError(f"Something went wrong: {str(e)}")
+        result.timings["total"] = time.perf_counter() - start
+
         self.stdout.write(
             "Done\n"
-            f"Created {created_count} product names.\n"
-            f"Updated {update_count} product names.\n"
-            f"{removed_count} product names did not exist in the csv."
+            f"Created {result.created} product names.\n"
+            f"Updated {result.updated} product names.\n"
+            f"{result.removed} product names did not exist in the csv."
+        )
+        self.stdout.write(
+            ", ".join(
+                f"{phase} {result.timings[phase]:.2f}s"
+                for phase in ("reading and upserting", "marking deleted", "total")
+            )
         )
 
-    def _parse_csv_file(self, file: str):
+    def _parse_csv_file(self, file: str) -> UplResult:
         _check_if_csv_extension(file)
 
         with open(file, encoding="utf-8-sig") as f:
             data = csv.DictReader(f)
             return self._load_upl(data)
 
-    def _parse_csv_url(self, url: str):
+    def _parse_csv_url(self, url: str) -> UplResult:
         _check_if_csv_extension(url)
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
+            response = download_upl(url)
         except requests.exceptions.ConnectionError:
             raise CommandError(f"Could not connect to {url}")
         except requests.exceptions.RequestException as e:
             raise CommandError(e)
 
-        content = StringIO(response.text)
-        data = csv.DictReader(content)
-        return self._load_upl(data)
-
-    @transaction.atomic
-    def _load_upl(self, data: csv.DictReader) -> tuple[int, int, int]:
-        created_count = 0
-        updated_count = 0
-        upn_updated_list = []
-        columns = {
-            "uri": "URI",
-            "name": "UniformeProductnaam",
-        }
-
-        if missing_columns := [
-            f"'{key}'" for key in columns.values() if key not in data.fieldnames
-        ]:
-            raise CommandError(
-                f"Column(s) {', '.join(missing_columns)} do not exist in the CSV."
-            )
-
-        for i, row in enumerate(data):
-            uri = row[columns["uri"]]
-            name = row[columns["name"]]
-
-            if not name or not uri:
-                self.stdout.write(
-                    f"Skipping index {i} because of missing column(s) {' or '.join(columns.values())}."
-                )
-                continue
+        with response:
+            return self._load_upl(read_upl(response))
 
-            upn, created = UniformProductNaamModel.objects.update_or_create(
-                uri=uri,
-                defaults={"naam": name, "is_verwijderd": False},
+    def _load_upl(self, data: csv.DictReader) -> UplResult:
+        def on_skip(i: int):
+            self.stdout.write(
+                f"Skipping index {i} because of missing column(s) URI or UniformeProductnaam."
             )
-            upn_updated_list.append(upn.id)
 
-            if created:
-                created_count += 1
-            else:
-                updated_count += 1
-
-        removed_count = UniformProductNaamModel.objects.exclude(
-            id__in=upn_updated_list
-        ).update(
-            is_verwijderd=True,
-        )
-        return created_count, updated_count, removed_count
+        return UplLoader(on_skip=on_skip).load(data)
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "producttypen",
+            "0012_dmnconfig_alter_contentelement_labels_prijsregel_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="producttype",
+            index=models.Index(
+                fields=["aanmaak_datum", "id"], name="producttype_aanmaak_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttype",
+            index=models.Index(
+                fields=["update_datum", "id"], name="producttype_update_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,141 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:47
+
+from django.db import migrations, models
+import hashlib
+import uuid
+
+
+def set_upn_hashes(apps, schema_editor):
+    UniformeProductNaam = apps.get_model("producttypen", "UniformeProductNaam")
+
+    upns = list(UniformeProductNaam.objects.only("naam", "uri"))
+    for upn in upns:
+        upn.hash = hashlib.sha256(f"{upn.uri}\n{upn.naam}".encode()).hexdigest()
+    UniformeProductNaam.objects.bulk_update(upns, ["hash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypen", "0013_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UplSynchronisatie",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "url",
+                    models.URLField(
+                        help_text="De url van de UPL csv.", verbose_name="url"
+                    ),
+                ),
+                (
+                    "gestart_op",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Het moment waarop de synchronisatie is gestart.",
+                        verbose_name="gestart op",
+                    ),
+                ),
+                (
+                    "duur",
+                    models.DurationField(
+                        blank=True,
+                        help_text="De duur van de synchronisatie.",
+                        null=True,
+                        verbose_name="duur",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("gewijzigd", "Gewijzigd"),
+                            ("ongewijzigd", "Ongewijzigd"),
+                            ("mislukt", "Mislukt"),
+                        ],
+                        help_text="De uitkomst van de synchronisatie.",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "etag",
+                    models.CharField(
+                        blank=True,
+                        help_text="De ETag header van de gedownloade UPL.",
+                        max_length=255,
+                        verbose_name="ETag",
+                    ),
+                ),
+                (
+                    "last_modified",
+                    models.CharField(
+                        blank=True,
+                        help_text="De Last-Modified header van de gedownloade UPL.",
+                        max_length=255,
+                        verbose_name="Last-Modified",
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Het aantal aangemaakte uniforme product namen.",
+                        verbose_name="aangemaakt",
+                    ),
+                ),
+                (
+                    "gewijzigd",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Het aantal gewijzigde uniforme product namen.",
+                        verbose_name="gewijzigd",
+                    ),
+                ),
+                (
+                    "verwijderd",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Het aantal uniforme product namen dat niet in de UPL voorkomt.",
+                        verbose_name="verwijderd",
+                    ),
+                ),
+                (
+                    "foutmelding",
+                    models.TextField(
+                        blank=True,
+                        help_text="De fout waardoor de synchronisatie is mislukt.",
+                        verbose_name="foutmelding",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "UPL synchronisatie",
+                "verbose_name_plural": "UPL synchronisaties",
+                "ordering": ("-gestart_op",),
+            },
+        ),
+        migrations.AddField(
+            model_name="uniformeproductnaam",
+            name="hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Hash van de naam en uri, om gewijzigde regels van de UPL te herkennen.",
+                max_length=64,
+                verbose_name="hash",
+            ),
+        ),
+        migrations.RunPython(set_upn_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:03
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+FILL_ZOEK_INDEX = """
+    INSERT INTO producttypen_producttypezoekindex (vertaling_id, zoek_vector)
+    SELECT
+        t.id,
+        setweight(to_tsvector(c.config, t.naam), 'A')
+        || setweight(to_tsvector(c.config, array_to_string(p.keywords, ' ')), 'A')
+        || setweight(to_tsvector(c.config, upn.naam), 'B')
+        || setweight(to_tsvector(c.config, t.samenvatting), 'B')
+        || setweight(to_tsvector(c.config, coalesce((
+            SELECT string_agg(ct.content, ' ' ORDER BY ce."order")
+            FROM producttypen_contentelement ce
+            JOIN producttypen_contentelement_translation ct ON ct.master_id = ce.id
+            WHERE ce.product_type_id = p.id AND ct.language_code = t.language_code
+        ), '')), 'C')
+    FROM producttypen_producttype_translation t
+    JOIN producttypen_producttype p ON p.id = t.master_id
+    JOIN producttypen_uniformeproductnaam upn ON upn.id = p.uniforme_product_naam_id
+    CROSS JOIN LATERAL (
+        SELECT (
+            CASE t.language_code WHEN 'nl' THEN 'dutch' WHEN 'en' THEN 'english'
+            ELSE 'simple' END
+        )::regconfig AS config
+    ) c
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypen", "0014_upn_hash_uplsynchronisatie"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductTypeZoekIndex",
+            fields=[
+                (
+                    "vertaling",
+                    models.OneToOneField(
+                        help_text="De vertaling van het product type.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="zoek_index",
+                        serialize=False,
+                        to="producttypen.producttypetranslation",
+                        verbose_name="vertaling",
+                    ),
+                ),
+                (
+                    "zoek_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        help_text="De naam, samenvatting, keywords, uniforme product naam en content van het product type in de taal van de vertaling.",
+                        verbose_name="zoek vector",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Product type zoekindex",
+                "verbose_name_plural": "Product type zoekindexen",
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["zoek_vector"], name="producttype_zoek_vector_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(FILL_ZOEK_INDEX, migrations.RunSQL.noop),
+    ]
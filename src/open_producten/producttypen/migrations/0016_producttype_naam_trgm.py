@@ -0,0 +1,24 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:11
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypen", "0015_producttypezoekindex"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="producttypetranslation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["naam"],
+                name="producttype_naam_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:16
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypen", "0016_producttype_naam_trgm"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="externecode",
+            index=models.Index(
+                fields=["naam", "code"], name="externecode_naam_code_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="parameter",
+            index=models.Index(
+                fields=["naam", "waarde"], name="parameter_naam_waarde_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["keywords"], name="producttype_keywords_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["toegestane_statussen"], name="producttype_statussen_idx"
+            ),
+        ),
+    ]
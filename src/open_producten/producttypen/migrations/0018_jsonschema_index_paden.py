@@ -0,0 +1,35 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:26
+
+import django.contrib.postgres.fields
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypen", "0017_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jsonschema",
+            name="index_paden",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(
+                    max_length=255,
+                    validators=[
+                        django.core.validators.RegexValidator(
+                            message="Ongeldig pad. Een pad bestaat uit sleutels zonder spaties, geneste sleutels worden gescheiden door `__` (bijvoorbeeld `persoon__leeftijd`).",
+                            regex="^[^\\s_]+(?:_[^\\s_]+)*(?:__[^\\s_]+(?:_[^\\s_]+)*)*$",
+                        )
+                    ],
+                ),
+                blank=True,
+                default=list,
+                help_text="Paden van veelgebruikte attributen waarop een index wordt aangemaakt in de dataobjecten of verbruiksobjecten van de producten die met dit schema worden gevalideerd, zodat filters op deze attributen snel blijven. Geneste attributen worden gescheiden door `__`, bijvoorbeeld `persoon__leeftijd`.",
+                size=None,
+                verbose_name="index paden",
+            ),
+        ),
+    ]
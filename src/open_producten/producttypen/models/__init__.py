@@ -6,18 +6,20 @@ from .jsonschema import JsonSchema
 from .link import Link
 from .parameter import Parameter
 from .prijs import Prijs, PrijsOptie, PrijsRegel
-from .producttype import ProductType
+from .producttype import ProductType, ProductTypeZoekIndex
 from .thema import Thema
-from .upn import UniformeProductNaam
+from .upn import UniformeProductNaam, UplSynchronisatie
 
 __all__ = [
     "UniformeProductNaam",
+    "UplSynchronisatie",
     "Thema",
     "Link",
     "Prijs",
     "PrijsOptie",
     "PrijsRegel",
     "ProductType",
+    "ProductTypeZoekIndex",
     "Bestand",
     "ExterneCode",
     "Parameter",
@@ -33,3 +33,7 @@ class ExterneCode(BaseModel):
         verbose_name = _("externe producttype code")
         verbose_name_plural = _("externe producttype codes")
         unique_together = (("product_type", "naam"),)
+        indexes = [
+            # [naam:code] filter of the product typen
+            models.Index(fields=["naam", "code"], name="externecode_naam_code_idx"),
+        ]
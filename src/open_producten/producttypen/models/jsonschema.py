@@ -1,12 +1,92 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 import jsonschema  # noqa
-from jsonschema import validate
-from jsonschema.exceptions import (
-    SchemaError,
-    ValidationError as JsonSchemaValidationError,
+from jsonschema.exceptions import SchemaError, best_match
+from jsonschema.validators import validator_for
+
+from open_producten.utils.metrics import CACHE_REQUESTS
+from open_producten.utils.validators import validate_json_pad
+
+
+class ValidatorCache:
+    """
+    Process wide LRU cache of compiled json schema validators.
+
+    Entries are keyed by the schema id and a hash of the schema content, so a stale
+    validator is never used, even when a schema is changed by another process. The
+    hash is computed once per loaded schema, see ``JsonSchema.fingerprint``.
+    """
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._validators = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(json_schema: "JsonSchema") -> tuple:
+        return json_schema.pk, json_schema.fingerprint
+
+    def get(self, json_schema: "JsonSchema"):
+        key = self.make_key(json_schema)
+
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                CACHE_REQUESTS.labels(self.name, "hit").inc()
+                return validator
+            self.misses += 1
+        CACHE_REQUESTS.labels(self.name, "miss").inc()
+
+        cls = validator_for(json_schema.schema)
+        cls.check_schema(json_schema.schema)
+        validator = cls(json_schema.schema)
+
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+
+        return validator
+
+    def invalidate(self, pk) -> None:
+        with self._lock:
+            for key in [key for key in self._validators if key[0] == pk]:
+                del self._validators[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._validators),
+                "maxsize": self.maxsize,
+            }
+
+
+validator_cache = ValidatorCache(
+    "json_schema_validators", maxsize=settings.JSON_SCHEMA_VALIDATOR_CACHE_SIZE
 )
 
 
@@ -19,6 +99,16 @@ class JsonSchema(models.Model):
         _("schema"), help_text=_("Het schema waartegen gevalideerd kan worden.")
     )
 
+    index_paden = ArrayField(
+        models.CharField(max_length=255, validators=[validate_json_pad]),
+        verbose_name=_("index paden"),
+        default=list,
+        blank=True,
+        help_text=_(
+            "Paden van veelgebruikte attributen waarop een index wordt aangemaakt in de dataobjecten of verbruiksobjecten van de producten die met dit schema worden gevalideerd, zodat filters op deze attributen snel blijven. Geneste attributen worden gescheiden door `__`, bijvoorbeeld `persoon__leeftijd`."
+        ),
+    )
+
     latest_validator = jsonschema.validators._LATEST_VERSION
 
     class Meta:
@@ -28,6 +118,24 @@ class JsonSchema(models.Model):
     def __str__(self):
         return self.naam
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Hash of the schema content. The schema is only serialized once per instance,
+        changes to the schema are picked up on ``save`` and ``refresh_from_db``.
+        """
+        content = json.dumps(self.schema, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.__dict__.pop("fingerprint", None)
+        validator_cache.invalidate(self.pk)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop("fingerprint", None)
+
     def clean(self):
         try:
             self.latest_validator.check_schema(self.schema)
@@ -35,7 +143,8 @@ class JsonSchema(models.Model):
             raise ValidationError(e.message)
 
     def validate(self, json: dict) -> None:
-        try:
-            validate(json, self.schema)
-        except JsonSchemaValidationError as e:
-            raise ValidationError(e.message)
+        # same behaviour as jsonschema.validate, without checking the schema and
+        # creating a new validator on every call.
+        validator = validator_cache.get(self)
+        if error := best_match(validator.iter_errors(json)):
+            raise ValidationError(error.message)
@@ -33,3 +33,7 @@ class Parameter(BaseModel):
         verbose_name = _("parameter")
         verbose_name_plural = _("parameters")
         unique_together = (("product_type", "naam"),)
+        indexes = [
+            # [naam:waarde] filter of the product typen
+            models.Index(fields=["naam", "waarde"], name="parameter_naam_waarde_idx"),
+        ]
@@ -1,10 +1,19 @@
 from datetime import date
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+)
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from parler.managers import TranslatableManager, TranslatableQuerySet
 from parler.models import TranslatableModel, TranslatedFields
+from parler.utils import get_active_language_choices
 
 from open_producten.locaties.models import Contact, Locatie, Organisatie
 from open_producten.utils.fields import ChoiceArrayField
@@ -25,6 +34,139 @@ class ProductStateChoices(models.TextChoices):
     VERLOPEN = "verlopen", _("Verlopen")
 
 
+class ProductTypeQuerySet(TranslatableQuerySet):
+    def with_api_relations(self, language_code=None):
+        """
+        Load all relations used by the producttype API serializers up front, so serializing
+        a page of product typen costs a fixed number of queries instead of N+1.
+
+        Only the translations for the requested language and its fallbacks are fetched.
+        """
+        from .actie import Actie
+        from .prijs import Prijs
+
+        translation_model = self.model._parler_meta.root_model
+
+        return self.select_related(
+            "uniforme_product_naam",
+            "verbruiksobject_schema",
+            "dataobject_schema",
+        ).prefetch_related(
+            models.Prefetch(
+                "translations",
+                queryset=translation_model.objects.filter(
+                    language_code__in=get_active_language_choices(language_code)
+                ),
+            ),
+            "themas",
+            "locaties",
+            "organisaties",
+            models.Prefetch(
+                "contacten", queryset=Contact.objects.select_related("organisatie")
+            ),
+            models.Prefetch(
+                "prijzen", queryset=Prijs.objects.prefetch_related("prijsopties")
+            ),
+            "links",
+            "bestanden",
+            models.Prefetch(
+                "acties", queryset=Actie.objects.select_related("dmn_config")
+            ),
+            "externe_codes",
+            "parameters",
+        )
+
+    def with_actuele_prijs(self, datum: date | None = None):
+        """
+        Resolve the actuele prijs of every product type in a single query, using
+        ``DISTINCT ON`` to select the most recent prijs per product type.
+        """
+        from .prijs import Prijs
+
+        return self.select_related("uniforme_product_naam").prefetch_related(
+            models.Prefetch(
+                "prijzen",
+                queryset=Prijs.objects.filter(actief_vanaf__lte=datum or date.today())
+                .order_by("product_type", "-actief_vanaf")
+                .distinct("product_type")
+                .prefetch_related("prijsopties"),
+                to_attr="_actuele_prijzen",
+            )
+        )
+
+    def zoek(self, tekst: str, language_code: str):
+        """
+        Filter the product typen on the ``zoek_vector`` of their translation in the
+        language and order them on relevance, as ``zoek_rang``. Product typen without
+        a translation in the language are not found.
+
+        ``tekst`` supports the web search syntax, e.g. quoted phrases, ``or`` and
+        ``-`` to exclude words.
+        """
+        from ..search import get_zoek_config
+
+        query = SearchQuery(
+            tekst, config=get_zoek_config(language_code), search_type="websearch"
+        )
+        return (
+            self.alias(
+                zoek_vertaling=models.FilteredRelation(
+                    "translations",
+                    condition=models.Q(translations__language_code=language_code),
+                )
+            )
+            .filter(zoek_vertaling__zoek_index__zoek_vector=query)
+            .annotate(
+                zoek_rang=SearchRank(
+                    models.F("zoek_vertaling__zoek_index__zoek_vector"), query
+                )
+            )
+            .order_by("-zoek_rang", "id")
+        )
+
+    def with_zoek_fragment(self, tekst: str, language_code: str):
+        """
+        Annotate the naam and a ``zoek_fragment`` of the samenvatting with the words
+        of ``tekst`` highlighted, for product typen filtered by :meth:`zoek`.
+        """
+        from ..search import get_zoek_config
+
+        config = get_zoek_config(language_code)
+        return self.annotate(
+            zoek_naam=models.F("zoek_vertaling__naam"),
+            zoek_fragment=SearchHeadline(
+                "zoek_vertaling__samenvatting",
+                SearchQuery(tekst, config=config, search_type="websearch"),
+                config=config,
+                start_sel="<mark>",
+                stop_sel="</mark>",
+                max_fragments=2,
+            ),
+        )
+
+    def without_other_themas(self, themas):
+        """
+        Filter the product typen of ``themas`` that are not linked to any other thema,
+        i.e. that would be left without a thema when ``themas`` are deleted.
+        """
+        through = self.model.themas.through
+        return (
+            self.filter(themas__in=themas)
+            .exclude(
+                models.Exists(
+                    through.objects.filter(producttype=models.OuterRef("pk")).exclude(
+                        thema__in=themas
+                    )
+                )
+            )
+            .distinct()
+        )
+
+
+class ProductTypeManager(TranslatableManager.from_queryset(ProductTypeQuerySet)):
+    pass
+
+
 class ProductType(BasePublishableModel, TranslatableModel):
 
     code = models.CharField(
@@ -137,11 +279,38 @@ class ProductType(BasePublishableModel, TranslatableModel):
             max_length=255,
             help_text=_("naam van het product type."),
         ),
+        meta={
+            "indexes": [
+                # used by the (fuzzy) prefix matching of the suggesties
+                GinIndex(
+                    fields=["naam"],
+                    name="producttype_naam_trgm_idx",
+                    opclasses=["gin_trgm_ops"],
+                )
+            ]
+        },
     )
 
+    objects = ProductTypeManager()
+
     class Meta:
         verbose_name = _("Product type")
         verbose_name_plural = _("Product typen")
+        indexes = [
+            # keyset pagination
+            models.Index(
+                fields=["aanmaak_datum", "id"], name="producttype_aanmaak_id_idx"
+            ),
+            models.Index(
+                fields=["update_datum", "id"], name="producttype_update_id_idx"
+            ),
+            # overlap filters
+            GinIndex(fields=["keywords"], name="producttype_keywords_idx"),
+            GinIndex(
+                fields=["toegestane_statussen"],
+                name="producttype_statussen_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.naam
@@ -159,7 +328,42 @@ class ProductType(BasePublishableModel, TranslatableModel):
 
     @property
     def actuele_prijs(self):
+        if hasattr(self, "_actuele_prijzen"):
+            # loaded by ProductTypeQuerySet.with_actuele_prijs
+            return self._actuele_prijzen[0] if self._actuele_prijzen else None
+
         now = date.today()
         return (
             self.prijzen.filter(actief_vanaf__lte=now).order_by("actief_vanaf").last()
         )
+
+
+class ProductTypeZoekIndex(models.Model):
+    """
+    The full-text search vector of a product type translation.
+
+    Kept outside of the translation model, which is loaded with all its fields
+    whenever a product type is read.
+    """
+
+    vertaling = models.OneToOneField(
+        ProductType._parler_meta.root_model,
+        verbose_name=_("vertaling"),
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="zoek_index",
+        help_text=_("De vertaling van het product type."),
+    )
+    zoek_vector = SearchVectorField(
+        verbose_name=_("zoek vector"),
+        help_text=_(
+            "De naam, samenvatting, keywords, uniforme product naam en content van het product type in de taal van de vertaling."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("Product type zoekindex")
+        verbose_name_plural = _("Product type zoekindexen")
+        indexes = [
+            GinIndex(fields=["zoek_vector"], name="producttype_zoek_vector_idx"),
+        ]
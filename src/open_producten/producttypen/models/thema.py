@@ -1,13 +1,134 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import connection, models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from open_producten.producttypen.models.validators import (
+    HOOFD_THEMA_NIET_GEPUBLICEERD,
     disallow_hoofd_thema_self_reference,
     validate_thema_gepubliceerd_state,
 )
 from open_producten.utils.models import BasePublishableModel
 
 
+class ThemaQuerySet(models.QuerySet):
+    def boom(
+        self, thema: "Thema | None" = None, gepubliceerd: bool | None = None
+    ) -> list["Thema"]:
+        """
+        Return the hoofd thema's, or ``thema``, with their sub thema's as a tree.
+
+        The tree is fetched with a single recursive query. Every thema gets the
+        ``boom_sub_themas`` list, ordered on naam, and the number of product typen in
+        ``product_typen_aantal``. With ``gepubliceerd`` only the (un)published
+        thema's and product typen are included, so the sub thema's of an excluded
+        thema are excluded as well.
+        """
+        from .producttype import ProductType
+
+        thema_table = self.model._meta.db_table
+        product_type_table = ProductType._meta.db_table
+        through_table = ProductType.themas.through._meta.db_table
+
+        anchor = "t.hoofd_thema_id IS NULL" if thema is None else "t.id = %s"
+        anchor_params = [] if thema is None else [thema.pk]
+
+        thema_filter = product_type_filter = ""
+        filter_params = []
+        if gepubliceerd is not None:
+            thema_filter = " AND t.gepubliceerd = %s"
+            product_type_filter = " AND p.gepubliceerd = %s"
+            filter_params = [gepubliceerd]
+
+        # the path of every thema prevents an endless recursion on a cycle of hoofd
+        # thema's, which is not prevented by the validation
+        themas = self.raw(
+            f"""
+            WITH RECURSIVE boom AS (
+                SELECT t.id, ARRAY[t.id] AS pad
+                FROM {thema_table} t
+                WHERE {anchor}{thema_filter}
+              UNION ALL
+                SELECT t.id, boom.pad || t.id
+                FROM {thema_table} t
+                JOIN boom ON t.hoofd_thema_id = boom.id
+                WHERE NOT t.id = ANY(boom.pad){thema_filter}
+            )
+            SELECT t.*, (
+                SELECT count(*)
+                FROM {through_table} pt
+                JOIN {product_type_table} p ON p.id = pt.producttype_id
+                WHERE pt.thema_id = t.id{product_type_filter}
+            ) AS product_typen_aantal
+            FROM boom
+            JOIN {thema_table} t ON t.id = boom.id
+            ORDER BY t.naam, t.id
+            """,
+            [*anchor_params, *filter_params, *filter_params, *filter_params],
+        )
+
+        nodes = {node.pk: node for node in themas}
+        roots = []
+        for node in nodes.values():
+            node.boom_sub_themas = []
+        for node in nodes.values():
+            if node.pk != getattr(thema, "pk", None) and node.hoofd_thema_id in nodes:
+                nodes[node.hoofd_thema_id].boom_sub_themas.append(node)
+            else:
+                roots.append(node)
+        return roots
+
+    def set_gepubliceerd_boom(self, thema: "Thema", gepubliceerd: bool) -> list:
+        """
+        (Un)publish ``thema`` and all its sub thema's with a single query.
+
+        A subtree can only be published when the hoofd thema of ``thema`` is
+        published, which is checked by the same query. Unpublishing a subtree leaves
+        no published sub thema's behind, so it is always allowed. Returns the ids of
+        the thema's that were changed.
+        """
+        table = self.model._meta.db_table
+
+        anchor = "t.id = %s"
+        if gepubliceerd:
+            anchor += (
+                f" AND (t.hoofd_thema_id IS NULL OR EXISTS (SELECT 1 FROM {table} h"
+                " WHERE h.id = t.hoofd_thema_id AND h.gepubliceerd))"
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH RECURSIVE boom AS (
+                    SELECT t.id, ARRAY[t.id] AS pad
+                    FROM {table} t
+                    WHERE {anchor}
+                  UNION ALL
+                    SELECT t.id, boom.pad || t.id
+                    FROM {table} t
+                    JOIN boom ON t.hoofd_thema_id = boom.id
+                    WHERE NOT t.id = ANY(boom.pad)
+                ), gewijzigd AS (
+                    UPDATE {table} t
+                    SET gepubliceerd = %s, update_datum = %s
+                    FROM boom
+                    WHERE t.id = boom.id AND t.gepubliceerd <> %s
+                    RETURNING t.id
+                )
+                SELECT boom.id, gewijzigd.id IS NOT NULL
+                FROM boom
+                LEFT JOIN gewijzigd ON gewijzigd.id = boom.id
+                """,
+                [thema.pk, gepubliceerd, timezone.now(), gepubliceerd],
+            )
+            rows = cursor.fetchall()
+
+        if not rows:
+            raise ValidationError(HOOFD_THEMA_NIET_GEPUBLICEERD)
+
+        return [pk for pk, changed in rows if changed]
+
+
 class Thema(BasePublishableModel):
 
     naam = models.CharField(
@@ -31,6 +152,8 @@ class Thema(BasePublishableModel):
         help_text=_("Beschrijving van het thema, ondersteund markdown format."),
     )
 
+    objects = ThemaQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("thema")
         verbose_name_plural = _("thema's")
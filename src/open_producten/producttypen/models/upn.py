@@ -1,9 +1,15 @@
+import hashlib
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from open_producten.utils.models import BaseModel
 
 
+def get_upn_hash(naam: str, uri: str) -> str:
+    return hashlib.sha256(f"{uri}\n{naam}".encode()).hexdigest()
+
+
 class UniformeProductNaam(BaseModel):
     naam = models.CharField(
         verbose_name=_("naam"),
@@ -22,6 +28,15 @@ class UniformeProductNaam(BaseModel):
         help_text=_("Geeft aan of de UPN is verwijderd."),
         default=False,
     )
+    hash = models.CharField(
+        _("hash"),
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "Hash van de naam en uri, om gewijzigde regels van de UPL te herkennen."
+        ),
+    )
 
     class Meta:
         verbose_name = _("Uniforme product naam")
@@ -29,3 +44,77 @@ class UniformeProductNaam(BaseModel):
 
     def __str__(self):
         return self.naam
+
+    def save(self, *args, **kwargs):
+        self.hash = get_upn_hash(self.naam, self.uri)
+        super().save(*args, **kwargs)
+
+
+class UplSynchronisatieStatus(models.TextChoices):
+    GEWIJZIGD = "gewijzigd", _("Gewijzigd")
+    ONGEWIJZIGD = "ongewijzigd", _("Ongewijzigd")
+    MISLUKT = "mislukt", _("Mislukt")
+
+
+class UplSynchronisatie(BaseModel):
+    url = models.URLField(
+        _("url"),
+        help_text=_("De url van de UPL csv."),
+    )
+    gestart_op = models.DateTimeField(
+        _("gestart op"),
+        auto_now_add=True,
+        help_text=_("Het moment waarop de synchronisatie is gestart."),
+    )
+    duur = models.DurationField(
+        _("duur"),
+        null=True,
+        blank=True,
+        help_text=_("De duur van de synchronisatie."),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=UplSynchronisatieStatus.choices,
+        help_text=_("De uitkomst van de synchronisatie."),
+    )
+    etag = models.CharField(
+        _("ETag"),
+        max_length=255,
+        blank=True,
+        help_text=_("De ETag header van de gedownloade UPL."),
+    )
+    last_modified = models.CharField(
+        _("Last-Modified"),
+        max_length=255,
+        blank=True,
+        help_text=_("De Last-Modified header van de gedownloade UPL."),
+    )
+    aangemaakt = models.PositiveIntegerField(
+        _("aangemaakt"),
+        default=0,
+        help_text=_("Het aantal aangemaakte uniforme product namen."),
+    )
+    gewijzigd = models.PositiveIntegerField(
+        _("gewijzigd"),
+        default=0,
+        help_text=_("Het aantal gewijzigde uniforme product namen."),
+    )
+    verwijderd = models.PositiveIntegerField(
+        _("verwijderd"),
+        default=0,
+        help_text=_("Het aantal uniforme product namen dat niet in de UPL voorkomt."),
+    )
+    foutmelding = models.TextField(
+        _("foutmelding"),
+        blank=True,
+        help_text=_("De fout waardoor de synchronisatie is mislukt."),
+    )
+
+    class Meta:
+        verbose_name = _("UPL synchronisatie")
+        verbose_name_plural = _("UPL synchronisaties")
+        ordering = ("-gestart_op",)
+
+    def __str__(self):
+        return f"{self.gestart_op:%Y-%m-%d %H:%M} {self.get_status_display()}"
@@ -13,13 +13,14 @@ def validate_prijs_optie_xor_regel(optie_count: int, regel_count: int):
         )
 
 
+HOOFD_THEMA_NIET_GEPUBLICEERD = _(
+    "Thema's moeten gepubliceerd zijn voordat sub-thema's kunnen worden gepubliceerd."
+)
+
+
 def validate_thema_gepubliceerd_state(hoofd_thema, gepubliceerd, sub_themas=None):
     if gepubliceerd and hoofd_thema and not hoofd_thema.gepubliceerd:
-        raise ValidationError(
-            _(
-                "Thema's moeten gepubliceerd zijn voordat sub-thema's kunnen worden gepubliceerd."
-            )
-        )
+        raise ValidationError(HOOFD_THEMA_NIET_GEPUBLICEERD)
 
     if (
         not gepubliceerd
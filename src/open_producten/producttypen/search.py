@@ -0,0 +1,124 @@
+"""
+Full-text search over the product typen.
+
+Every product type translation has a ``ProductTypeZoekIndex`` with a vector of the
+naam, keywords, samenvatting, uniforme product naam and content in the language of the
+translation. The vectors are rebuilt by :func:`update_zoek_vectors`, which is called by the signals
+of the models they are built from.
+"""
+
+import re
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import BooleanField, ExpressionWrapper, F, Q
+
+from .models import (
+    ContentElement,
+    ProductType,
+    ProductTypeZoekIndex,
+    UniformeProductNaam,
+)
+
+# text search configurations of the languages, other languages are not stemmed
+ZOEK_CONFIGS = {
+    "nl": "dutch",
+    "en": "english",
+}
+DEFAULT_ZOEK_CONFIG = "simple"
+
+
+def get_zoek_config(language_code: str) -> str:
+    return ZOEK_CONFIGS.get(language_code, DEFAULT_ZOEK_CONFIG)
+
+
+def get_zoek_vector_sql(product_type_ids_sql: str) -> str:
+    """
+    Return the query that upserts the ``zoek_vector`` of the translations of the
+    product typen selected by ``product_type_ids_sql``.
+    """
+    zoek_index_table = ProductTypeZoekIndex._meta.db_table
+    translation_table = ProductType._parler_meta.root_model._meta.db_table
+    product_type_table = ProductType._meta.db_table
+    upn_table = UniformeProductNaam._meta.db_table
+    content_table = ContentElement._meta.db_table
+    content_translation_table = ContentElement._parler_meta.root_model._meta.db_table
+
+    config = " ".join(
+        f"WHEN '{language_code}' THEN '{config}'"
+        for language_code, config in ZOEK_CONFIGS.items()
+    )
+
+    return f"""
+        INSERT INTO {zoek_index_table} (vertaling_id, zoek_vector)
+        SELECT
+            t.id,
+            setweight(to_tsvector(c.config, t.naam), 'A')
+            || setweight(to_tsvector(c.config, array_to_string(p.keywords, ' ')), 'A')
+            || setweight(to_tsvector(c.config, upn.naam), 'B')
+            || setweight(to_tsvector(c.config, t.samenvatting), 'B')
+            || setweight(to_tsvector(c.config, coalesce((
+                SELECT string_agg(ct.content, ' ' ORDER BY ce."order")
+                FROM {content_table} ce
+                JOIN {content_translation_table} ct ON ct.master_id = ce.id
+                WHERE ce.product_type_id = p.id AND ct.language_code = t.language_code
+            ), '')), 'C')
+        FROM {translation_table} t
+        JOIN {product_type_table} p ON p.id = t.master_id
+        JOIN {upn_table} upn ON upn.id = p.uniforme_product_naam_id
+        CROSS JOIN LATERAL (
+            SELECT (
+                CASE t.language_code {config} ELSE '{DEFAULT_ZOEK_CONFIG}' END
+            )::regconfig AS config
+        ) c
+        WHERE p.id IN ({product_type_ids_sql})
+        ON CONFLICT (vertaling_id) DO UPDATE SET zoek_vector = EXCLUDED.zoek_vector
+    """
+
+
+def update_zoek_vectors(lookup: Q) -> None:
+    """
+    Rebuild the zoek vectors of the product typen matching the lookup with a single
+    query.
+
+    Also used for changes that don't send signals, like bulk updates.
+    """
+    ids_sql, params = (
+        ProductType.objects.filter(lookup).values("pk").query.sql_with_params()
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(get_zoek_vector_sql(ids_sql), params)
+
+
+def get_suggesties(
+    tekst: str, language_code: str, aantal: int, gepubliceerd: bool | None = None
+) -> list[dict]:
+    """
+    Return the ``master_id``, ``naam`` and ``upl_naam`` of the ``aantal`` product
+    typen of which the name in the language best completes ``tekst``.
+
+    Names that start with ``tekst`` come first, followed by the names with a word
+    that is similar to it, so misspellings are found as well. Both conditions use the
+    trigram index on the naam.
+    """
+    translation_model = ProductType._parler_meta.root_model
+
+    # a case insensitive regex instead of istartswith, which compares on UPPER(naam)
+    # and can't use the index
+    prefix = Q(naam__iregex=f"^{re.escape(tekst)}")
+    queryset = translation_model.objects.filter(
+        prefix | Q(naam__trigram_word_similar=tekst),
+        language_code=language_code,
+    )
+    if gepubliceerd is not None:
+        queryset = queryset.filter(master__gepubliceerd=gepubliceerd)
+
+    return list(
+        queryset.annotate(
+            is_prefix=ExpressionWrapper(prefix, output_field=BooleanField()),
+            similarity=TrigramWordSimilarity(tekst, "naam"),
+            upl_naam=F("master__uniforme_product_naam__naam"),
+        )
+        .order_by("-is_prefix", "-similarity", "naam")
+        .values("master_id", "naam", "upl_naam")[:aantal]
+    )
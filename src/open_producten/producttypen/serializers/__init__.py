@@ -5,12 +5,13 @@ from .link import LinkSerializer
 from .parameter import ParameterSerializer
 from .prijs import PrijsOptieSerializer, PrijsSerializer
 from .producttype import ProductTypeActuelePrijsSerializer, ProductTypeSerializer
-from .thema import ThemaSerializer
+from .thema import ThemaBoomSerializer, ThemaSerializer
 
 __all__ = [
     "LinkSerializer",
     "BestandSerializer",
     "ThemaSerializer",
+    "ThemaBoomSerializer",
     "PrijsSerializer",
     "PrijsOptieSerializer",
     "ProductTypeSerializer",
@@ -17,6 +17,7 @@ from open_producten.producttypen.models import JsonSchema
                     "properties": {"uren": {"type": "number"}},
                     "required": ["uren"],
                 },
+                "index_paden": ["uren"],
             },
             response_only=True,
         ),
@@ -29,6 +30,7 @@ from open_producten.producttypen.models import JsonSchema
                     "properties": {"uren": {"type": "number"}},
                     "required": ["uren"],
                 },
+                "index_paden": ["uren"],
             },
             request_only=True,
         ),
@@ -48,4 +50,4 @@ class JsonSchemaSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = JsonSchema
-        fields = ("naam", "schema")
+        fields = ("naam", "schema", "index_paden")
@@ -289,7 +289,12 @@ class ProductTypeSerializer(TranslatableModelSerializer):
     @extend_schema_field(OpenApiTypes.STR)
     def get_taal(self, obj):
         requested_language = self.context["request"].LANGUAGE_CODE
-        return requested_language if obj.has_translation(requested_language) else "nl"
+        # Uses the (prefetched) translations instead of a query per product type.
+        return (
+            requested_language
+            if requested_language in obj.get_available_languages(include_unsaved=True)
+            else "nl"
+        )
 
     externe_codes = NestedExterneCodeSerializer(many=True, required=False)
     parameters = NestedParameterSerializer(many=True, required=False)
@@ -419,6 +424,77 @@ class ProductTypeActuelePrijsSerializer(serializers.ModelSerializer):
         fields = ("id", "code", "upl_naam", "upl_uri", "actuele_prijs")
 
 
+class ActuelePrijsDatumSerializer(serializers.Serializer):
+    datum = serializers.DateField(
+        required=False,
+        help_text=_(
+            "De datum waarop de prijs actueel is. Standaard wordt de huidige datum gebruikt."
+        ),
+    )
+
+
+class ProductTypeZoekResultaatSerializer(serializers.ModelSerializer):
+    naam = serializers.CharField(
+        source="zoek_naam", read_only=True, help_text=_("naam van het producttype.")
+    )
+    upl_naam = serializers.ReadOnlyField(source="uniforme_product_naam.naam")
+    rang = serializers.FloatField(
+        source="zoek_rang",
+        read_only=True,
+        help_text=_("De relevantie van het producttype voor de zoekopdracht."),
+    )
+    fragment = serializers.CharField(
+        source="zoek_fragment",
+        read_only=True,
+        help_text=_(
+            "Fragment van de samenvatting waarin de gevonden woorden zijn gemarkeerd met `<mark>`."
+        ),
+    )
+
+    class Meta:
+        model = ProductType
+        fields = ("id", "code", "naam", "upl_naam", "rang", "fragment")
+
+
+class ProductTypeZoekSerializer(serializers.Serializer):
+    zoek = serializers.CharField(
+        help_text=_(
+            "De zoekopdracht. Woorden tussen aanhalingstekens worden als zin gezocht, `or` zoekt op één van de woorden en met `-` wordt een woord uitgesloten."
+        ),
+    )
+
+
+class ProductTypeSuggestieSerializer(serializers.Serializer):
+    id = serializers.UUIDField(source="master_id", read_only=True)
+    naam = serializers.CharField(
+        read_only=True, help_text=_("naam van het producttype.")
+    )
+    upl_naam = serializers.CharField(
+        read_only=True, help_text=_("Uniforme product naam vanuit de UPL.")
+    )
+
+
+class ProductTypeSuggestiesParametersSerializer(serializers.Serializer):
+    zoek = serializers.CharField(
+        max_length=255,
+        help_text=_(
+            "Het begin van de naam van het producttype, mag typfouten bevatten."
+        ),
+    )
+    aantal = serializers.IntegerField(
+        min_value=1,
+        max_value=50,
+        default=10,
+        help_text=_("Het maximum aantal suggesties."),
+    )
+    gepubliceerd = serializers.BooleanField(
+        required=False,
+        allow_null=True,
+        default=None,
+        help_text=_("Alleen (niet) gepubliceerde producttypen."),
+    )
+
+
 class ProductTypeTranslationSerializer(serializers.ModelSerializer):
 
     naam = serializers.CharField(
@@ -129,3 +129,48 @@ class ThemaSerializer(serializers.ModelSerializer):
             instance.product_typen.set(product_typen)
 
         return instance
+
+
+class ThemaBoomSerializer(serializers.ModelSerializer):
+    product_typen_aantal = serializers.IntegerField(
+        read_only=True,
+        help_text=_("Het aantal product typen dat aan dit thema is gelinkt."),
+    )
+
+    class Meta:
+        model = Thema
+        fields = (
+            "id",
+            "naam",
+            "beschrijving",
+            "gepubliceerd",
+            "product_typen_aantal",
+            "sub_themas",
+        )
+
+
+# the sub thema's are nested with the serializer itself
+ThemaBoomSerializer._declared_fields["sub_themas"] = ThemaBoomSerializer(
+    many=True,
+    read_only=True,
+    source="boom_sub_themas",
+    help_text=_("De sub thema's van dit thema."),
+)
+
+
+class ThemaBoomParametersSerializer(serializers.Serializer):
+    thema = serializers.PrimaryKeyRelatedField(
+        queryset=Thema.objects.all(),
+        required=False,
+        help_text=_(
+            "Het thema waarvan de boom wordt opgevraagd. Standaard worden alle hoofd thema's teruggegeven."
+        ),
+    )
+    gepubliceerd = serializers.BooleanField(
+        required=False,
+        allow_null=True,
+        default=None,
+        help_text=_(
+            "Alleen (niet) gepubliceerde thema's en product typen. De sub thema's van een uitgesloten thema worden ook uitgesloten."
+        ),
+    )
@@ -0,0 +1,182 @@
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.utils import timezone
+
+from open_producten.locaties.models import Contact, Locatie, Organisatie
+from open_producten.utils.cache import response_cache
+
+from .models import (
+    Actie,
+    Bestand,
+    ContentElement,
+    JsonSchema,
+    Link,
+    Prijs,
+    PrijsOptie,
+    PrijsRegel,
+    ProductType,
+    Thema,
+    UniformeProductNaam,
+)
+from .search import update_zoek_vectors
+
+ProductTypeTranslation = ProductType._parler_meta.root_model
+ContentElementTranslation = ContentElement._parler_meta.root_model
+
+# Related objects that are part of the product type responses, mapped to the lookup
+# of the product types they belong to. The ``update_datum`` of these product types is
+# updated when one of them changes, so it can be used as the validator of conditional
+# requests. Externe codes and parameters are left out, they are only written together
+# with their product type.
+PRODUCT_TYPE_LOOKUPS = {
+    Actie: lambda instance: Q(pk=instance.product_type_id),
+    Bestand: lambda instance: Q(pk=instance.product_type_id),
+    ContentElement: lambda instance: Q(pk=instance.product_type_id),
+    Link: lambda instance: Q(pk=instance.product_type_id),
+    Prijs: lambda instance: Q(pk=instance.product_type_id),
+    PrijsOptie: lambda instance: Q(prijzen=instance.prijs_id),
+    PrijsRegel: lambda instance: Q(prijzen=instance.prijs_id),
+    UniformeProductNaam: lambda instance: Q(uniforme_product_naam=instance),
+    JsonSchema: lambda instance: Q(verbruiksobject_schema=instance)
+    | Q(dataobject_schema=instance),
+    Locatie: lambda instance: Q(locaties=instance),
+    Organisatie: lambda instance: Q(organisaties=instance)
+    | Q(contacten__organisatie=instance),
+    Contact: lambda instance: Q(contacten=instance),
+    # translations are saved together with their object, only deletes are tracked
+    ProductTypeTranslation: lambda instance: Q(pk=instance.master_id),
+    ContentElementTranslation: lambda instance: Q(content_elementen=instance.master_id),
+}
+
+# Objects of which the text is part of the zoek vectors of the product typen, mapped to
+# the lookup of these product typen. The vectors are updated when one of them is saved.
+ZOEK_VECTOR_LOOKUPS = {
+    ProductType: lambda instance: Q(pk=instance.pk),
+    ProductTypeTranslation: lambda instance: Q(pk=instance.master_id),
+    UniformeProductNaam: PRODUCT_TYPE_LOOKUPS[UniformeProductNaam],
+    ContentElementTranslation: PRODUCT_TYPE_LOOKUPS[ContentElementTranslation],
+}
+
+# The content is also removed from the vectors when it is deleted. A content element
+# is deleted before its translations, so those can't be traced back to the product
+# type when the element is deleted.
+ZOEK_VECTOR_DELETE_LOOKUPS = {
+    ContentElement: lambda instance: Q(pk=instance.product_type_id),
+    ContentElementTranslation: PRODUCT_TYPE_LOOKUPS[ContentElementTranslation],
+}
+
+# many to many relations are removed before post_delete is sent
+M2M_MODELS = (Locatie, Organisatie, Contact)
+
+
+def invalidate_product_typen(product_type_ids) -> None:
+    """
+    Invalidate the cached responses that contain the product typen, including those
+    of the thema's that list them.
+    """
+    thema_ids = Thema.objects.filter(product_typen__in=product_type_ids).values_list(
+        "pk", flat=True
+    )
+    response_cache.invalidate_on_commit(
+        "producttypen",
+        "themas",
+        *(f"producttype:{pk}" for pk in product_type_ids),
+        *(f"thema:{pk}" for pk in thema_ids),
+    )
+
+
+def invalidate_themas(thema_ids) -> None:
+    """
+    Invalidate the cached responses that contain the thema's, including those of the
+    product typen that list them.
+    """
+    product_type_ids = ProductType.objects.filter(themas__in=thema_ids).values_list(
+        "pk", flat=True
+    )
+    response_cache.invalidate_on_commit(
+        "themas",
+        "producttypen",
+        *(f"thema:{pk}" for pk in thema_ids),
+        *(f"producttype:{pk}" for pk in product_type_ids),
+    )
+
+
+def product_type_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_product_typen([instance.pk])
+
+
+def thema_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_themas([instance.pk])
+
+
+def product_type_themas_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        invalidate_themas([instance.pk])
+        invalidate_product_typen(list(pk_set or []))
+    else:
+        invalidate_product_typen([instance.pk])
+        invalidate_themas(list(pk_set or []))
+
+
+def product_type_related_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    if sender is ContentElement:
+        response_cache.invalidate_on_commit(f"content:{instance.pk}")
+    elif sender is ContentElementTranslation:
+        response_cache.invalidate_on_commit(f"content:{instance.master_id}")
+
+    product_typen_changed(PRODUCT_TYPE_LOOKUPS[sender](instance))
+
+
+def product_typen_changed(lookup: Q) -> None:
+    """
+    Update the ``update_datum`` of the product typen matching the lookup and
+    invalidate their cached responses.
+
+    Also used for changes that don't send signals, like bulk updates.
+    """
+    product_type_ids = list(
+        ProductType.objects.filter(lookup).values_list("pk", flat=True)
+    )
+    if not product_type_ids:
+        return
+
+    ProductType.objects.filter(pk__in=product_type_ids).update(
+        update_datum=timezone.now()
+    )
+    invalidate_product_typen(product_type_ids)
+
+
+def zoek_vector_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_zoek_vectors(ZOEK_VECTOR_LOOKUPS[sender](instance))
+
+
+def zoek_vector_deleted(sender, instance, **kwargs):
+    update_zoek_vectors(ZOEK_VECTOR_DELETE_LOOKUPS[sender](instance))
+
+
+def connect_signals():
+    post_save.connect(product_type_changed, sender=ProductType)
+    pre_delete.connect(product_type_changed, sender=ProductType)
+    post_save.connect(thema_changed, sender=Thema)
+    pre_delete.connect(thema_changed, sender=Thema)
+    m2m_changed.connect(product_type_themas_changed, sender=ProductType.themas.through)
+
+    for model in PRODUCT_TYPE_LOOKUPS:
+        if model not in (ProductTypeTranslation, ContentElementTranslation):
+            post_save.connect(product_type_related_changed, sender=model)
+        delete_signal = pre_delete if model in M2M_MODELS else post_delete
+        delete_signal.connect(product_type_related_changed, sender=model)
+
+    for model in ZOEK_VECTOR_LOOKUPS:
+        post_save.connect(zoek_vector_changed, sender=model)
+    for model in ZOEK_VECTOR_DELETE_LOOKUPS:
+        post_delete.connect(zoek_vector_deleted, sender=model)
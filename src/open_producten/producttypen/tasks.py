@@ -0,0 +1,31 @@
+import logging
+
+from django.conf import settings
+
+from open_producten.celery import app
+from open_producten.utils.locks import advisory_lock
+
+from .upl import sync_upl
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def synchronise_upl():
+    if not settings.UPL_URL:
+        logger.info("UPL_URL is not set, skipping the UPL synchronisation.")
+        return
+
+    with advisory_lock("synchronise_upl") as acquired:
+        if not acquired:
+            logger.info("synchronise_upl is already running, skipping this run.")
+            return
+
+        sync = sync_upl(settings.UPL_URL)
+        logger.info(
+            "Synchronised the UPL: %s, %d created, %d changed, %d not in the UPL.",
+            sync.status,
+            sync.aangemaakt,
+            sync.gewijzigd,
+            sync.verwijderd,
+        )
@@ -53,7 +53,24 @@ class TestProductTypeSchema(BaseApiTestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(JsonSchema.objects.count(), 2)
 
-        self.assertEqual(response.data, self.data)
+        self.assertEqual(response.data, self.data | {"index_paden": []})
+
+    def test_create_schema_with_index_paden(self):
+        data = self.data | {"index_paden": ["uren", "persoon__leeftijd"]}
+        response = self.client.post(self.path, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, data)
+
+    def test_create_schema_with_invalid_index_pad(self):
+        for pad in ("", "a b", "__uren", "persoon____leeftijd"):
+            with self.subTest(pad):
+                response = self.client.post(
+                    self.path, self.data | {"index_paden": [pad]}
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("index_paden", response.data)
 
     def test_create_invalid_schema(self):
         data = self.data | {"schema": {"type": []}}
@@ -98,10 +115,12 @@ class TestProductTypeSchema(BaseApiTestCase):
             {
                 "naam": self.schema.naam,
                 "schema": self.schema.schema,
+                "index_paden": [],
             },
             {
                 "naam": schema.naam,
                 "schema": schema.schema,
+                "index_paden": [],
             },
         ]
         self.assertCountEqual(response.data["results"], expected_data)
@@ -114,6 +133,7 @@ class TestProductTypeSchema(BaseApiTestCase):
         expected_data = {
             "naam": self.schema.naam,
             "schema": self.schema.schema,
+            "index_paden": [],
         }
         self.assertEqual(response.data, expected_data)
 
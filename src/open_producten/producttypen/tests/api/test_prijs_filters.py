@@ -87,6 +87,22 @@ class TestPrijsFilters(BaseApiTestCase):
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"][0]["id"], str(prijs.id))
 
+    def test_multi_valued_filters_return_prijs_once(self):
+        prijs = PrijsFactory.create()
+        PrijsOptieFactory.create(prijs=prijs, bedrag=Decimal(10))
+        PrijsOptieFactory.create(prijs=prijs, bedrag=Decimal(30))
+        PrijsRegelFactory.create(prijs=prijs, beschrijving="base")
+        PrijsRegelFactory.create(prijs=prijs, beschrijving="base")
+
+        response = self.client.get(
+            self.path,
+            {"prijsopties__bedrag__gte": "5", "prijsregels__beschrijving": "base"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], str(prijs.id))
+
     def test_actief_vanaf_filter(self):
         PrijsFactory.create(actief_vanaf=date(2024, 6, 7))
         PrijsFactory.create(actief_vanaf=date(2025, 6, 7))
@@ -15,6 +15,7 @@ from open_producten.locaties.tests.factories import (
 )
 from open_producten.producttypen.models import ExterneCode, Link, Parameter, ProductType
 from open_producten.producttypen.tests.factories import (
+    ActieFactory,
     BestandFactory,
     ContentElementFactory,
     ExterneCodeFactory,
@@ -318,6 +319,7 @@ class TestProducttypeViewSet(BaseApiTestCase):
                     "properties": {"uren": {"type": "number"}},
                     "required": ["uren"],
                 },
+                "index_paden": [],
             },
             "dataobject_schema": {
                 "naam": "test",
@@ -326,6 +328,7 @@ class TestProducttypeViewSet(BaseApiTestCase):
                     "properties": {"uren": {"type": "number"}},
                     "required": ["uren"],
                 },
+                "index_paden": [],
             },
             "toegestane_statussen": [],
             "prijzen": [],
@@ -982,6 +985,57 @@ class TestProducttypeViewSet(BaseApiTestCase):
         self.assertEqual(response.data["samenvatting"], "samenvatting")
         self.assertEqual(response.data["taal"], "nl")
 
+    def _create_complete_product_type(self):
+        product_type = ProductTypeFactory.create(
+            verbruiksobject_schema=JsonSchemaFactory.create(schema={"type": "object"}),
+            dataobject_schema=JsonSchemaFactory.create(schema={"type": "object"}),
+        )
+        product_type.set_current_language("en")
+        product_type.naam = "product type EN"
+        product_type.save()
+
+        product_type.themas.add(self.thema)
+        product_type.locaties.add(LocatieFactory.create())
+        product_type.organisaties.add(OrganisatieFactory.create())
+        product_type.contacten.add(ContactFactory.create())
+
+        PrijsOptieFactory.create(prijs=PrijsFactory.create(product_type=product_type))
+        LinkFactory.create(product_type=product_type)
+        BestandFactory.create(product_type=product_type)
+        ActieFactory.create(product_type=product_type)
+        ExterneCodeFactory.create(product_type=product_type)
+        ParameterFactory.create(product_type=product_type)
+        return product_type
+
+    def test_read_product_typen_query_count_does_not_depend_on_page_size(self):
+        for _i in range(2):
+            self._create_complete_product_type()
+
+        with self.assertNumQueries(16):
+            response = self.client.get(self.path, headers={"Accept-Language": "en"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+
+        for _i in range(8):
+            self._create_complete_product_type()
+
+        with self.assertNumQueries(16):
+            response = self.client.get(self.path, headers={"Accept-Language": "en"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 10)
+        self.assertEqual(response.data["results"][0]["taal"], "en")
+
+    def test_read_product_type_query_count(self):
+        product_type = self._create_complete_product_type()
+
+        with self.assertNumQueries(15):
+            response = self.client.get(self.detail_path(product_type))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["taal"], "nl")
+
     def test_delete_product_type(self):
         product_type = ProductTypeFactory.create()
 
@@ -1017,7 +1071,7 @@ class TestProductTypeActions(BaseApiTestCase):
         response = self.client.get(self.list_path)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
-            response.data,
+            response.data["results"],
             [
                 self.expected_data,
             ],
@@ -1040,7 +1094,7 @@ class TestProductTypeActions(BaseApiTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
-            response.data,
+            response.data["results"],
             [
                 self.expected_data,
             ],
@@ -1058,7 +1112,7 @@ class TestProductTypeActions(BaseApiTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
-            response.data,
+            response.data["results"],
             [
                 self.expected_data
                 | {
@@ -1106,6 +1160,75 @@ class TestProductTypeActions(BaseApiTestCase):
             },
         )
 
+    def test_get_actuele_prijzen_uses_most_recent_prijs(self):
+        PrijsFactory.create(
+            product_type=self.product_type, actief_vanaf=datetime.date(2023, 1, 1)
+        )
+        prijs = PrijsFactory.create(
+            product_type=self.product_type, actief_vanaf=datetime.date(2023, 6, 1)
+        )
+        PrijsFactory.create(
+            product_type=self.product_type, actief_vanaf=datetime.date(2024, 2, 1)
+        )
+
+        response = self.client.get(self.list_path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0]["actuele_prijs"]["id"], str(prijs.id)
+        )
+
+    def test_get_actuele_prijzen_with_datum(self):
+        PrijsFactory.create(
+            product_type=self.product_type, actief_vanaf=datetime.date(2023, 1, 1)
+        )
+        prijs = PrijsFactory.create(
+            product_type=self.product_type, actief_vanaf=datetime.date(2024, 2, 1)
+        )
+
+        response = self.client.get(self.list_path, {"datum": "2024-03-01"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0]["actuele_prijs"]["id"], str(prijs.id)
+        )
+
+        response = self.client.get(self.list_path, {"datum": "2022-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["results"][0]["actuele_prijs"])
+
+    def test_get_actuele_prijs_with_datum(self):
+        prijs = PrijsFactory.create(
+            product_type=self.product_type, actief_vanaf=datetime.date(2024, 2, 1)
+        )
+
+        response = self.client.get(self.detail_path, {"datum": "2024-03-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["actuele_prijs"]["id"], str(prijs.id))
+
+    def test_get_actuele_prijzen_with_invalid_datum_returns_error(self):
+        response = self.client.get(self.list_path, {"datum": "morgen"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data), ["datum"])
+
+    def test_get_actuele_prijzen_query_count_does_not_depend_on_product_typen(self):
+        for _i in range(5):
+            product_type = ProductTypeFactory.create()
+            for day in range(1, 4):
+                prijs = PrijsFactory.create(
+                    product_type=product_type,
+                    actief_vanaf=datetime.date(2023, 1, day),
+                )
+                PrijsOptieFactory.create(prijs=prijs)
+
+        # token, count, product typen, prijzen, prijsopties
+        with self.assertNumQueries(5):
+            response = self.client.get(self.list_path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 6)
+
     def test_put_vertaling(self):
         path = reverse("producttype-vertaling", args=(self.product_type.id, "en"))
 
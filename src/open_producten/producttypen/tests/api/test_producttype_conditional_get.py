@@ -0,0 +1,154 @@
+from django.test import override_settings
+from django.urls import reverse, reverse_lazy
+
+from freezegun import freeze_time
+from rest_framework import status
+
+from open_producten.locaties.tests.factories import LocatieFactory
+from open_producten.producttypen.models import ProductType
+from open_producten.producttypen.tests.factories import (
+    ContentElementFactory,
+    LinkFactory,
+    ProductTypeFactory,
+    ThemaFactory,
+)
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+@override_settings(NOTIFICATIONS_DISABLED=True)
+class TestProductTypeConditionalGet(BaseApiTestCase):
+    path = reverse_lazy("producttype-list")
+
+    def setUp(self):
+        super().setUp()
+        with freeze_time("2024-01-01"):
+            self.thema = ThemaFactory.create()
+            self.product_type = ProductTypeFactory.create()
+            self.product_type.themas.add(self.thema)
+
+    def detail_path(self, product_type):
+        return reverse("producttype-detail", args=[product_type.id])
+
+    def test_detail_returns_validators(self):
+        response = self.client.get(self.detail_path(self.product_type))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response["Last-Modified"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertIn("Accept-Language", response["Vary"])
+
+    def test_detail_not_modified(self):
+        etag = self.client.get(self.detail_path(self.product_type))["ETag"]
+
+        with self.assertNumQueries(2):  # token & the aggregate query
+            response = self.client.get(
+                self.detail_path(self.product_type), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_detail_if_modified_since(self):
+        response = self.client.get(
+            self.detail_path(self.product_type),
+            HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2024 00:00:00 GMT",
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            self.detail_path(self.product_type),
+            HTTP_IF_MODIFIED_SINCE="Sun, 31 Dec 2023 00:00:00 GMT",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_etag_depends_on_language(self):
+        etag = self.client.get(self.detail_path(self.product_type))["ETag"]
+
+        response = self.client.get(
+            self.detail_path(self.product_type),
+            HTTP_IF_NONE_MATCH=etag,
+            HTTP_ACCEPT_LANGUAGE="en",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_of_unknown_object(self):
+        response = self.client.get(
+            reverse(
+                "producttype-detail", args=["00000000-0000-0000-0000-000000000000"]
+            ),
+            HTTP_IF_NONE_MATCH="*",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_update_changes_etag(self):
+        etag = self.client.get(self.detail_path(self.product_type))["ETag"]
+
+        self.product_type.code = "nieuw"
+        self.product_type.save()
+
+        response = self.client.get(
+            self.detail_path(self.product_type), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_related_changes_change_etag(self):
+        locatie = LocatieFactory.create()
+        self.product_type.locaties.add(locatie)
+
+        changes = {
+            "link": lambda: LinkFactory.create(product_type=self.product_type),
+            "content": lambda: ContentElementFactory.create(
+                product_type=self.product_type
+            ),
+            "locatie": locatie.save,
+            "thema": self.thema.save,
+        }
+
+        for name, change in changes.items():
+            with self.subTest(name):
+                etag = self.client.get(self.detail_path(self.product_type))["ETag"]
+                change()
+                response = self.client.get(
+                    self.detail_path(self.product_type), HTTP_IF_NONE_MATCH=etag
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_not_modified(self):
+        etag = self.client.get(self.path)["ETag"]
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotIn("Last-Modified", response)
+
+    def test_list_etag_changes_on_delete(self):
+        with freeze_time("2024-01-01"):
+            ProductTypeFactory.create()
+        etag = self.client.get(self.path)["ETag"]
+
+        ProductType.objects.exclude(pk=self.product_type.pk).delete()
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_etag_depends_on_query(self):
+        etag = self.client.get(self.path)["ETag"]
+
+        response = self.client.get(self.path, {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_content_not_modified(self):
+        path = reverse("producttype-content", args=[self.product_type.id])
+        etag = self.client.get(path)["ETag"]
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        ContentElementFactory.create(product_type=self.product_type)
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
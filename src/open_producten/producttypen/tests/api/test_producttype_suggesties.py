@@ -0,0 +1,128 @@
+from django.db import connection
+from django.urls import reverse_lazy
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from open_producten.producttypen.models import ProductType
+from open_producten.producttypen.search import get_suggesties
+from open_producten.producttypen.tests.factories import (
+    ProductTypeFactory,
+    UniformeProductNaamFactory,
+)
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+class TestProductTypeSuggesties(BaseApiTestCase):
+    path = reverse_lazy("producttype-suggesties")
+
+    def setUp(self):
+        super().setUp()
+        self.parkeervergunning = ProductTypeFactory.create(
+            naam="Parkeervergunning",
+            uniforme_product_naam=UniformeProductNaamFactory.create(
+                naam="parkeervergunning"
+            ),
+        )
+        self.bezoekersvergunning = ProductTypeFactory.create(
+            naam="Bezoekers parkeervergunning"
+        )
+        self.paspoort = ProductTypeFactory.create(naam="Paspoort")
+
+    def suggesties(self, zoek, **kwargs):
+        response = self.client.get(self.path, {"zoek": zoek, **kwargs})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_read_suggesties_without_credentials_returns_error(self):
+        response = APIClient().get(self.path, {"zoek": "par"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_zoek_is_required(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("zoek", response.data)
+
+    def test_prefix(self):
+        self.assertEqual(
+            self.suggesties("pa"),
+            [
+                {
+                    "id": str(self.parkeervergunning.id),
+                    "naam": "Parkeervergunning",
+                    "upl_naam": "parkeervergunning",
+                },
+                {
+                    "id": str(self.paspoort.id),
+                    "naam": "Paspoort",
+                    "upl_naam": self.paspoort.uniforme_product_naam.naam,
+                },
+                # a word of the naam starts with the text
+                {
+                    "id": str(self.bezoekersvergunning.id),
+                    "naam": "Bezoekers parkeervergunning",
+                    "upl_naam": self.bezoekersvergunning.uniforme_product_naam.naam,
+                },
+            ],
+        )
+
+    def test_prefix_matches_come_before_similar_words(self):
+        data = self.suggesties("parkeer")
+
+        self.assertEqual(
+            [suggestie["id"] for suggestie in data],
+            [str(self.parkeervergunning.id), str(self.bezoekersvergunning.id)],
+        )
+
+    def test_misspelling(self):
+        data = self.suggesties("pasport")
+
+        self.assertEqual(
+            [suggestie["id"] for suggestie in data], [str(self.paspoort.id)]
+        )
+
+    def test_special_characters_are_not_a_pattern(self):
+        self.assertEqual(self.suggesties("p.s"), [])
+
+    def test_aantal(self):
+        self.assertEqual(len(self.suggesties("pa", aantal=1)), 1)
+
+        response = self.client.get(self.path, {"zoek": "pa", "aantal": 51})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_gepubliceerd(self):
+        ProductType.objects.filter(pk=self.paspoort.pk).update(gepubliceerd=False)
+
+        data = self.suggesties("pa", gepubliceerd="true")
+
+        self.assertEqual(
+            [suggestie["id"] for suggestie in data],
+            [str(self.parkeervergunning.id), str(self.bezoekersvergunning.id)],
+        )
+
+    def test_language(self):
+        self.paspoort.set_current_language("en")
+        self.paspoort.naam = "Passport"
+        self.paspoort.save()
+
+        response = self.client.get(
+            self.path, {"zoek": "pas"}, HTTP_ACCEPT_LANGUAGE="en"
+        )
+
+        self.assertEqual(
+            [suggestie["naam"] for suggestie in response.data], ["Passport"]
+        )
+
+    def test_suggesties_use_trigram_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        queryset = ProductType._parler_meta.root_model.objects.filter(
+            naam__iregex="^par"
+        ) | ProductType._parler_meta.root_model.objects.filter(
+            naam__trigram_word_similar="parkeer"
+        )
+
+        self.assertIn("producttype_naam_trgm_idx", queryset.explain())
+        self.assertEqual(len(get_suggesties("parkeer", "nl", 10)), 2)
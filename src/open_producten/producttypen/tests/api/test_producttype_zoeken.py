@@ -0,0 +1,151 @@
+from django.urls import reverse_lazy
+
+from rest_framework import status
+
+from open_producten.producttypen.models import ProductType
+from open_producten.producttypen.tests.factories import (
+    ContentElementFactory,
+    ProductTypeFactory,
+    UniformeProductNaamFactory,
+)
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+class TestProductTypeZoeken(BaseApiTestCase):
+    path = reverse_lazy("producttype-zoeken")
+    list_path = reverse_lazy("producttype-list")
+
+    def setUp(self):
+        super().setUp()
+        self.parkeren = ProductTypeFactory.create(
+            naam="Parkeervergunning",
+            samenvatting="Een vergunning om uw auto in de wijk te parkeren.",
+            keywords=["auto"],
+        )
+        self.paspoort = ProductTypeFactory.create(
+            naam="Paspoort aanvragen",
+            samenvatting="Vraag een paspoort aan bij de gemeente.",
+            uniforme_product_naam=UniformeProductNaamFactory.create(
+                naam="reisdocument"
+            ),
+        )
+
+    def zoek(self, zoek, **kwargs):
+        response = self.client.get(self.path, {"zoek": zoek}, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["results"]
+
+    def test_zoek_is_required(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("zoek", response.data)
+
+    def test_zoeken_on_naam(self):
+        results = self.zoek("paspoort")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["id"], str(self.paspoort.id))
+        self.assertEqual(results[0]["naam"], "Paspoort aanvragen")
+        self.assertEqual(results[0]["upl_naam"], "reisdocument")
+        self.assertGreater(results[0]["rang"], 0)
+
+    def test_zoeken_uses_dutch_stemming(self):
+        # parkeren and parkeer share the stem of the naam
+        results = self.zoek("parkeren")
+
+        self.assertEqual([result["id"] for result in results], [str(self.parkeren.id)])
+
+    def test_zoeken_on_keywords_upn_and_content(self):
+        ContentElementFactory.create(
+            product_type=self.paspoort, content="Neem een pasfoto mee."
+        )
+
+        self.assertEqual(self.zoek("auto")[0]["id"], str(self.parkeren.id))
+        self.assertEqual(self.zoek("reisdocument")[0]["id"], str(self.paspoort.id))
+        self.assertEqual(self.zoek("pasfoto")[0]["id"], str(self.paspoort.id))
+
+    def test_zoeken_after_changes(self):
+        self.paspoort.set_current_language("nl")
+        self.paspoort.samenvatting = "Vraag een identiteitskaart aan."
+        self.paspoort.save()
+        self.paspoort.uniforme_product_naam.naam = "identiteitsbewijs"
+        self.paspoort.uniforme_product_naam.save()
+
+        self.assertEqual(len(self.zoek("identiteitskaart")), 1)
+        self.assertEqual(len(self.zoek("identiteitsbewijs")), 1)
+        self.assertEqual(len(self.zoek("gemeente")), 0)
+
+        content = ContentElementFactory.create(
+            product_type=self.paspoort, content="Neem een pasfoto mee."
+        )
+        self.assertEqual(len(self.zoek("pasfoto")), 1)
+
+        content.delete()
+        self.assertEqual(len(self.zoek("pasfoto")), 0)
+
+    def test_zoeken_is_ranked(self):
+        # the naam weighs more than the samenvatting
+        vergunning = ProductTypeFactory.create(
+            naam="Vergunning", samenvatting="Een vergunning van de gemeente."
+        )
+
+        results = self.zoek("vergunning")
+
+        self.assertEqual(
+            [result["id"] for result in results],
+            [str(vergunning.id), str(self.parkeren.id)],
+        )
+        self.assertGreater(results[0]["rang"], results[1]["rang"])
+
+    def test_zoeken_highlights_fragment(self):
+        results = self.zoek("gemeente")
+
+        self.assertEqual(
+            results[0]["fragment"],
+            "Vraag een paspoort aan bij de <mark>gemeente</mark>",
+        )
+
+    def test_zoeken_with_websearch_syntax(self):
+        self.assertEqual(len(self.zoek("paspoort or parkeervergunning")), 2)
+        self.assertEqual(len(self.zoek('"bij de gemeente"')), 1)
+        self.assertEqual(len(self.zoek("vergunning -auto")), 0)
+
+    def test_zoeken_in_english(self):
+        self.paspoort.set_current_language("en")
+        self.paspoort.naam = "Passport"
+        self.paspoort.samenvatting = "Applying for passports at the municipality."
+        self.paspoort.save()
+
+        results = self.zoek("applied passport", HTTP_ACCEPT_LANGUAGE="en")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["naam"], "Passport")
+        self.assertEqual(
+            results[0]["fragment"],
+            "<mark>Applying</mark> for <mark>passports</mark> at the municipality",
+        )
+        self.assertEqual(self.zoek("passport"), [])
+
+    def test_zoeken_with_filters(self):
+        ProductType.objects.filter(pk=self.parkeren.pk).update(gepubliceerd=False)
+
+        response = self.client.get(
+            self.path, {"zoek": "vergunning or paspoort", "gepubliceerd": "true"}
+        )
+
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], str(self.paspoort.id))
+
+    def test_zoek_filter(self):
+        vergunning = ProductTypeFactory.create(
+            naam="Vergunning", samenvatting="Een vergunning van de gemeente."
+        )
+
+        response = self.client.get(self.list_path, {"zoek": "vergunning"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in response.data["results"]],
+            [str(vergunning.id), str(self.parkeren.id)],
+        )
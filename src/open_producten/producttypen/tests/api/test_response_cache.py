@@ -0,0 +1,220 @@
+import datetime
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+from open_producten.locaties.tests.factories import LocatieFactory
+from open_producten.producttypen.tests.factories import (
+    ContentElementFactory,
+    PrijsFactory,
+    ProductTypeFactory,
+    ThemaFactory,
+)
+from open_producten.utils.cache import response_cache
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+CACHES = settings.CACHES | {
+    "api": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(
+    CACHES=CACHES, API_RESPONSE_CACHE_TIMEOUT=300, NOTIFICATIONS_DISABLED=True
+)
+class TestResponseCache(BaseApiTestCase):
+    path = reverse_lazy("producttype-list")
+
+    def setUp(self):
+        super().setUp()
+        response_cache.cache.clear()
+
+        self.thema = ThemaFactory.create()
+        self.product_type = ProductTypeFactory.create(code="A")
+        self.product_type.themas.add(self.thema)
+        self.detail_path = reverse("producttype-detail", args=[self.product_type.id])
+
+    def change(self, func, *args, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return func(*args, **kwargs)
+
+    def test_list_is_cached(self):
+        response = self.client.get(self.path)
+
+        with self.assertNumQueries(1):  # token
+            cached_response = self.client.get(self.path)
+
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.json(), response.json())
+        self.assertEqual(cached_response["ETag"], response["ETag"])
+        self.assertEqual(cached_response["Content-Type"], "application/json")
+
+    def test_hits_and_misses_are_counted(self):
+        def get_count(result):
+            return (
+                REGISTRY.get_sample_value(
+                    "open_producten_cache_requests_total",
+                    {"cache": "api", "result": result},
+                )
+                or 0
+            )
+
+        hits, misses = get_count("hit"), get_count("miss")
+
+        self.client.get(self.path)
+        self.client.get(self.path)
+
+        self.assertEqual(get_count("hit"), hits + 1)
+        self.assertEqual(get_count("miss"), misses + 1)
+
+    def test_requires_authentication(self):
+        self.client.get(self.path)
+        self.client.credentials()
+
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_key_uses_normalised_query_and_language(self):
+        self.client.get(self.path, {"code": "A", "page_size": 10})
+
+        with self.assertNumQueries(1):
+            self.client.get(f"{self.path}?page_size=10&code=A")
+
+        response = self.client.get(self.path, {"code": "B"})
+        self.assertEqual(response.json()["count"], 0)
+
+        response = self.client.get(
+            self.path, {"code": "A", "page_size": 10}, HTTP_ACCEPT_LANGUAGE="en"
+        )
+        self.assertEqual(response["Content-Language"], "en")
+
+    def test_cached_response_not_modified(self):
+        etag = self.client.get(self.detail_path)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_product_type_change_invalidates(self):
+        self.client.get(self.path)
+        self.client.get(self.detail_path)
+
+        self.product_type.code = "B"
+        self.change(self.product_type.save)
+
+        self.assertEqual(self.client.get(self.path).json()["results"][0]["code"], "B")
+        self.assertEqual(self.client.get(self.detail_path).json()["code"], "B")
+
+    def test_change_of_other_product_type_keeps_detail(self):
+        self.client.get(self.detail_path)
+
+        self.change(ProductTypeFactory.create)
+
+        with self.assertNumQueries(1):
+            self.client.get(self.detail_path)
+
+    def test_thema_change_invalidates_product_type(self):
+        self.client.get(self.detail_path)
+        thema_path = reverse("thema-detail", args=[self.thema.id])
+        self.client.get(thema_path)
+
+        self.thema.naam = "Nieuw"
+        self.change(self.thema.save)
+
+        self.assertEqual(
+            self.client.get(self.detail_path).json()["themas"][0]["naam"], "Nieuw"
+        )
+        self.assertEqual(self.client.get(thema_path).json()["naam"], "Nieuw")
+
+    def test_product_type_change_invalidates_thema(self):
+        thema_path = reverse("thema-detail", args=[self.thema.id])
+        self.client.get(thema_path)
+
+        self.product_type.code = "B"
+        self.change(self.product_type.save)
+
+        self.assertEqual(
+            self.client.get(thema_path).json()["product_typen"][0]["code"], "B"
+        )
+
+    def test_m2m_change_invalidates(self):
+        thema = ThemaFactory.create()
+        thema_path = reverse("thema-detail", args=[thema.id])
+        self.client.get(thema_path)
+        self.client.get(self.detail_path)
+
+        self.change(self.product_type.themas.add, thema)
+
+        self.assertEqual(len(self.client.get(thema_path).json()["product_typen"]), 1)
+        self.assertEqual(len(self.client.get(self.detail_path).json()["themas"]), 2)
+
+    def test_prijs_invalidates_actuele_prijs(self):
+        path = reverse("producttype-actuele-prijs", args=[self.product_type.id])
+        self.assertIsNone(self.client.get(path).json()["actuele_prijs"])
+
+        self.change(
+            PrijsFactory.create,
+            product_type=self.product_type,
+            actief_vanaf=datetime.date(2024, 1, 1),
+        )
+
+        self.assertIsNotNone(self.client.get(path).json()["actuele_prijs"])
+
+    def test_locatie_invalidates(self):
+        locatie = LocatieFactory.create(naam="oud")
+        self.product_type.locaties.add(locatie)
+        self.client.get(self.detail_path)
+
+        locatie.naam = "nieuw"
+        self.change(locatie.save)
+
+        self.assertEqual(
+            self.client.get(self.detail_path).json()["locaties"][0]["naam"], "nieuw"
+        )
+
+        self.change(locatie.delete)
+
+        self.assertEqual(self.client.get(self.detail_path).json()["locaties"], [])
+
+    def test_content_invalidates(self):
+        path = reverse("producttype-content", args=[self.product_type.id])
+        self.assertEqual(self.client.get(path).json(), [])
+
+        content_element = self.change(
+            ContentElementFactory.create, product_type=self.product_type
+        )
+        self.assertEqual(len(self.client.get(path).json()), 1)
+
+        content_path = reverse("content-detail", args=[content_element.id])
+        self.client.get(content_path)
+
+        content_element.content = "nieuw"
+        self.change(content_element.save)
+
+        self.assertEqual(self.client.get(content_path).json()["content"], "nieuw")
+        self.assertEqual(self.client.get(path).json()[0]["content"], "nieuw")
+
+    def test_clear_cache_command(self):
+        self.client.get(self.path)
+
+        call_command("clear_cache", alias="api")
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.path)
+        self.assertGreater(len(context), 1)
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.client.get(self.detail_path)
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.detail_path)
+        self.assertGreater(len(context), 1)
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext as _
 
@@ -508,3 +510,134 @@ class TestThemaViewSet(BaseApiTestCase):
             response.data,
             {"hoofd_thema": ["Een thema kan niet zijn eigen hoofd thema zijn."]},
         )
+
+    def test_delete_thema_checks_product_typen_in_constant_queries(self):
+        thema = ThemaFactory.create()
+        other_thema = ThemaFactory.create()
+        ProductTypeFactory.create(naam="a").themas.set([thema])
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.delete(self.detail_path(thema))
+        query_count = len(context.captured_queries)
+
+        ProductTypeFactory.create(naam="b").themas.set([thema])
+        for i in range(5):
+            ProductTypeFactory.create().themas.set([thema, other_thema])
+
+        with self.assertNumQueries(query_count):
+            response = self.client.delete(self.detail_path(thema))
+
+        self.assertCountEqual(
+            response.data["product_typen"],
+            [
+                "Product Type a moet aan een minimaal één thema zijn gelinkt.",
+                "Product Type b moet aan een minimaal één thema zijn gelinkt.",
+            ],
+        )
+
+
+class TestThemaPublicatie(BaseApiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.hoofd_thema = ThemaFactory.create(gepubliceerd=False)
+        self.sub_thema = ThemaFactory.create(
+            hoofd_thema=self.hoofd_thema, gepubliceerd=False
+        )
+        self.sub_sub_thema = ThemaFactory.create(
+            hoofd_thema=self.sub_thema, gepubliceerd=False
+        )
+
+    def publish_path(self, thema):
+        return reverse("thema-publiceren", args=[thema.id])
+
+    def unpublish_path(self, thema):
+        return reverse("thema-depubliceren", args=[thema.id])
+
+    def assertGepubliceerd(self, gepubliceerd, *themas):
+        for thema in themas:
+            thema.refresh_from_db()
+            self.assertEqual(thema.gepubliceerd, gepubliceerd)
+
+    def test_publish_boom(self):
+        update_datum = self.sub_thema.update_datum
+
+        response = self.client.post(self.publish_path(self.hoofd_thema))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], str(self.hoofd_thema.id))
+        self.assertTrue(response.data["gepubliceerd"])
+        self.assertTrue(response.data["sub_themas"][0]["sub_themas"][0]["gepubliceerd"])
+        self.assertGepubliceerd(
+            True, self.hoofd_thema, self.sub_thema, self.sub_sub_thema
+        )
+        self.assertGreater(self.sub_thema.update_datum, update_datum)
+
+    def test_publish_boom_with_unpublished_hoofd_thema_returns_error(self):
+        response = self.client.post(self.publish_path(self.sub_thema))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data,
+            {
+                "hoofd_thema": [
+                    "Thema's moeten gepubliceerd zijn voordat sub-thema's kunnen worden gepubliceerd."
+                ]
+            },
+        )
+        self.assertGepubliceerd(False, self.sub_thema, self.sub_sub_thema)
+
+    def test_publish_sub_boom(self):
+        Thema.objects.filter(pk=self.hoofd_thema.pk).update(gepubliceerd=True)
+
+        response = self.client.post(self.publish_path(self.sub_thema))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGepubliceerd(True, self.sub_thema, self.sub_sub_thema)
+
+    def test_unpublish_boom(self):
+        Thema.objects.update(gepubliceerd=True)
+        hoofd_thema_update_datum = Thema.objects.get(
+            pk=self.hoofd_thema.pk
+        ).update_datum
+
+        response = self.client.post(self.unpublish_path(self.sub_thema))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGepubliceerd(True, self.hoofd_thema)
+        self.assertGepubliceerd(False, self.sub_thema, self.sub_sub_thema)
+        self.assertEqual(self.hoofd_thema.update_datum, hoofd_thema_update_datum)
+
+    def test_unchanged_themas_are_not_updated(self):
+        Thema.objects.exclude(pk=self.hoofd_thema.pk).update(gepubliceerd=True)
+        update_datums = dict(Thema.objects.values_list("pk", "update_datum"))
+
+        response = self.client.post(self.unpublish_path(self.hoofd_thema))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGepubliceerd(
+            False, self.hoofd_thema, self.sub_thema, self.sub_sub_thema
+        )
+        self.assertEqual(
+            self.hoofd_thema.update_datum, update_datums[self.hoofd_thema.pk]
+        )
+        self.assertGreater(
+            self.sub_thema.update_datum, update_datums[self.sub_thema.pk]
+        )
+
+    def test_publish_boom_in_constant_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.publish_path(self.hoofd_thema))
+        query_count = len(context.captured_queries)
+
+        Thema.objects.update(gepubliceerd=False)
+        for i in range(5):
+            thema = ThemaFactory.create(
+                hoofd_thema=self.sub_sub_thema, gepubliceerd=False
+            )
+            ThemaFactory.create(hoofd_thema=thema, gepubliceerd=False)
+
+        with self.assertNumQueries(query_count):
+            self.client.post(self.publish_path(self.hoofd_thema))
+
+        self.assertFalse(Thema.objects.filter(gepubliceerd=False).exists())
@@ -0,0 +1,153 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from open_producten.producttypen.models import Thema
+from open_producten.producttypen.tests.factories import ProductTypeFactory, ThemaFactory
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+class TestThemaBoom(BaseApiTestCase):
+    path = reverse_lazy("thema-boom")
+
+    def setUp(self):
+        super().setUp()
+        self.hoofd_thema = ThemaFactory.create(naam="a")
+        self.sub_thema = ThemaFactory.create(naam="b", hoofd_thema=self.hoofd_thema)
+        self.sub_sub_thema = ThemaFactory.create(
+            naam="c", hoofd_thema=self.sub_thema, gepubliceerd=False
+        )
+        self.other_hoofd_thema = ThemaFactory.create(naam="d")
+
+        product_type = ProductTypeFactory.create()
+        product_type.themas.set([self.hoofd_thema, self.sub_thema])
+        unpublished_product_type = ProductTypeFactory.create(gepubliceerd=False)
+        unpublished_product_type.themas.set([self.sub_thema])
+
+    def node(self, thema, product_typen_aantal=0, sub_themas=None):
+        return {
+            "id": str(thema.id),
+            "naam": thema.naam,
+            "beschrijving": thema.beschrijving,
+            "gepubliceerd": thema.gepubliceerd,
+            "product_typen_aantal": product_typen_aantal,
+            "sub_themas": sub_themas or [],
+        }
+
+    def test_read_boom_without_credentials_returns_error(self):
+        response = APIClient().get(self.path)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_read_boom(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                self.node(
+                    self.hoofd_thema,
+                    1,
+                    [self.node(self.sub_thema, 2, [self.node(self.sub_sub_thema)])],
+                ),
+                self.node(self.other_hoofd_thema),
+            ],
+        )
+
+    def test_read_sub_boom(self):
+        response = self.client.get(self.path, {"thema": self.sub_thema.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [self.node(self.sub_thema, 2, [self.node(self.sub_sub_thema)])],
+        )
+
+    def test_read_boom_of_unknown_thema_returns_error(self):
+        response = self.client.get(
+            self.path, {"thema": "00000000-0000-0000-0000-000000000000"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("thema", response.data)
+
+    def test_read_published_boom(self):
+        response = self.client.get(self.path, {"gepubliceerd": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                self.node(self.hoofd_thema, 1, [self.node(self.sub_thema, 1)]),
+                self.node(self.other_hoofd_thema),
+            ],
+        )
+
+    def test_read_unpublished_boom(self):
+        self.hoofd_thema.gepubliceerd = False
+        self.hoofd_thema.save()
+
+        response = self.client.get(self.path, {"gepubliceerd": "false"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # the unpublished sub sub thema is excluded with its published hoofd thema
+        self.assertEqual(response.data, [self.node(self.hoofd_thema)])
+
+    def test_boom_is_not_paginated(self):
+        response = self.client.get(self.path, {"page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_number_of_queries_does_not_depend_on_boom_size(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.path)
+        query_count = len(context.captured_queries)
+
+        for i in range(5):
+            thema = ThemaFactory.create(hoofd_thema=self.sub_sub_thema)
+            ThemaFactory.create(hoofd_thema=thema)
+            ProductTypeFactory.create().themas.set([thema])
+
+        with self.assertNumQueries(query_count):
+            response = self.client.get(self.path)
+
+        self.assertEqual(len(response.data[0]["sub_themas"][0]["sub_themas"]), 1)
+        self.assertEqual(
+            len(response.data[0]["sub_themas"][0]["sub_themas"][0]["sub_themas"]), 5
+        )
+
+    def test_boom_with_cycle(self):
+        # a cycle can not be created through the api, but must not break the boom
+        Thema.objects.filter(pk=self.hoofd_thema.pk).update(
+            hoofd_thema=self.sub_sub_thema
+        )
+
+        response = self.client.get(self.path, {"thema": self.hoofd_thema.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sub_sub_thema = response.data[0]["sub_themas"][0]["sub_themas"][0]
+        self.assertEqual(sub_sub_thema["id"], str(self.sub_sub_thema.id))
+        self.assertEqual(sub_sub_thema["sub_themas"], [])
+
+
+class TestThemaQueries(BaseApiTestCase):
+
+    def test_read_themas_prefetches_product_typen(self):
+        path = reverse_lazy("thema-list")
+        thema = ThemaFactory.create()
+        ProductTypeFactory.create().themas.set([thema])
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(path)
+        query_count = len(context.captured_queries)
+
+        for i in range(5):
+            thema = ThemaFactory.create()
+            ProductTypeFactory.create().themas.set([thema])
+
+        with self.assertNumQueries(query_count):
+            self.client.get(path)
@@ -0,0 +1,98 @@
+from django.db import connection
+from django.test import RequestFactory, TestCase
+
+from open_producten.producttypen.models import (
+    ExterneCode,
+    Parameter,
+    ProductType,
+    UniformeProductNaam,
+)
+from open_producten.producttypen.models.producttype import ProductStateChoices
+from open_producten.producttypen.viewsets.producttype import ProductTypeFilterSet
+
+# large enough for the planner to prefer an index over a sequential scan
+PRODUCT_TYPEN_AANTAL = 2000
+
+
+class TestProductTypeFilterIndexes(TestCase):
+    """
+    The filters of the product typen use an index instead of scanning the tables.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        upn = UniformeProductNaam.objects.create(
+            naam="upn", uri="https://example.com/upn"
+        )
+        product_typen = ProductType.objects.bulk_create(
+            ProductType(
+                code=f"code {i}",
+                uniforme_product_naam=upn,
+                keywords=["algemeen", f"keyword {i % 200}"],
+                toegestane_statussen=(
+                    [ProductStateChoices.VERLOPEN]
+                    if i % 500 == 0
+                    else [ProductStateChoices.GEREED, ProductStateChoices.ACTIEF]
+                ),
+            )
+            for i in range(PRODUCT_TYPEN_AANTAL)
+        )
+        ExterneCode.objects.bulk_create(
+            ExterneCode(naam=naam, code=str(i), product_type=product_type)
+            for i, product_type in enumerate(product_typen)
+            for naam in ("ISO", "OSI", "CBS")
+        )
+        Parameter.objects.bulk_create(
+            Parameter(naam=naam, waarde=str(i), product_type=product_type)
+            for i, product_type in enumerate(product_typen)
+            for naam in ("doelgroep", "kanaal", "afdeling")
+        )
+
+        with connection.cursor() as cursor:
+            for model in (ProductType, ExterneCode, Parameter):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+            # the rows are added to the pending list of the gin indexes, which is
+            # merged into the index by (auto)vacuum
+            for index in ("producttype_keywords_idx", "producttype_statussen_idx"):
+                cursor.execute("SELECT gin_clean_pending_list(%s::regclass)", [index])
+
+    def filter(self, params):
+        request = RequestFactory().get("/", params)
+        request.LANGUAGE_CODE = "nl"
+        return ProductTypeFilterSet(
+            request.GET, queryset=ProductType.objects.all(), request=request
+        ).qs
+
+    def test_keywords_filter_uses_index(self):
+        queryset = self.filter({"keywords": "keyword 10,keyword 20"})
+
+        self.assertIn("producttype_keywords_idx", queryset.explain())
+        self.assertEqual(queryset.count(), 20)
+
+    def test_toegestane_statussen_filter_uses_index(self):
+        queryset = self.filter({"toegestane_statussen": "verlopen"})
+
+        self.assertIn("producttype_statussen_idx", queryset.explain())
+        self.assertEqual(queryset.count(), 4)
+
+    def test_externe_code_filter_uses_index(self):
+        queryset = self.filter({"externe_code": ["[ISO:10]", "[OSI:10]"]})
+
+        self.assertIn("externecode_naam_code_idx", queryset.explain())
+        self.assertEqual(queryset.get().code, "code 10")
+
+    def test_parameter_filter_uses_index(self):
+        queryset = self.filter({"parameter": "[doelgroep:10]"})
+
+        self.assertIn("parameter_naam_waarde_idx", queryset.explain())
+        self.assertEqual(queryset.get().code, "code 10")
+
+    def test_relation_filters_do_not_join(self):
+        queryset = self.filter(
+            {"externe_code": "[ISO:10]", "parameter": "[doelgroep:10]"}
+        )
+        sql = str(queryset.query)
+
+        self.assertEqual(sql.count("EXISTS"), 2)
+        self.assertNotIn("JOIN", sql)
+        self.assertNotIn("DISTINCT", sql)
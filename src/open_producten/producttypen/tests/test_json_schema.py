@@ -1,11 +1,22 @@
+import json
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
+from open_producten.producttypen.models.jsonschema import (
+    JsonSchema,
+    ValidatorCache,
+    validator_cache,
+)
 from open_producten.producttypen.tests.factories import JsonSchemaFactory
 
 
 class TestJsonSchema(TestCase):
     def setUp(self):
+        validator_cache.clear()
+        self.addCleanup(validator_cache.clear)
+
         self.schema = JsonSchemaFactory.create(
             schema={
                 "type": "object",
@@ -40,3 +51,71 @@ class TestJsonSchema(TestCase):
 
     def test_clean_with_valid_schema(self):
         self.schema.clean()
+
+    def test_validator_is_cached(self):
+        self.schema.validate({"price": 10, "name": "test"})
+        self.schema.validate({"price": 20, "name": "test"})
+
+        info = validator_cache.info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 1)
+        self.assertEqual(info["size"], 1)
+
+    def test_cached_validator_is_invalidated_on_save(self):
+        self.schema.validate({"price": 10, "name": "test"})
+
+        self.schema.schema["required"] = ["price"]
+        self.schema.save()
+
+        self.assertEqual(validator_cache.info()["size"], 0)
+        self.schema.validate({"price": 10})
+
+    def test_changed_schema_is_not_validated_with_stale_validator(self):
+        self.schema.validate({"price": 10, "name": "test"})
+
+        # changed by another process, the cache of this process is not invalidated
+        JsonSchema.objects.filter(pk=self.schema.pk).update(
+            schema={**self.schema.schema, "required": ["price", "name", "description"]}
+        )
+        schema = JsonSchema.objects.get(pk=self.schema.pk)
+
+        with self.assertRaisesMessage(
+            ValidationError, "'description' is a required property"
+        ):
+            schema.validate({"price": 10, "name": "test"})
+
+        self.schema.refresh_from_db()
+        with self.assertRaisesMessage(
+            ValidationError, "'description' is a required property"
+        ):
+            self.schema.validate({"price": 10, "name": "test"})
+
+    def test_schema_is_serialized_once(self):
+        with patch(
+            "open_producten.producttypen.models.jsonschema.json.dumps",
+            wraps=json.dumps,
+        ) as mock_dumps:
+            for price in range(3):
+                self.schema.validate({"price": price, "name": "test"})
+
+        mock_dumps.assert_called_once()
+
+
+class TestValidatorCache(TestCase):
+    def test_cache_size_is_bounded(self):
+        cache = ValidatorCache("test", maxsize=2)
+        schemas = [
+            JsonSchemaFactory.create(schema={"type": "object", "minProperties": i})
+            for i in range(3)
+        ]
+
+        for schema in schemas:
+            cache.get(schema)
+
+        self.assertEqual(cache.info()["size"], 2)
+
+        # least recently used schema was evicted
+        cache.get(schemas[0])
+        self.assertEqual(cache.info()["misses"], 4)
+        cache.get(schemas[2])
+        self.assertEqual(cache.info()["hits"], 1)
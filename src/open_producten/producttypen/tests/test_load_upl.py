@@ -1,5 +1,8 @@
 import os
+import re
 from io import StringIO
+from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
 from django.core.management import CommandError, call_command
 from django.test import TestCase
@@ -7,11 +10,16 @@ from django.test import TestCase
 import requests_mock
 from requests.exceptions import ConnectionError
 
-from open_producten.producttypen.models import UniformeProductNaam
-from open_producten.producttypen.tests.factories import UniformeProductNaamFactory
+from open_producten.producttypen.models import ProductType, UniformeProductNaam
+from open_producten.producttypen.tests.factories import (
+    ProductTypeFactory,
+    UniformeProductNaamFactory,
+)
 
 TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
+TIMINGS = "reading and upserting 0.00s, marking deleted 0.00s, total 0.00s\n"
+
 
 class TestLoadUPLCommand(TestCase):
 
@@ -30,7 +38,7 @@ class TestLoadUPLCommand(TestCase):
             stderr=StringIO(),
             **kwargs,
         )
-        return out.getvalue()
+        return re.sub(r"\d+\.\d{2}s", "0.00s", out.getvalue())
 
     def test_call_command_without_file_and_url(self):
         with self.assertRaisesMessage(
@@ -53,7 +61,8 @@ class TestLoadUPLCommand(TestCase):
         result = self.call_command("--file", self.path)
         self.assertEqual(
             result,
-            f"Importing upn from {self.path}...\nDone\nCreated 1 product names.\nUpdated 0 product names.\n0 product names did not exist in the csv.\n",
+            f"Importing upn from {self.path}...\nDone\nCreated 1 product names.\nUpdated 0 product names.\n0 product names did not exist in the csv.\n"
+            + TIMINGS,
         )
 
         self.assertEqual(UniformeProductNaam.objects.count(), 1)
@@ -97,7 +106,8 @@ class TestLoadUPLCommand(TestCase):
 
         self.assertEqual(
             result,
-            "Importing upn from https://test/upl.csv...\nDone\nCreated 1 product names.\nUpdated 0 product names.\n0 product names did not exist in the csv.\n",
+            "Importing upn from https://test/upl.csv...\nDone\nCreated 1 product names.\nUpdated 0 product names.\n0 product names did not exist in the csv.\n"
+            + TIMINGS,
         )
 
         self.assertEqual(UniformeProductNaam.objects.count(), 1)
@@ -115,7 +125,8 @@ class TestLoadUPLCommand(TestCase):
         result = self.call_command("--file", path)
         self.assertEqual(
             result,
-            f"Importing upn from {path}...\nSkipping index 0 because of missing column(s) URI or UniformeProductnaam.\nDone\nCreated 0 product names.\nUpdated 0 product names.\n0 product names did not exist in the csv.\n",
+            f"Importing upn from {path}...\nSkipping index 0 because of missing column(s) URI or UniformeProductnaam.\nDone\nCreated 0 product names.\nUpdated 0 product names.\n0 product names did not exist in the csv.\n"
+            + TIMINGS,
         )
 
         self.assertEqual(UniformeProductNaam.objects.count(), 0)
@@ -136,7 +147,8 @@ class TestLoadUPLCommand(TestCase):
         result = self.call_command("--file", self.path)
         self.assertEqual(
             result,
-            f"Importing upn from {self.path}...\nDone\nCreated 0 product names.\nUpdated 1 product names.\n0 product names did not exist in the csv.\n",
+            f"Importing upn from {self.path}...\nDone\nCreated 0 product names.\nUpdated 1 product names.\n0 product names did not exist in the csv.\n"
+            + TIMINGS,
         )
 
         self.assertEqual(UniformeProductNaam.objects.count(), 1)
@@ -156,10 +168,107 @@ class TestLoadUPLCommand(TestCase):
         result = self.call_command("--file", self.path)
         self.assertEqual(
             result,
-            f"Importing upn from {self.path}...\nDone\nCreated 1 product names.\nUpdated 0 product names.\n1 product names did not exist in the csv.\n",
+            f"Importing upn from {self.path}...\nDone\nCreated 1 product names.\nUpdated 0 product names.\n1 product names did not exist in the csv.\n"
+            + TIMINGS,
         )
 
         self.assertEqual(UniformeProductNaam.objects.count(), 2)
         self.assertEqual(
             UniformeProductNaam.objects.filter(is_verwijderd=True).get().naam, upn.naam
         )
+
+    def test_deleted_upn_in_csv_is_restored(self):
+        UniformeProductNaamFactory.create(
+            naam="aangifte vertrek buitenland",
+            uri="http://standaarden.overheid.nl/owms/terms/AangifteVertrekBuitenland",
+            is_verwijderd=True,
+        )
+
+        self.call_command("--file", self.path)
+
+        self.assertFalse(UniformeProductNaam.objects.get().is_verwijderd)
+
+    def test_changed_upn_updates_product_type(self):
+        upn = UniformeProductNaamFactory.create(
+            uri="http://standaarden.overheid.nl/owms/terms/AangifteVertrekBuitenland"
+        )
+        product_type = ProductTypeFactory.create(uniforme_product_naam=upn)
+        update_datum = product_type.update_datum
+
+        self.call_command("--file", self.path)
+
+        product_type.refresh_from_db()
+        self.assertGreater(product_type.update_datum, update_datum)
+
+    def test_unchanged_upn_does_not_update_product_type(self):
+        upn = UniformeProductNaamFactory.create(
+            naam="aangifte vertrek buitenland",
+            uri="http://standaarden.overheid.nl/owms/terms/AangifteVertrekBuitenland",
+        )
+        deleted = UniformeProductNaamFactory.create(is_verwijderd=True)
+        product_types = [
+            ProductTypeFactory.create(uniforme_product_naam=upn),
+            ProductTypeFactory.create(uniforme_product_naam=deleted),
+        ]
+
+        result = self.call_command("--file", self.path)
+
+        self.assertIn("Updated 1 product names.", result)
+        self.assertIn("1 product names did not exist in the csv.", result)
+        for product_type in product_types:
+            self.assertEqual(
+                ProductType.objects.get(pk=product_type.pk).update_datum,
+                product_type.update_datum,
+            )
+
+    @patch("open_producten.producttypen.upl.CHUNK_SIZE", 2)
+    def test_upserts_in_chunks(self):
+        rows = "\n".join(
+            f"upn {i},http://standaarden.overheid.nl/owms/terms/upn{i % 4}"
+            for i in range(5)
+        )
+        UniformeProductNaamFactory.create(
+            uri="http://standaarden.overheid.nl/owms/terms/upn3"
+        )
+
+        with NamedTemporaryFile("w", suffix=".csv") as f:
+            f.write(f"UniformeProductnaam,URI\n{rows}\n")
+            f.flush()
+
+            result = self.call_command("--file", f.name)
+
+        self.assertIn("Created 3 product names.\nUpdated 2 product names.", result)
+        self.assertEqual(
+            dict(UniformeProductNaam.objects.values_list("uri", "naam")),
+            {
+                "http://standaarden.overheid.nl/owms/terms/upn0": "upn 4",
+                "http://standaarden.overheid.nl/owms/terms/upn1": "upn 1",
+                "http://standaarden.overheid.nl/owms/terms/upn2": "upn 2",
+                "http://standaarden.overheid.nl/owms/terms/upn3": "upn 3",
+            },
+        )
+
+    def test_streams_csv_url(self):
+        with open(self.path, "rb") as f:
+            self.requests_mock.get(url="https://test/upl.csv", body=f)
+
+            self.call_command("--url", "https://test/upl.csv")
+
+        self.assertEqual(
+            UniformeProductNaam.objects.get().naam, "aangifte vertrek buitenland"
+        )
+
+    def test_changed_upn_updates_zoek_index(self):
+        upn = UniformeProductNaamFactory.create(
+            naam="vertrek",
+            uri="http://standaarden.overheid.nl/owms/terms/AangifteVertrekBuitenland",
+        )
+        product_type = ProductTypeFactory.create(uniforme_product_naam=upn)
+
+        self.call_command("--file", self.path)
+
+        self.assertTrue(
+            ProductType.objects.zoek("buitenland", "nl")
+            .filter(pk=product_type.pk)
+            .exists()
+        )
@@ -0,0 +1,159 @@
+import os
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from open_producten.producttypen.models import ProductType, UniformeProductNaam
+from open_producten.producttypen.models.upn import UplSynchronisatieStatus
+from open_producten.producttypen.tasks import synchronise_upl
+from open_producten.producttypen.tests.factories import (
+    ProductTypeFactory,
+    UniformeProductNaamFactory,
+)
+from open_producten.producttypen.upl import sync_upl
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+URL = "https://test/upl.csv"
+ETAG = '"abc"'
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class TestSyncUpl(TestCase):
+
+    def setUp(self):
+        self.requests_mock = requests_mock.Mocker()
+        self.requests_mock.start()
+        self.addCleanup(self.requests_mock.stop)
+
+        with open(os.path.join(TESTS_DIR, "data/upl.csv"), "rb") as f:
+            self.content = f.read()
+
+    def mock_upl(self, **kwargs):
+        self.requests_mock.get(
+            URL,
+            content=self.content,
+            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED},
+            **kwargs,
+        )
+
+    def test_sync(self):
+        UniformeProductNaamFactory.create()
+        self.mock_upl()
+
+        sync = sync_upl(URL)
+
+        self.assertEqual(sync.status, UplSynchronisatieStatus.GEWIJZIGD)
+        self.assertEqual(sync.etag, ETAG)
+        self.assertEqual(sync.last_modified, LAST_MODIFIED)
+        self.assertEqual((sync.aangemaakt, sync.gewijzigd, sync.verwijderd), (1, 0, 1))
+        self.assertIsNotNone(sync.duur)
+        self.assertEqual(
+            UniformeProductNaam.objects.filter(is_verwijderd=False).count(), 1
+        )
+        self.assertNotIn("If-None-Match", self.requests_mock.last_request.headers)
+
+    def test_sync_sends_conditional_request(self):
+        self.mock_upl()
+        sync_upl(URL)
+
+        self.requests_mock.get(URL, status_code=304)
+        sync = sync_upl(URL)
+
+        headers = self.requests_mock.last_request.headers
+        self.assertEqual(headers["If-None-Match"], ETAG)
+        self.assertEqual(headers["If-Modified-Since"], LAST_MODIFIED)
+        self.assertEqual(sync.status, UplSynchronisatieStatus.ONGEWIJZIGD)
+        # kept for the next request
+        self.assertEqual(sync.etag, ETAG)
+        self.assertEqual(sync.last_modified, LAST_MODIFIED)
+
+    def test_sync_only_writes_changed_rows(self):
+        upn = UniformeProductNaamFactory.create(
+            naam="aangifte vertrek buitenland",
+            uri="http://standaarden.overheid.nl/owms/terms/AangifteVertrekBuitenland",
+        )
+        product_type = ProductTypeFactory.create(uniforme_product_naam=upn)
+        self.mock_upl()
+
+        sync = sync_upl(URL)
+
+        self.assertEqual(sync.gewijzigd, 0)
+        self.assertEqual(
+            ProductType.objects.get(pk=product_type.pk).update_datum,
+            product_type.update_datum,
+        )
+
+        self.content = self.content.replace(
+            b"aangifte vertrek buitenland", b"aangifte vertrek"
+        )
+        self.mock_upl()
+
+        sync = sync_upl(URL)
+
+        self.assertEqual(sync.gewijzigd, 1)
+        upn.refresh_from_db()
+        self.assertEqual(upn.naam, "aangifte vertrek")
+        self.assertGreater(
+            ProductType.objects.get(pk=product_type.pk).update_datum,
+            product_type.update_datum,
+        )
+
+    def test_failed_sync(self):
+        self.mock_upl()
+        sync_upl(URL)
+
+        self.requests_mock.get(URL, status_code=500)
+        with self.assertLogs("open_producten.producttypen.upl", "ERROR"):
+            sync = sync_upl(URL)
+
+        self.assertEqual(sync.status, UplSynchronisatieStatus.MISLUKT)
+        self.assertIn("500 Server Error", sync.foutmelding)
+
+        # the headers of the last successful download are used
+        self.requests_mock.get(URL, status_code=304)
+        sync_upl(URL)
+        self.assertEqual(self.requests_mock.last_request.headers["If-None-Match"], ETAG)
+
+    def test_not_modified_without_previous_sync(self):
+        self.requests_mock.get(URL, status_code=304)
+
+        with self.assertLogs("open_producten.producttypen.upl", "ERROR"):
+            sync = sync_upl(URL)
+
+        self.assertEqual(sync.status, UplSynchronisatieStatus.MISLUKT)
+        self.assertEqual(
+            sync.foutmelding,
+            "The server responded 304 Not Modified to an unconditional request.",
+        )
+
+    def test_invalid_csv(self):
+        self.requests_mock.get(URL, text="naam,uri\n")
+
+        with self.assertLogs("open_producten.producttypen.upl", "ERROR"):
+            sync = sync_upl(URL)
+
+        self.assertEqual(sync.status, UplSynchronisatieStatus.MISLUKT)
+        self.assertEqual(
+            sync.foutmelding,
+            "Column(s) 'URI', 'UniformeProductnaam' do not exist in the CSV.",
+        )
+
+
+class TestSynchroniseUplTask(TestCase):
+
+    @override_settings(UPL_URL=URL)
+    @patch("open_producten.producttypen.tasks.sync_upl")
+    def test_task(self, mock_sync):
+        synchronise_upl()
+
+        mock_sync.assert_called_once_with(URL)
+
+    @override_settings(UPL_URL="")
+    @patch("open_producten.producttypen.tasks.sync_upl")
+    def test_task_without_url(self, mock_sync):
+        synchronise_upl()
+
+        mock_sync.assert_not_called()
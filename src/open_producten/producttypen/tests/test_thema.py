@@ -2,6 +2,7 @@ from django.core.exceptions import ValidationError
 from django.test import TestCase
 from django.utils.translation import gettext as _
 
+from ..models import Thema
 from .factories import ThemaFactory
 
 
@@ -46,3 +47,28 @@ class TestThema(TestCase):
             ValidationError, _("Een thema kan niet zijn eigen hoofd thema zijn.")
         ):
             thema.clean()
+
+    def test_set_gepubliceerd_boom_returns_changed_themas(self):
+        hoofd_thema = ThemaFactory.create(gepubliceerd=True)
+        sub_thema = ThemaFactory.create(gepubliceerd=False, hoofd_thema=hoofd_thema)
+        sub_sub_thema = ThemaFactory.create(gepubliceerd=False, hoofd_thema=sub_thema)
+
+        self.assertCountEqual(
+            Thema.objects.set_gepubliceerd_boom(hoofd_thema, True),
+            [sub_thema.pk, sub_sub_thema.pk],
+        )
+        self.assertEqual(Thema.objects.set_gepubliceerd_boom(hoofd_thema, True), [])
+
+    def test_set_gepubliceerd_boom_with_unpublished_hoofd_thema(self):
+        hoofd_thema = ThemaFactory.create(gepubliceerd=False)
+        sub_thema = ThemaFactory.create(gepubliceerd=False, hoofd_thema=hoofd_thema)
+
+        with self.assertRaisesMessage(
+            ValidationError,
+            _(
+                "Thema's moeten gepubliceerd zijn voordat sub-thema's kunnen worden gepubliceerd."
+            ),
+        ):
+            Thema.objects.set_gepubliceerd_boom(sub_thema, True)
+
+        self.assertEqual(Thema.objects.set_gepubliceerd_boom(sub_thema, False), [])
@@ -0,0 +1,253 @@
+"""
+Loading and synchronisation of the uniforme productnamenlijst (UPL).
+"""
+
+import csv
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from io import TextIOWrapper
+from typing import Callable, Iterable
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+import requests
+
+from .models import UniformeProductNaam, UplSynchronisatie
+from .models.upn import UplSynchronisatieStatus, get_upn_hash
+from .search import update_zoek_vectors
+from .signals import product_typen_changed
+
+logger = logging.getLogger(__name__)
+
+# number of rows that are upserted with a single query
+CHUNK_SIZE = 1000
+
+# temporary table with the uris of the csv, used to find the product names that are
+# no longer in the csv without passing all uris as query parameters
+IMPORT_TABLE = "upl_import"
+
+COLUMNS = {
+    "uri": "URI",
+    "name": "UniformeProductnaam",
+}
+
+# connect and read timeout of the download
+TIMEOUT = (10, 60)
+
+
+class UplError(Exception):
+    pass
+
+
+@dataclass
+class UniformProductName:
+    name: str
+    uri: str
+
+
+@dataclass
+class UplResult:
+    created: int = 0
+    # the existing product names in the csv, of which ``changed`` were rewritten
+    updated: int = 0
+    changed: int = 0
+    removed: int = 0
+    timings: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+
+def download_upl(url: str, headers: dict[str, str] | None = None) -> requests.Response:
+    """
+    Request the UPL csv, the body is streamed and read by :func:`read_upl`.
+    """
+    response = requests.get(url, headers=headers, stream=True, timeout=TIMEOUT)
+    response.raise_for_status()
+    return response
+
+
+def read_upl(response: requests.Response) -> csv.DictReader:
+    # read the csv while it is downloaded instead of loading it in memory
+    response.raw.decode_content = True
+    return csv.DictReader(TextIOWrapper(response.raw, encoding="utf-8-sig", newline=""))
+
+
+class UplLoader:
+    def __init__(self, on_skip: Callable[[int], None] | None = None):
+        self.on_skip = on_skip
+        self.result = UplResult()
+
+    @contextmanager
+    def timed(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.result.timings[phase] += time.perf_counter() - start
+
+    @transaction.atomic
+    def load(self, data: csv.DictReader) -> UplResult:
+        if missing_columns := [
+            f"'{key}'" for key in COLUMNS.values() if key not in (data.fieldnames or [])
+        ]:
+            raise UplError(
+                f"Column(s) {', '.join(missing_columns)} do not exist in the CSV."
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE TEMPORARY TABLE {IMPORT_TABLE} (uri text)")
+
+        # the csv is read while it is upserted, so both are part of the same phase
+        with self.timed("reading and upserting"):
+            for chunk in self._read_chunks(data):
+                self._upsert(chunk)
+
+        with self.timed("marking deleted"):
+            self._mark_deleted()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {IMPORT_TABLE}")
+
+        return self.result
+
+    def _read_chunks(self, data: csv.DictReader) -> Iterable[list[UniformProductName]]:
+        chunk = []
+
+        for i, row in enumerate(data):
+            uri = row[COLUMNS["uri"]]
+            name = row[COLUMNS["name"]]
+
+            if not name or not uri:
+                if self.on_skip:
+                    self.on_skip(i)
+                continue
+
+            chunk.append(UniformProductName(name=name, uri=uri))
+            if len(chunk) == CHUNK_SIZE:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def _upsert(self, chunk: list[UniformProductName]) -> None:
+        # a uri that occurs more than once is an update of the earlier row
+        hashes = {upn.uri: get_upn_hash(upn.name, upn.uri) for upn in chunk}
+        names = {upn.uri: upn.name for upn in chunk}
+        existing = {
+            uri: (upn_hash, is_verwijderd)
+            for uri, upn_hash, is_verwijderd in UniformeProductNaam.objects.filter(
+                uri__in=names
+            ).values_list("uri", "hash", "is_verwijderd")
+        }
+        changed_uris = {
+            uri
+            for uri, (upn_hash, is_verwijderd) in existing.items()
+            if upn_hash != hashes[uri] or is_verwijderd
+        }
+
+        created_count = len(names.keys() - existing.keys())
+        self.result.created += created_count
+        self.result.updated += len(chunk) - created_count
+        self.result.changed += len(changed_uris)
+
+        # only write new and changed product names
+        UniformeProductNaam.objects.bulk_create(
+            [
+                UniformeProductNaam(
+                    uri=uri, naam=name, hash=hashes[uri], is_verwijderd=False
+                )
+                for uri, name in names.items()
+                if uri not in existing or uri in changed_uris
+            ],
+            update_conflicts=True,
+            unique_fields=["uri"],
+            update_fields=["naam", "hash", "is_verwijderd"],
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {IMPORT_TABLE} (uri) SELECT unnest(%s::text[])",
+                [list(names)],
+            )
+
+        if changed_uris:
+            lookup = Q(uniforme_product_naam__uri__in=changed_uris)
+            product_typen_changed(lookup)
+            update_zoek_vectors(lookup)
+
+    def _mark_deleted(self) -> None:
+        table = UniformeProductNaam._meta.db_table
+        not_in_csv = (
+            f"NOT EXISTS (SELECT 1 FROM {IMPORT_TABLE} i WHERE i.uri = upn.uri)"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {IMPORT_TABLE}")
+            cursor.execute(f"SELECT count(*) FROM {table} upn WHERE {not_in_csv}")
+            (self.result.removed,) = cursor.fetchone()
+
+            cursor.execute(
+                f"UPDATE {table} upn SET is_verwijderd = true "
+                f"WHERE {not_in_csv} AND NOT upn.is_verwijderd RETURNING upn.id"
+            )
+            deleted_ids = [pk for (pk,) in cursor.fetchall()]
+
+        if deleted_ids:
+            product_typen_changed(Q(uniforme_product_naam__in=deleted_ids))
+
+
+def sync_upl(url: str) -> UplSynchronisatie:
+    """
+    Load the UPL from ``url`` if it changed since the previous synchronisation.
+
+    The ``ETag`` and ``Last-Modified`` headers of the previous download are sent as
+    conditional request headers. The outcome is saved as a ``UplSynchronisatie``.
+    """
+    previous = (
+        UplSynchronisatie.objects.filter(url=url)
+        .exclude(status=UplSynchronisatieStatus.MISLUKT)
+        .first()
+    )
+    headers = {}
+    if previous and previous.etag:
+        headers["If-None-Match"] = previous.etag
+    if previous and previous.last_modified:
+        headers["If-Modified-Since"] = previous.last_modified
+
+    sync = UplSynchronisatie(url=url)
+    start = time.perf_counter()
+
+    try:
+        with download_upl(url, headers) as response:
+            if response.status_code == requests.codes.not_modified:
+                # no conditional headers are sent without a previous download
+                if previous is None:
+                    raise UplError(
+                        "The server responded 304 Not Modified to an unconditional "
+                        "request."
+                    )
+                sync.status = UplSynchronisatieStatus.ONGEWIJZIGD
+                sync.etag = response.headers.get("ETag", previous.etag)
+                sync.last_modified = response.headers.get(
+                    "Last-Modified", previous.last_modified
+                )
+            else:
+                result = UplLoader().load(read_upl(response))
+                sync.status = UplSynchronisatieStatus.GEWIJZIGD
+                sync.etag = response.headers.get("ETag", "")
+                sync.last_modified = response.headers.get("Last-Modified", "")
+                sync.aangemaakt = result.created
+                sync.gewijzigd = result.changed
+                sync.verwijderd = result.removed
+    except Exception as exc:
+        logger.exception("Synchronising the UPL from %s failed.", url)
+        sync.status = UplSynchronisatieStatus.MISLUKT
+        sync.foutmelding = str(exc)
+
+    sync.duur = timedelta(seconds=time.perf_counter() - start)
+    sync.save()
+    return sync
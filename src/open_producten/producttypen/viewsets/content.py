@@ -10,6 +10,7 @@ from open_producten.producttypen.serializers.content import (
     ContentElementTranslationSerializer,
     ContentLabelSerializer,
 )
+from open_producten.utils.cache import ResponseCacheMixin, object_scope
 from open_producten.utils.views import TranslatableViewSetMixin
 
 
@@ -32,6 +33,7 @@ from open_producten.utils.views import TranslatableViewSetMixin
     ),
 )
 class ContentElementViewSet(
+    ResponseCacheMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -42,6 +44,7 @@ class ContentElementViewSet(
     queryset = ContentElement.objects.all()
     serializer_class = ContentElementSerializer
     lookup_url_kwarg = "id"
+    cache_scopes = {"retrieve": object_scope("content")}
 
     @extend_schema(
         summary="De vertaling van een content element aanpassen.",
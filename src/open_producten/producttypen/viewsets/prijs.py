@@ -22,9 +22,6 @@ class PrijsFilterSet(FilterSet):
         help_text=_("Naam van het product type."),
     )
 
-    def filter_queryset(self, queryset):
-        return super().filter_queryset(queryset).distinct()
-
     class Meta:
         model = Prijs
         fields = {
@@ -62,3 +59,9 @@ class PrijsViewSet(OrderedModelViewSet):
     serializer_class = PrijsSerializer
     lookup_url_kwarg = "id"
     filterset_class = PrijsFilterSet
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            return queryset.prefetch_related("prijsopties", "prijsregels__dmn_config")
+        return queryset
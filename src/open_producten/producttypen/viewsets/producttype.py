@@ -10,6 +10,7 @@ from rest_framework.response import Response
 
 from open_producten.producttypen.models import ContentElement, ProductType
 from open_producten.producttypen.models.producttype import ProductStateChoices
+from open_producten.producttypen.search import get_suggesties
 from open_producten.producttypen.serializers import (
     ProductTypeActuelePrijsSerializer,
     ProductTypeSerializer,
@@ -18,14 +19,26 @@ from open_producten.producttypen.serializers.content import (
     NestedContentElementSerializer,
 )
 from open_producten.producttypen.serializers.producttype import (
+    ActuelePrijsDatumSerializer,
+    ProductTypeSuggestieSerializer,
+    ProductTypeSuggestiesParametersSerializer,
     ProductTypeTranslationSerializer,
+    ProductTypeZoekResultaatSerializer,
+    ProductTypeZoekSerializer,
+)
+from open_producten.utils.cache import (
+    ResponseCacheMixin,
+    collection_scope,
+    object_scope,
 )
 from open_producten.utils.filters import (
     CharArrayFilter,
     ChoiceArrayFilter,
     FilterSet,
     TranslationFilter,
+    filter_exists,
 )
+from open_producten.utils.pagination import OptionalKeysetPagination, Pagination
 from open_producten.utils.views import OrderedModelViewSet, TranslatableViewSetMixin
 
 
@@ -65,6 +78,13 @@ class ProductTypeFilterSet(FilterSet):
         help_text=_("Lijst van keywords waarop kan worden gezocht."),
     )
 
+    zoek = django_filters.CharFilter(
+        method="filter_by_zoek",
+        help_text=_(
+            "Zoek in de naam, samenvatting, keywords, uniforme product naam en content van het producttype (in de meegegeven `Accept-Language` taal). De resultaten worden op relevantie gesorteerd."
+        ),
+    )
+
     toegestane_statussen = ChoiceArrayFilter(
         field_name="toegestane_statussen",
         lookup_expr="overlap",
@@ -81,11 +101,14 @@ class ProductTypeFilterSet(FilterSet):
                 raise ParseError(_("Invalid format for externe_code query parameter."))
 
             naam, code = value_list
-            queryset = queryset.filter(
-                externe_codes__naam=naam, externe_codes__code=code
+            queryset = filter_exists(
+                queryset, externe_codes__naam=naam, externe_codes__code=code
             )
         return queryset
 
+    def filter_by_zoek(self, queryset, name, value):
+        return queryset.zoek(value, self.request.LANGUAGE_CODE)
+
     def filter_by_parameter(self, queryset, name, value):
         values = self.request.GET.getlist(name)
 
@@ -95,7 +118,9 @@ class ProductTypeFilterSet(FilterSet):
                 raise ParseError(_("Invalid format for parameter query parameter."))
 
             naam, waarde = value_list
-            queryset = queryset.filter(parameters__naam=naam, parameters__waarde=waarde)
+            queryset = filter_exists(
+                queryset, parameters__naam=naam, parameters__waarde=waarde
+            )
         return queryset
 
     class Meta:
@@ -114,7 +139,6 @@ class ContentFilterSet(FilterSet):
         field_name="labels__naam",
         lookup_expr="in",
         help_text=_("De labels van dit content element"),
-        distinct=True,
     )
 
     exclude_labels = django_filters.BaseInFilter(
@@ -124,10 +148,9 @@ class ContentFilterSet(FilterSet):
         help_text=_("De labels van dit content element"),
     )
 
-
-class Meta:
-    model = ContentElement
-    fields = ("label", "exclude_labels")
+    class Meta:
+        model = ContentElement
+        fields = ("labels", "exclude_labels")
 
 
 @extend_schema_view(
@@ -152,11 +175,39 @@ class Meta:
         summary="Verwijder een PRODUCTTYPE.",
     ),
 )
-class ProductTypeViewSet(TranslatableViewSetMixin, OrderedModelViewSet):
+class ProductTypeViewSet(
+    ResponseCacheMixin, TranslatableViewSetMixin, OrderedModelViewSet
+):
     queryset = ProductType.objects.all()
     serializer_class = ProductTypeSerializer
     lookup_url_kwarg = "id"
     filterset_class = ProductTypeFilterSet
+    pagination_class = OptionalKeysetPagination
+    conditional_get_fields = ("update_datum", "themas__update_datum")
+    cache_scopes = {
+        "list": collection_scope("producttypen"),
+        "retrieve": object_scope("producttype"),
+        "content": object_scope("producttype"),
+        "actuele_prijzen": collection_scope("producttypen"),
+        "actuele_prijs": object_scope("producttype"),
+        "zoeken": collection_scope("producttypen"),
+        "suggesties": collection_scope("producttypen"),
+    }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            return queryset.with_api_relations(self.request.LANGUAGE_CODE)
+        if self.action in ("actuele_prijzen", "actuele_prijs"):
+            return queryset.with_actuele_prijs(self.get_prijs_datum())
+        if self.action == "zoeken":
+            return queryset.select_related("uniforme_product_naam")
+        return queryset
+
+    def get_prijs_datum(self):
+        serializer = ActuelePrijsDatumSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data.get("datum")
 
     @extend_schema(
         summary="De vertaling van een producttype aanpassen.",
@@ -199,21 +250,76 @@ class ProductTypeViewSet(TranslatableViewSetMixin, OrderedModelViewSet):
         "actuele_prijzen",
         summary="Alle ACTUELE PRIJZEN opvragen.",
         description="Geeft de huidige prijzen van alle PRODUCTTYPEN terug.",
+        parameters=[ActuelePrijsDatumSerializer],
+        responses=ProductTypeActuelePrijsSerializer(many=True),
     )
     @action(
         detail=False,
         serializer_class=ProductTypeActuelePrijsSerializer,
         url_path="actuele-prijzen",
+        filter_backends=(),
     )
     def actuele_prijzen(self, request):
-        product_typen = self.get_queryset().all()
-        serializer = ProductTypeActuelePrijsSerializer(product_typen, many=True)
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        "zoeken",
+        summary="PRODUCTTYPEN zoeken.",
+        description="Geeft de gevonden PRODUCTTYPEN terug, gesorteerd op relevantie en met een fragment van de samenvatting waarin de gevonden woorden zijn gemarkeerd. De resultaten kunnen verder gefilterd worden met query-string parameters.",
+        parameters=[ProductTypeZoekSerializer],
+        responses=ProductTypeZoekResultaatSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        serializer_class=ProductTypeZoekResultaatSerializer,
+        pagination_class=Pagination,
+    )
+    def zoeken(self, request):
+        parameters = ProductTypeZoekSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+
+        queryset = self.filter_queryset(self.get_queryset()).with_zoek_fragment(
+            parameters.validated_data["zoek"], request.LANGUAGE_CODE
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        "suggesties",
+        summary="Suggesties voor PRODUCTTYPE namen opvragen.",
+        description="Geeft de namen van de PRODUCTTYPEN (in de meegegeven `Accept-Language` taal) die het best aansluiten op de zoekopdracht, voor het automatisch aanvullen van een zoekveld. Namen die met de zoekopdracht beginnen komen eerst, gevolgd door namen met een woord dat er op lijkt.",
+        parameters=[ProductTypeSuggestiesParametersSerializer],
+        responses=ProductTypeSuggestieSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        serializer_class=ProductTypeSuggestieSerializer,
+        filter_backends=(),
+        pagination_class=None,
+    )
+    def suggesties(self, request):
+        parameters = ProductTypeSuggestiesParametersSerializer(
+            data=request.query_params
+        )
+        parameters.is_valid(raise_exception=True)
+
+        suggesties = get_suggesties(
+            parameters.validated_data["zoek"],
+            request.LANGUAGE_CODE,
+            parameters.validated_data["aantal"],
+            parameters.validated_data["gepubliceerd"],
+        )
+        serializer = self.get_serializer(suggesties, many=True)
         return Response(serializer.data)
 
     @extend_schema(
         "actuele_prijs",
         summary="De actuele PRIJS van een PRODUCTTYPE opvragen.",
         description="Geeft de huidige prijzen van alle PRODUCTTYPEN terug.",
+        parameters=[ActuelePrijsDatumSerializer],
     )
     @action(
         detail=True,
@@ -222,7 +328,7 @@ class ProductTypeViewSet(TranslatableViewSetMixin, OrderedModelViewSet):
     )
     def actuele_prijs(self, request, id=None):
         product_type = self.get_object()
-        serializer = ProductTypeActuelePrijsSerializer(product_type)
+        serializer = self.get_serializer(product_type)
         return Response(serializer.data)
 
     @extend_schema(
@@ -254,6 +360,9 @@ class ProductTypeViewSet(TranslatableViewSetMixin, OrderedModelViewSet):
         url_path="content",
     )
     def content(self, request, id=None):
+        return self.conditional_get(self._content, request, id=id)
+
+    def _content(self, request, id=None):
         product_type = self.get_object()
 
         queryset = product_type.content_elementen
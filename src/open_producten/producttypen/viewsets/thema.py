@@ -1,12 +1,23 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Prefetch
 from django.db.models.deletion import ProtectedError
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
+from rest_framework import serializers, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from open_producten.producttypen.models import ProductType, Thema
-from open_producten.producttypen.serializers import ThemaSerializer
+from open_producten.producttypen.serializers import ThemaBoomSerializer, ThemaSerializer
+from open_producten.producttypen.serializers.thema import ThemaBoomParametersSerializer
+from open_producten.producttypen.signals import invalidate_themas
+from open_producten.utils.cache import (
+    ResponseCacheMixin,
+    collection_scope,
+    object_scope,
+)
 from open_producten.utils.filters import FilterSet
 from open_producten.utils.views import OrderedModelViewSet
 
@@ -47,22 +58,63 @@ class ThemaFilterSet(FilterSet):
         summary="Verwijder een THEMA.",
     ),
 )
-class ThemaViewSet(OrderedModelViewSet):
+class ThemaViewSet(ResponseCacheMixin, OrderedModelViewSet):
     queryset = Thema.objects.all()
     serializer_class = ThemaSerializer
     lookup_url_kwarg = "id"
     filterset_class = ThemaFilterSet
+    conditional_get_fields = ("update_datum", "product_typen__update_datum")
+    cache_scopes = {
+        "list": collection_scope("themas"),
+        "retrieve": object_scope("thema"),
+        "boom": collection_scope("themas"),
+    }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            return queryset.prefetch_related(
+                Prefetch(
+                    "product_typen",
+                    queryset=ProductType.objects.select_related(
+                        "uniforme_product_naam"
+                    ),
+                )
+            )
+        return queryset
+
+    @extend_schema(
+        "boom",
+        summary="De boom van THEMA'S opvragen.",
+        description="Geeft de hoofd thema's, of een specifiek thema, met alle sub thema's terug.",
+        parameters=[ThemaBoomParametersSerializer],
+        responses=ThemaBoomSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        serializer_class=ThemaBoomSerializer,
+        url_path="boom",
+        filter_backends=(),
+        pagination_class=None,
+    )
+    def boom(self, request):
+        parameters = ThemaBoomParametersSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+
+        themas = self.get_queryset().boom(**parameters.validated_data)
+        serializer = self.get_serializer(themas, many=True)
+        return Response(serializer.data)
 
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
-        errors = []
-        for product_type in ProductType.objects.filter(themas__in=[instance]):
-            if product_type.themas.count() <= 1:
-                errors.append(
-                    _(
-                        "Product Type {} moet aan een minimaal één thema zijn gelinkt."
-                    ).format(product_type)
-                )
+        errors = [
+            _("Product Type {} moet aan een minimaal één thema zijn gelinkt.").format(
+                product_type
+            )
+            for product_type in ProductType.objects.without_other_themas(
+                [instance]
+            ).prefetch_related("translations")
+        ]
 
         if errors:
             return Response(
@@ -81,3 +133,36 @@ class ThemaViewSet(OrderedModelViewSet):
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+    def set_gepubliceerd(self, gepubliceerd: bool):
+        thema = self.get_object()
+        try:
+            with transaction.atomic():
+                thema_ids = Thema.objects.set_gepubliceerd_boom(thema, gepubliceerd)
+                invalidate_themas(thema_ids)
+        except ValidationError as e:
+            raise serializers.ValidationError({"hoofd_thema": e.messages})
+
+        serializer = ThemaBoomSerializer(Thema.objects.boom(thema)[0])
+        return Response(serializer.data)
+
+    @extend_schema(
+        "publiceren",
+        summary="Publiceer een THEMA met al zijn sub thema's.",
+        description="Het hoofd thema van het THEMA moet gepubliceerd zijn.",
+        request=None,
+        responses=ThemaBoomSerializer,
+    )
+    @action(detail=True, methods=["post"], url_path="publiceren")
+    def publiceren(self, request, id=None):
+        return self.set_gepubliceerd(True)
+
+    @extend_schema(
+        "depubliceren",
+        summary="Depubliceer een THEMA met al zijn sub thema's.",
+        request=None,
+        responses=ThemaBoomSerializer,
+    )
+    @action(detail=True, methods=["post"], url_path="depubliceren")
+    def depubliceren(self, request, id=None):
+        return self.set_gepubliceerd(False)
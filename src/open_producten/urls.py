@@ -15,7 +15,7 @@ from mozilla_django_oidc_db.views import AdminLoginFailure
 from open_producten.accounts.views.password_reset import PasswordResetView
 from open_producten.producten.urls import urlpatterns as product_urlpatterns
 from open_producten.producttypen.urls import urlpatterns as product_type_urlpatterns
-from open_producten.utils.views import IndexView
+from open_producten.utils.views import IndexView, metrics
 
 # Configure admin
 
@@ -80,6 +80,7 @@ urlpatterns = [
         name="index-producttypen",
     ),
     path("ref/", include("notifications_api_common.urls")),
+    path("metrics", metrics, name="metrics"),
     # path("view-config/", ViewConfigView.as_view(), name="view-config"),
 ]
 
@@ -1,6 +1,8 @@
 import json
 
 from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import path, reverse
 from django.utils.html import format_html
@@ -11,6 +13,8 @@ from django_celery_beat.models import PeriodicTask
 
 from open_producten.celery import app
 
+from .models import RequestProfiel
+
 
 class PeriodicTaskAdmin(_PeriodicTaskAdmin):
     list_display = _PeriodicTaskAdmin.list_display + ("detail_url",)
@@ -40,3 +44,79 @@ class PeriodicTaskAdmin(_PeriodicTaskAdmin):
 
 admin.site.unregister(PeriodicTask)
 admin.site.register(PeriodicTask, PeriodicTaskAdmin)
+
+
+@admin.register(RequestProfiel)
+class RequestProfielAdmin(admin.ModelAdmin):
+    list_display = (
+        "aanmaak_datum",
+        "methode",
+        "pad",
+        "status_code",
+        "duur",
+        "aantal_queries",
+        "gebruiker",
+        "downloads",
+    )
+    list_filter = ("methode", "status_code")
+    search_fields = ("pad",)
+    date_hierarchy = "aanmaak_datum"
+    exclude = ("rapport", "speedscope")
+    readonly_fields = (
+        "aanmaak_datum",
+        "gebruiker",
+        "methode",
+        "pad",
+        "status_code",
+        "duur",
+        "aantal_queries",
+        "downloads",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                "<uuid:profiel_id>/rapport/",
+                self.admin_site.admin_view(self.rapport),
+                name="utils_requestprofiel_rapport",
+            ),
+            path(
+                "<uuid:profiel_id>/speedscope/",
+                self.admin_site.admin_view(self.speedscope),
+                name="utils_requestprofiel_speedscope",
+            ),
+        ] + super().get_urls()
+
+    def get_profiel(self, request, profiel_id) -> RequestProfiel:
+        profiel = get_object_or_404(self.model, pk=profiel_id)
+        if not self.has_view_permission(request, profiel):
+            raise PermissionDenied
+        return profiel
+
+    def rapport(self, request, profiel_id):
+        return HttpResponse(self.get_profiel(request, profiel_id).rapport)
+
+    def speedscope(self, request, profiel_id):
+        profiel = self.get_profiel(request, profiel_id)
+        return JsonResponse(
+            profiel.speedscope,
+            headers={
+                "Content-Disposition": f'attachment; filename="{profiel.pk}.speedscope.json"'
+            },
+        )
+
+    @admin.display(description=_("Downloads"))
+    def downloads(self, obj):
+        return format_html(
+            '<a href="{}">{}</a> | <a href="{}">{}</a>',
+            reverse("admin:utils_requestprofiel_rapport", args=[obj.pk]),
+            _("Rapport"),
+            reverse("admin:utils_requestprofiel_speedscope", args=[obj.pk]),
+            _("Speedscope"),
+        )
@@ -0,0 +1,177 @@
+import hashlib
+from datetime import date
+from functools import partial
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe, urlencode
+
+from rest_framework import status
+
+from .metrics import CACHE_REQUESTS
+
+API_RESPONSE_CACHE_ALIAS = "api"
+
+GENERATION_SCOPE = "*"
+
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Vary")
+
+
+class ResponseCache:
+    """
+    Cache for rendered API responses.
+
+    Responses are stored under a key that contains the version of every scope they
+    depend on, e.g. ``producttype:<id>`` for a detail response or ``producttypen`` for
+    the list. Invalidating a scope sets a new version, the old entries are never read
+    again and expire after ``API_RESPONSE_CACHE_TIMEOUT``. Nothing is deleted, which
+    keeps invalidation cheap and independent of the cache backend.
+    """
+
+    def __init__(self, alias: str):
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def timeout(self) -> int:
+        return settings.API_RESPONSE_CACHE_TIMEOUT
+
+    @property
+    def enabled(self) -> bool:
+        return self.timeout > 0
+
+    def _version_key(self, scope: str) -> str:
+        return f"version:{scope}"
+
+    def get_versions(self, scopes: list[str]) -> list[str]:
+        keys = [self._version_key(scope) for scope in (GENERATION_SCOPE, *scopes)]
+        versions = self.cache.get_many(keys)
+
+        for key in keys:
+            if key not in versions:
+                # a missing (e.g. evicted) version always starts a new namespace, so
+                # entries that were cached under an older version are not used again
+                version = uuid4().hex
+                if not self.cache.add(key, version, timeout=None):
+                    version = self.cache.get(key) or version
+                versions[key] = version
+
+        return [versions[key] for key in keys]
+
+    def invalidate(self, *scopes: str) -> None:
+        if not scopes:
+            return
+        self.cache.set_many(
+            {self._version_key(scope): uuid4().hex for scope in scopes}, timeout=None
+        )
+
+    def invalidate_on_commit(self, *scopes: str) -> None:
+        # readers could otherwise cache the data of before the change under the new
+        # version while the transaction is not yet committed
+        transaction.on_commit(lambda: self.invalidate(*scopes))
+
+    def clear(self) -> None:
+        """
+        Invalidate all responses without flushing the (shared) cache database.
+        """
+        self.invalidate(GENERATION_SCOPE)
+
+    def get_key(self, request, scopes: list[str]) -> str:
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        key = "\n".join(
+            [
+                request.build_absolute_uri(request.path),
+                query,
+                request.LANGUAGE_CODE,
+                # actuele prijzen and product states depend on the current date
+                date.today().isoformat(),
+                *self.get_versions(scopes),
+            ]
+        )
+        return "response:" + hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> HttpResponse | None:
+        cached = self.cache.get(key)
+        CACHE_REQUESTS.labels(self.alias, "miss" if cached is None else "hit").inc()
+        if cached is None:
+            return None
+
+        content, headers = cached
+        response = HttpResponse(content)
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def set(self, key: str, response) -> None:
+        headers = {
+            header: response[header] for header in CACHED_HEADERS if header in response
+        }
+        self.cache.set(key, (response.content, headers), timeout=self.timeout)
+
+
+response_cache = ResponseCache(API_RESPONSE_CACHE_ALIAS)
+
+
+class ResponseCacheMixin:
+    # Cache the rendered responses of the read actions in `cache_scopes`, which maps
+    # the action to a function that returns the scopes the response depends on.
+    # (No docstring, it would end up in the API schema of every viewset.)
+
+    cache_scopes: dict = {}
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        # authentication and permissions have been checked at this point, wrap the
+        # handler that is looked up next by `dispatch`
+        if request.method == "GET" and self.action in self.cache_scopes:
+            self.get = partial(self.cached, self.get)
+
+    def cached(self, handler, request, *args, **kwargs):
+        if not response_cache.enabled:
+            return handler(request, *args, **kwargs)
+
+        key = response_cache.get_key(request, self.cache_scopes[self.action](self))
+        response = response_cache.get(key)
+
+        if response is not None:
+            last_modified = response.get("Last-Modified")
+            return (
+                get_conditional_response(
+                    request,
+                    etag=response.get("ETag"),
+                    last_modified=last_modified and parse_http_date_safe(last_modified),
+                    response=response,
+                )
+                or response
+            )
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response.add_post_render_callback(
+                lambda rendered: response_cache.set(key, rendered)
+            )
+        return response
+
+
+def collection_scope(name: str):
+    return lambda view: [name]
+
+
+def object_scope(name: str):
+    def get_scopes(view):
+        pk = view.kwargs[view.lookup_url_kwarg]
+        try:
+            pk = UUID(pk)
+        except ValueError:
+            pass
+        return [f"{name}:{pk}"]
+
+    return get_scopes
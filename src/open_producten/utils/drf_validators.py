@@ -41,8 +41,21 @@ class NestedObjectsValidator:
 
         errors = []
 
-        current_ids = set(
-            getattr(parent_instance, self.key).values_list("id", flat=True)
+        related = getattr(parent_instance, self.key)
+        # the bulk import prefetches the nested objects of all products at once
+        if self.key in getattr(parent_instance, "_prefetched_objects_cache", {}):
+            current_ids = {obj.id for obj in related.all()}
+        else:
+            current_ids = set(related.values_list("id", flat=True))
+
+        # objects of other parents are looked up at once
+        other_ids = {obj.get("id") for obj in value[self.key]} - current_ids - {None}
+        existing_ids = (
+            set(
+                self.model.objects.filter(id__in=other_ids).values_list("id", flat=True)
+            )
+            if other_ids
+            else set()
         )
 
         seen_ids = set()
@@ -59,28 +72,25 @@ class NestedObjectsValidator:
                     errors.append(_("Dubbel id: {} op index {}.").format(obj_id, idx))
                 seen_ids.add(obj_id)
 
-            else:
-                try:
-                    self.model.objects.get(id=obj_id)
-
-                    # If the object is not related to the parent object but does exist when querying the nested object model itself
-                    # it means that the nested object is related to a different parent object. It is only allowed to related nested objects.
-                    errors.append(
-                        _(
-                            "{} id {} op index {} is niet onderdeel van het {} object."
-                        ).format(
-                            self.model._meta.verbose_name,
-                            obj_id,
-                            idx,
-                            parent_instance._meta.verbose_name,
-                        )
+            elif obj_id in existing_ids:
+                # If the object is not related to the parent object but does exist when querying the nested object model itself
+                # it means that the nested object is related to a different parent object. It is only allowed to related nested objects.
+                errors.append(
+                    _(
+                        "{} id {} op index {} is niet onderdeel van het {} object."
+                    ).format(
+                        self.model._meta.verbose_name,
+                        obj_id,
+                        idx,
+                        parent_instance._meta.verbose_name,
                     )
-                except self.model.DoesNotExist:
-                    errors.append(
-                        _("{} id {} op index {} bestaat niet.").format(
-                            self.model._meta.verbose_name, obj_id, idx
-                        )
+                )
+            else:
+                errors.append(
+                    _("{} id {} op index {} bestaat niet.").format(
+                        self.model._meta.verbose_name, obj_id, idx
                     )
+                )
 
         if errors:
             raise serializers.ValidationError({self.key: errors})
@@ -1,12 +1,277 @@
+import json
+import math
+from functools import reduce
+
+from django import forms
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    CharField,
+    Exists,
+    F,
+    Func,
+    JSONField,
+    Model,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields.json import (
+    KeyTransform,
+    KeyTransformGt,
+    KeyTransformGte,
+    KeyTransformLt,
+    KeyTransformLte,
+)
+from django.db.models.lookups import Exact
+from django.utils.translation import get_language
+
 import django_filters
+from django_filters.constants import EMPTY_VALUES
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet as _FilterSet
 
+from .validators import JSON_PAD_REGEX
+
+JSON_ATTR_LOOKUPS = {
+    "gt": KeyTransformGt,
+    "gte": KeyTransformGte,
+    "lt": KeyTransformLt,
+    "lte": KeyTransformLte,
+}
+JSON_ATTR_OPERATORS = ("exact", *JSON_ATTR_LOOKUPS)
+
+# pad__operator__waarde
+JSON_ATTR_REGEX = rf"^{JSON_PAD_REGEX}__(?:{'|'.join(JSON_ATTR_OPERATORS)})__.+$"
+
+
+def split_multi_valued_lookup(model: type[Model], lookup: str):
+    """
+    Split a lookup at the first multi-valued (reverse foreign key or many to many)
+    relation into the path to the model of the relation, the relation field and the
+    lookup on the related model.
+
+    Returns ``None`` if the lookup doesn't follow a multi-valued relation.
+    """
+    parts = lookup.split(LOOKUP_SEP)
+
+    for i, part in enumerate(parts):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+
+        if not field.is_relation:
+            return None
+
+        if field.many_to_many or field.one_to_many:
+            _, *related_lookup = parts[i:]
+            # e.g. `labels__in` filters on the primary key of the related model
+            try:
+                field.related_model._meta.get_field(related_lookup[0])
+            except (IndexError, FieldDoesNotExist):
+                related_lookup.insert(0, "pk")
+
+            return (
+                LOOKUP_SEP.join(parts[:i]) or "pk",
+                field,
+                LOOKUP_SEP.join(related_lookup),
+            )
+
+        model = field.related_model
+
+    return None
+
+
+def filter_exists(
+    queryset: QuerySet, *conditions: Q, exclude: bool = False, **lookups
+) -> QuerySet:
+    """
+    Filter on multi-valued relations with an ``EXISTS`` subquery instead of a join.
+
+    A join returns an object once for every related object that matches, so the
+    results would need a ``distinct()``. The lookups and ``Q`` conditions are applied
+    to the same related object, like the lookups of a single ``filter()`` call.
+    Lookups that don't follow a multi-valued relation are applied to the queryset
+    itself.
+    """
+    relation = None
+
+    def get_related_lookup(lookup: str) -> str | None:
+        nonlocal relation
+        split = split_multi_valued_lookup(queryset.model, lookup)
+        if split is None:
+            return None
+
+        outer_path, field, related_lookup = split
+        if relation not in (None, (outer_path, field)):
+            raise ValueError("All lookups must follow the same relation.")
+        relation = (outer_path, field)
+        return related_lookup
+
+    def get_related_condition(condition: Q) -> Q | None:
+        related = Q(_connector=condition.connector, _negated=condition.negated)
+        for child in condition.children:
+            if isinstance(child, Q):
+                child = get_related_condition(child)
+            else:
+                lookup, value = child
+                related_lookup = get_related_lookup(lookup)
+                child = None if related_lookup is None else (related_lookup, value)
+            if child is None:
+                return None
+            related.children.append(child)
+        return related
+
+    related_lookups = {}
+    for lookup, value in lookups.items():
+        related_lookup = get_related_lookup(lookup)
+        if related_lookup is None:
+            break
+        related_lookups[related_lookup] = value
+
+    related_conditions = [get_related_condition(condition) for condition in conditions]
+
+    if (
+        relation is None
+        or len(related_lookups) != len(lookups)
+        or None in related_conditions
+    ):
+        method = queryset.exclude if exclude else queryset.filter
+        return method(*conditions, **lookups)
+
+    outer_path, field = relation
+    exists = Exists(
+        field.related_model._base_manager.filter(
+            *related_conditions,
+            **{field.remote_field.name: OuterRef(outer_path)},
+            **related_lookups,
+        )
+    )
+    return queryset.filter(~exists if exclude else exists)
+
+
+class ExistsFilterMethod:
+    """
+    Replaces ``Filter.filter()`` of the filters on multi-valued relations, see
+    :func:`filter_exists`.
+    """
+
+    def __init__(self, filter_instance):
+        self.f = filter_instance
+
+    def __call__(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        lookup = f"{self.f.field_name}{LOOKUP_SEP}{self.f.lookup_expr}"
+        return filter_exists(qs, exclude=self.f.exclude, **{lookup: value})
+
+
+def get_json_key_transform(field_name: str, pad: list[str]) -> KeyTransform:
+    """
+    Return the expression of the attribute at ``pad`` in the json field, which is
+    used by both the filters and the expression indexes on the attribute.
+    """
+    return reduce(
+        lambda expression, key: KeyTransform(key, expression), pad, F(field_name)
+    )
+
+
+def get_json_object(pad: list[str], value) -> dict:
+    """
+    Return the json object with the value at ``pad``.
+    """
+    return reduce(lambda nested, key: {key: nested}, reversed(pad), value)
+
+
+def parse_json_attr(value: str) -> tuple[list[str], str, str]:
+    """
+    Split a ``pad__operator__waarde`` value into the keys of the path, the operator
+    and the value.
+    """
+    parts = value.split(LOOKUP_SEP)
+
+    for i, part in enumerate(parts[1:-1], start=1):
+        if part in JSON_ATTR_OPERATORS:
+            operator, *waarde = parts[i:]
+            return parts[:i], operator, LOOKUP_SEP.join(waarde)
+
+    raise ValueError(f"No operator in {value!r}.")
+
+
+def get_json_attr_filter(field_name: str, value: str) -> Q:
+    """
+    Return the filter of a ``pad__operator__waarde`` value on a json field.
+
+    ``exact`` is a containment check (``@>``), which can use a ``jsonb_path_ops`` GIN
+    index on the field. A value that is a json number, boolean or null also matches
+    that json value. The other operators compare numbers when the value is a number
+    and strings otherwise, attributes of other types never match. They can use the
+    expression indexes of :func:`get_json_key_transform`.
+    """
+    pad, operator, waarde = parse_json_attr(value)
+
+    try:
+        json_waarde = json.loads(waarde)
+    except ValueError:
+        json_waarde = waarde
+    # NaN and Infinity are accepted by json.loads, but are not valid json
+    is_number = (
+        isinstance(json_waarde, (int, float))
+        and not isinstance(json_waarde, bool)
+        and math.isfinite(json_waarde)
+    )
+
+    if operator == "exact":
+        waarden = [waarde]
+        if is_number or isinstance(json_waarde, bool) or json_waarde is None:
+            waarden.append(json_waarde)
+
+        return reduce(
+            Q.__or__,
+            (
+                Q(**{f"{field_name}__contains": get_json_object(pad, value)})
+                for value in waarden
+            ),
+        )
+
+    attribute = get_json_key_transform(field_name, pad)
+    json_type = Func(attribute, function="jsonb_typeof", output_field=CharField())
+    return Q(
+        Exact(json_type, "number" if is_number else "string"),
+        JSON_ATTR_LOOKUPS[operator](
+            attribute,
+            Value(json_waarde if is_number else waarde, output_field=JSONField()),
+        ),
+    )
+
 
 class FilterSet(_FilterSet):
     """
-    Add help texts for model field filters
+    Add help texts for model field filters and filter multi-valued relations with
+    ``EXISTS`` subqueries
     """
 
+    @classmethod
+    def get_filters(cls):
+        filters = super().get_filters()
+
+        if cls._meta.model is None:
+            return filters
+
+        for filter in filters.values():
+            # only the filters that use the default lookup, not the ones with a
+            # method or their own filter logic
+            if (
+                filter.method is None
+                and type(filter).filter is django_filters.Filter.filter
+                and split_multi_valued_lookup(cls._meta.model, filter.field_name)
+            ):
+                filter.filter = ExistsFilterMethod(filter)
+
+        return filters
+
     @classmethod
     def filter_for_field(cls, field, field_name, lookup_expr=None):
         filter = super().filter_for_field(field, field_name, lookup_expr)
@@ -20,6 +285,19 @@ class FilterBackend(DjangoFilterBackend):
     filterset_base = FilterSet
 
 
+class JsonFilter(django_filters.CharFilter):
+    """
+    Filter json fields on the objects that contain the given json (``@>``), which can
+    use a ``jsonb_path_ops`` GIN index on the field.
+    """
+
+    field_class = forms.JSONField
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("lookup_expr", "contains")
+        super().__init__(*args, **kwargs)
+
+
 class CharArrayFilter(django_filters.BaseInFilter, django_filters.CharFilter):
     pass
 
@@ -62,7 +340,10 @@ class TranslationFilter(django_filters.CharFilter):
             lookup = f"{self.model_field_name}__{lookup}"
             language_lookup = f"{self.model_field_name}__{language_lookup}"
 
-        language_code = self.parent.request.LANGUAGE_CODE
+        request = self.parent.request
+        # the filterset can also be used without a request, e.g. in management commands
+        language_code = request.LANGUAGE_CODE if request else get_language()
 
-        qs = self.get_method(qs)(**{lookup: value, language_lookup: language_code})
-        return qs
+        return filter_exists(
+            qs, exclude=self.exclude, **{lookup: value, language_lookup: language_code}
+        )
@@ -0,0 +1,32 @@
+import hashlib
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+def _lock_key(name: str) -> int:
+    # advisory locks are identified by a signed 64 bit integer
+    digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@contextmanager
+def advisory_lock(name: str):
+    """
+    Try to acquire a session level Postgres advisory lock for ``name``.
+
+    The lock is shared by every process using the same database, which makes it usable
+    to prevent overlapping runs of a task on different nodes. Yields whether the lock
+    was acquired; the lock is never waited for.
+    """
+    key = _lock_key(name)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [key])
+        (acquired,) = cursor.fetchone()
+
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [key])
@@ -2,15 +2,29 @@ from django.core.cache import DEFAULT_CACHE_ALIAS, caches
 from django.core.management import BaseCommand
 from django.utils.translation import gettext as _
 
+from open_producten.utils.cache import API_RESPONSE_CACHE_ALIAS, response_cache
+
 
 class Command(BaseCommand):
     help = "Clears the Django cache"
 
     def add_arguments(self, parser):
-        parser.add_argument("--alias", help=_("Clear given cache only"))
+        parser.add_argument(
+            "--alias",
+            help=_(
+                "Clear given cache only, use '{alias}' for the cached API responses"
+            ).format(alias=API_RESPONSE_CACHE_ALIAS),
+        )
 
     def handle(self, *args, **options):
         alias = options["alias"]
+
+        # the response cache shares its database with the default cache, so it is
+        # invalidated instead of flushed
+        if alias == API_RESPONSE_CACHE_ALIAS:
+            response_cache.clear()
+            return
+
         cache = caches[alias] if alias else caches[DEFAULT_CACHE_ALIAS]
 
         cache.clear()
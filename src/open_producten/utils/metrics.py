@@ -0,0 +1,77 @@
+"""
+Prometheus metrics of the API and the Celery workers.
+
+The API publishes the metrics on ``/metrics`` and the Celery workers with an exporter
+on ``CELERY_WORKER_METRICS_PORT``. When the application runs in multiple processes
+(uwsgi, the prefork pool of Celery) ``PROMETHEUS_MULTIPROC_DIR`` must point to an
+empty directory, the processes write their metrics there and they are added up when
+they are collected.
+"""
+
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    multiprocess,
+)
+
+# tasks like the UPL synchronisation take minutes instead of milliseconds
+TASK_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 300, 600, 1800, 3600, float("inf"))
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, float("inf"))
+
+REQUEST_DURATION = Histogram(
+    "open_producten_request_duration_seconds",
+    "Duration of the requests per view and action.",
+    ["view", "method", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "open_producten_request_queries",
+    "Number of database queries per request.",
+    ["view"],
+    buckets=QUERY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "open_producten_cache_requests",
+    "Lookups in a cache by result, a hit or a miss.",
+    ["cache", "result"],
+)
+AUDIT_LOG_WRITE_DURATION = Histogram(
+    "open_producten_audit_log_write_duration_seconds",
+    "Duration of writing a batch of audit log entries.",
+    ["mode"],
+)
+NOTIFICATION_DISPATCH_DURATION = Histogram(
+    "open_producten_notification_dispatch_duration_seconds",
+    "Time from scheduling a notification until it was sent or failed.",
+    ["state"],
+    buckets=TASK_BUCKETS,
+)
+NOTIFICATION_FAILURES = Counter(
+    "open_producten_notification_failures",
+    "Failed attempts to send a notification, final is false when it is retried.",
+    ["final"],
+)
+TASK_DURATION = Histogram(
+    "open_producten_celery_task_duration_seconds",
+    "Run time of the Celery tasks by their final state.",
+    ["task", "state"],
+    buckets=TASK_BUCKETS,
+)
+TASK_QUEUE_DURATION = Histogram(
+    "open_producten_celery_task_queue_duration_seconds",
+    "Time the Celery tasks waited in the queue before they started.",
+    ["task"],
+    buckets=TASK_BUCKETS,
+)
+
+
+def get_registry() -> CollectorRegistry:
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
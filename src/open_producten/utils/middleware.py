@@ -0,0 +1,407 @@
+import logging
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse, JsonResponse
+from django.urls import reverse
+
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.serializers import BaseSerializer
+
+from .metrics import REQUEST_DURATION, REQUEST_QUERIES
+from .models import RequestProfiel
+from .profiling import QueryRecorder, RequestProfile, StackSampler
+
+logger = logging.getLogger(__name__)
+slow_request_logger = logging.getLogger(f"{__name__}.slow_requests")
+
+# the amount of duplicated statements in the slow request log
+SLOW_REQUEST_DUPLICATES = 5
+SLOW_REQUEST_SQL_LENGTH = 1000
+
+_current_stats: ContextVar["RequestStats | None"] = ContextVar(
+    "request_stats", default=None
+)
+
+
+@dataclass
+class RequestStats:
+    """
+    The queries and timings (in seconds) of a request.
+    """
+
+    start: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_time: float = 0
+    serializer_time: float = 0
+    total_time: float = 0
+    # sql -> [count, duration], the sql has placeholders instead of the parameters
+    statements: dict = field(default_factory=lambda: defaultdict(lambda: [0, 0.0]))
+    serializer_depth: int = 0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.queries += 1
+            self.db_time += duration
+            self.statements[sql][0] += 1
+            self.statements[sql][1] += duration
+
+    @contextmanager
+    def recording(self):
+        """
+        Record the queries on all databases and the serializer time in the block.
+        """
+        token = _current_stats.set(self)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(self.execute_wrapper)
+                    )
+                yield
+        finally:
+            _current_stats.reset(token)
+
+    def get_duplicates(self, amount: int) -> list[tuple[str, int, float]]:
+        duplicates = [
+            (sql, count, duration)
+            for sql, (count, duration) in self.statements.items()
+            if count > 1
+        ]
+        return sorted(duplicates, key=lambda d: (-d[1], -d[2]))[:amount]
+
+
+@contextmanager
+def record_request_stats():
+    """
+    Record the queries on all databases and the serializer time in the block.
+    """
+    stats = RequestStats()
+    try:
+        with stats.recording():
+            yield stats
+    finally:
+        stats.total_time = time.perf_counter() - stats.start
+
+
+def record_streaming_content(response, stats: RequestStats, on_finish) -> None:
+    """
+    Keep recording the stats while the content of a streaming response is generated,
+    which happens after the view returns, and call ``on_finish`` when the content is
+    consumed or the client disconnects.
+
+    Only the generation of every chunk is recorded, not the time the server waits to
+    send it to the client.
+    """
+    content = iter(response.streaming_content)
+    done = object()
+
+    def recorded_content():
+        try:
+            while True:
+                with stats.recording():
+                    chunk = next(content, done)
+                if chunk is done:
+                    return
+                yield chunk
+        finally:
+            stats.total_time = time.perf_counter() - stats.start
+            on_finish()
+
+    response.streaming_content = recorded_content()
+
+
+def is_sync_streaming(response) -> bool:
+    return response.streaming and not getattr(response, "is_async", False)
+
+
+def instrument_serializers():
+    """
+    Time ``BaseSerializer.data`` of the top level serializers.
+
+    ``Serializer.data`` and ``ListSerializer.data`` both call it, nested serializers
+    are serialized with ``to_representation`` and are part of the parent's time.
+    """
+    data = BaseSerializer.data
+    if getattr(data.fget, "instrumented", False):
+        return
+
+    def timed_data(self):
+        stats = _current_stats.get()
+        if stats is None:
+            return data.fget(self)
+
+        stats.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return data.fget(self)
+        finally:
+            stats.serializer_depth -= 1
+            if not stats.serializer_depth:
+                stats.serializer_time += time.perf_counter() - start
+
+    timed_data.instrumented = True
+    BaseSerializer.data = property(timed_data)
+
+
+def get_view_name(request) -> str:
+    """
+    Return the url name and the viewset action of a request, e.g.
+    ``producttype-detail:retrieve``.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return ""
+
+    name = match.view_name or match._func_path
+    actions = getattr(match.func, "actions", None)
+    if actions and (action := actions.get(request.method.lower())):
+        return f"{name}:{action}"
+    return name
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Count the queries and measure the database, serializer and total time of every
+    request, see ``REQUEST_INSTRUMENTATION``.
+
+    The timings are logged for every request and returned in a ``Server-Timing``
+    header to staff users. The content of streaming responses is generated after the
+    headers are sent, their timings are logged when the content is consumed and they
+    have no ``Server-Timing`` header. Requests above the ``SLOW_REQUEST_THRESHOLD`` or
+    ``SLOW_REQUEST_QUERY_THRESHOLD`` are also written to the slow request log with
+    the statements that were executed more than once, which points to N+1 queries.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_INSTRUMENTATION:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        instrument_serializers()
+
+    def __call__(self, request):
+        with record_request_stats() as stats:
+            response = self.get_response(request)
+
+        if is_sync_streaming(response):
+            record_streaming_content(
+                response, stats, partial(self.log, request, response, stats)
+            )
+            return response
+
+        self.log(request, response, stats)
+        user = getattr(request, "user", None)
+        if user is not None and user.is_staff:
+            response["Server-Timing"] = self.get_server_timing(stats)
+        return response
+
+    @staticmethod
+    def get_server_timing(stats: RequestStats) -> str:
+        return ", ".join(
+            (
+                f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"',
+                f"serializer;dur={stats.serializer_time * 1000:.1f}",
+                f"total;dur={stats.total_time * 1000:.1f}",
+            )
+        )
+
+    def log(self, request, response, stats: RequestStats):
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "view": get_view_name(request),
+            "status": response.status_code,
+            "queries": stats.queries,
+            "db_ms": round(stats.db_time * 1000, 1),
+            "serializer_ms": round(stats.serializer_time * 1000, 1),
+            "total_ms": round(stats.total_time * 1000, 1),
+        }
+        message = " ".join(f"{key}={value}" for key, value in data.items())
+        logger.info(message, extra={"request_stats": data})
+
+        if (
+            stats.total_time * 1000 < settings.SLOW_REQUEST_THRESHOLD
+            and stats.queries < settings.SLOW_REQUEST_QUERY_THRESHOLD
+        ):
+            return
+
+        duplicates = stats.get_duplicates(SLOW_REQUEST_DUPLICATES)
+        data["duplicates"] = [
+            {
+                "sql": sql[:SLOW_REQUEST_SQL_LENGTH],
+                "count": count,
+                "db_ms": round(duration * 1000, 1),
+            }
+            for sql, count, duration in duplicates
+        ]
+        lines = [f"Slow request: {message}"] + [
+            f"  {duplicate['count']}x {duplicate['db_ms']}ms: {duplicate['sql']}"
+            for duplicate in data["duplicates"]
+        ]
+        slow_request_logger.warning("\n".join(lines), extra={"request_stats": data})
+
+
+class PrometheusMetricsMiddleware:
+    """
+    Record the duration and the number of queries of every request in the Prometheus
+    metrics, see ``PROMETHEUS_METRICS``. Streaming responses are recorded when their
+    content is consumed.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROMETHEUS_METRICS:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with record_request_stats() as stats:
+            response = self.get_response(request)
+
+        if is_sync_streaming(response):
+            record_streaming_content(
+                response, stats, partial(self.observe, request, response, stats)
+            )
+        else:
+            self.observe(request, response, stats)
+        return response
+
+    @staticmethod
+    def observe(request, response, stats: RequestStats):
+        # unresolved paths share a label, they would give a time series per path
+        view = get_view_name(request) or "unresolved"
+        REQUEST_DURATION.labels(view, request.method, response.status_code).observe(
+            stats.total_time
+        )
+        REQUEST_QUERIES.labels(view).observe(stats.queries)
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile a single request on demand, see ``REQUEST_PROFILING``.
+
+    Staff users (by session or API token) request a profile with the ``X-Profiel``
+    header or the ``profiel`` query parameter:
+
+    * ``html``: return an HTML report instead of the response.
+    * ``speedscope``: return the samples as a speedscope file instead of the response.
+    * ``opslaan``: store the report in the admin and return the normal response, with
+      the admin url of the profile in the ``X-Profiel`` header.
+
+    ``X-Profiel-Explain: true`` or ``profiel_explain=true`` adds the
+    ``EXPLAIN (ANALYZE, BUFFERS)`` plans of the slowest queries to the report.
+
+    The response of other requests than ``GET`` and ``HEAD`` is never replaced, their
+    profile is always stored, and their queries are not explained.
+    """
+
+    header = "HTTP_X_PROFIEL"
+    explain_header = "HTTP_X_PROFIEL_EXPLAIN"
+    parameter = "profiel"
+    explain_parameter = "profiel_explain"
+    modes = ("html", "speedscope", "opslaan")
+    safe_methods = ("GET", "HEAD")
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode, explain = self.get_options(request)
+        if mode is None or not self.is_authorised(request):
+            return self.get_response(request)
+
+        # the changes of other requests have been made, the client needs the response
+        if request.method not in self.safe_methods:
+            mode, explain = "opslaan", False
+
+        recorder = QueryRecorder()
+        with recorder.record(), StackSampler() as sampler:
+            response = self.get_response(request)
+
+        profile = RequestProfile(
+            name=f"{request.method} {request.get_full_path()}",
+            sampler=sampler,
+            recorder=recorder,
+            plans=recorder.explain() if explain else [],
+        )
+
+        if mode == "speedscope":
+            return JsonResponse(
+                profile.get_speedscope(),
+                headers={
+                    "Content-Disposition": 'attachment; filename="profiel.speedscope.json"'
+                },
+            )
+        if mode == "html":
+            return HttpResponse(profile.render_html())
+
+        profiel = self.save(request, response, profile)
+        response["X-Profiel"] = request.build_absolute_uri(
+            reverse("admin:utils_requestprofiel_change", args=[profiel.pk])
+        )
+        return response
+
+    def get_options(self, request) -> tuple[str | None, bool]:
+        """
+        Return the profiling mode and whether to explain the queries. The query
+        parameters are removed, so they do not reach the filters and pagination links
+        of the view.
+        """
+        mode = request.META.get(self.header)
+        explain = request.META.get(self.explain_header)
+        if self.parameter in request.GET or self.explain_parameter in request.GET:
+            request.GET = request.GET.copy()
+            mode = request.GET.pop(self.parameter, [mode])[-1]
+            explain = request.GET.pop(self.explain_parameter, [explain])[-1]
+            request.META["QUERY_STRING"] = request.GET.urlencode()
+
+        if mode is not None:
+            mode = mode.lower() or "html"
+            if mode not in self.modes:
+                mode = "html"
+        return mode, (explain or "").lower() in ("true", "1", "yes")
+
+    @staticmethod
+    def is_authorised(request) -> bool:
+        """
+        Only staff users can profile requests, the API uses token authentication so
+        the token is checked here before the view does.
+        """
+        try:
+            result = TokenAuthentication().authenticate(Request(request))
+        except AuthenticationFailed:
+            return False
+
+        user = result[0] if result else getattr(request, "user", None)
+        return user is not None and user.is_staff
+
+    @staticmethod
+    def save(request, response, profile: RequestProfile) -> RequestProfiel:
+        user = getattr(request, "user", None)
+        return RequestProfiel.objects.create(
+            gebruiker=user if user is not None and user.is_authenticated else None,
+            methode=request.method,
+            pad=request.get_full_path(),
+            status_code=response.status_code,
+            duur=profile.duration_ms,
+            aantal_queries=len(profile.recorder.queries),
+            rapport=profile.render_html(),
+            speedscope=profile.get_speedscope(),
+        )
@@ -0,0 +1,105 @@
+# Generated by Django 4.2.17 on 2026-10-18 03:18
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestProfiel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "aanmaak_datum",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="De datum waarop het profiel is gemaakt.",
+                        verbose_name="aanmaak datum",
+                    ),
+                ),
+                (
+                    "methode",
+                    models.CharField(
+                        help_text="De HTTP methode van het request.",
+                        max_length=10,
+                        verbose_name="methode",
+                    ),
+                ),
+                (
+                    "pad",
+                    models.TextField(
+                        help_text="Het pad en de query parameters van het request.",
+                        verbose_name="pad",
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        help_text="De status code van het antwoord.",
+                        verbose_name="status code",
+                    ),
+                ),
+                (
+                    "duur",
+                    models.FloatField(
+                        help_text="De duur van het request in milliseconden.",
+                        verbose_name="duur (ms)",
+                    ),
+                ),
+                (
+                    "aantal_queries",
+                    models.PositiveIntegerField(
+                        help_text="Het aantal uitgevoerde database queries.",
+                        verbose_name="aantal queries",
+                    ),
+                ),
+                (
+                    "rapport",
+                    models.TextField(
+                        help_text="Het HTML rapport van het profiel.",
+                        verbose_name="rapport",
+                    ),
+                ),
+                (
+                    "speedscope",
+                    models.JSONField(
+                        help_text="Het profiel in het speedscope formaat.",
+                        verbose_name="speedscope",
+                    ),
+                ),
+                (
+                    "gebruiker",
+                    models.ForeignKey(
+                        help_text="De gebruiker die het profiel heeft aangevraagd.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="gebruiker",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "request profiel",
+                "verbose_name_plural": "request profielen",
+                "ordering": ("-aanmaak_datum",),
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from uuid import uuid4
 
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -31,3 +32,59 @@ class BasePublishableModel(BaseModel):
 
     class Meta:
         abstract = True
+
+
+class RequestProfiel(BaseModel):
+    """
+    A profile of a request, see ``RequestProfilingMiddleware``.
+    """
+
+    aanmaak_datum = models.DateTimeField(
+        verbose_name=_("aanmaak datum"),
+        auto_now_add=True,
+        help_text=_("De datum waarop het profiel is gemaakt."),
+    )
+    gebruiker = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("gebruiker"),
+        on_delete=models.SET_NULL,
+        null=True,
+        help_text=_("De gebruiker die het profiel heeft aangevraagd."),
+    )
+    methode = models.CharField(
+        verbose_name=_("methode"),
+        max_length=10,
+        help_text=_("De HTTP methode van het request."),
+    )
+    pad = models.TextField(
+        verbose_name=_("pad"),
+        help_text=_("Het pad en de query parameters van het request."),
+    )
+    status_code = models.PositiveSmallIntegerField(
+        verbose_name=_("status code"),
+        help_text=_("De status code van het antwoord."),
+    )
+    duur = models.FloatField(
+        verbose_name=_("duur (ms)"),
+        help_text=_("De duur van het request in milliseconden."),
+    )
+    aantal_queries = models.PositiveIntegerField(
+        verbose_name=_("aantal queries"),
+        help_text=_("Het aantal uitgevoerde database queries."),
+    )
+    rapport = models.TextField(
+        verbose_name=_("rapport"),
+        help_text=_("Het HTML rapport van het profiel."),
+    )
+    speedscope = models.JSONField(
+        verbose_name=_("speedscope"),
+        help_text=_("Het profiel in het speedscope formaat."),
+    )
+
+    class Meta:
+        verbose_name = _("request profiel")
+        verbose_name_plural = _("request profielen")
+        ordering = ("-aanmaak_datum",)
+
+    def __str__(self):
+        return f"{self.methode} {self.pad}"
@@ -1,7 +1,215 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class Pagination(PageNumberPagination):
     page_size = 100
     page_size_query_param = "page_size"
     max_page_size = 200
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on ``(<sortering>, id)`` instead of using an offset.
+
+    No count is done and every page is fetched with an index range scan, so the cost of a
+    page does not depend on how deep the client pages. The cursors are opaque to clients.
+    """
+
+    cursor_query_param = "cursor"
+    ordering_query_param = "sortering"
+    ordering_fields = ("aanmaak_datum", "update_datum")
+
+    page_size = Pagination.page_size
+    page_size_query_param = Pagination.page_size_query_param
+    max_page_size = Pagination.max_page_size
+
+    invalid_cursor_message = _("Ongeldige cursor.")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering_field = self.get_ordering_field(request)
+        self.cursor = self.decode_cursor(request)
+
+        queryset = queryset.order_by(self.ordering_field, "id")
+        reverse = self.cursor is not None and self.cursor["reverse"]
+
+        if self.cursor is not None:
+            queryset = queryset.filter(self._seek(**self.cursor))
+        if reverse:
+            queryset = queryset.reverse()
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        self.page = results
+        return results
+
+    def _seek(self, value, id, reverse):
+        lookup = "lt" if reverse else "gt"
+        field = self.ordering_field
+        # the redundant range condition on the leading column lets Postgres use the
+        # composite index for a range scan
+        return Q(**{f"{field}__{lookup}e": value}) & (
+            Q(**{f"{field}__{lookup}": value})
+            | Q(**{field: value, f"id__{lookup}": id})
+        )
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering_field(self, request):
+        field = request.query_params.get(self.ordering_query_param, "aanmaak_datum")
+        if field not in self.ordering_fields:
+            raise ValidationError(
+                {
+                    self.ordering_query_param: _(
+                        "Ongeldige sortering, kies uit: {fields}."
+                    ).format(fields=", ".join(self.ordering_fields))
+                }
+            )
+        return field
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if data["f"] != self.ordering_field:
+                raise ValueError
+            return {
+                "value": datetime.fromisoformat(data["v"]),
+                "id": uuid.UUID(str(data["i"])),
+                "reverse": bool(data["r"]),
+            }
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse):
+        data = {
+            "f": self.ordering_field,
+            "v": getattr(instance, self.ordering_field).isoformat(),
+            "i": str(instance.id),
+            "r": reverse,
+        }
+        encoded = base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+
+class OptionalKeysetPagination(Pagination):
+    """
+    Page number pagination, which switches to :class:`KeysetPagination` when the client
+    requests ``?paginatie=cursor``.
+    """
+
+    mode_query_param = "paginatie"
+    keyset_pagination_class = KeysetPagination
+
+    def uses_keyset(self, request) -> bool:
+        return request.query_params.get(self.mode_query_param) == "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.uses_keyset(request):
+            self.keyset_paginator = self.keyset_pagination_class()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+
+        self.keyset_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["required"] = ["results"]
+        response_schema["properties"]["count"]["description"] = _(
+            "Het totaal aantal resultaten. Wordt niet teruggegeven bij `paginatie=cursor`."
+        )
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        keyset_paginator = self.keyset_pagination_class
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": _(
+                    "Gebruik `cursor` voor paginatie op basis van cursors in plaats van paginanummers. "
+                    "Er wordt dan geen `count` teruggegeven."
+                ),
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": keyset_paginator.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": _(
+                    "De cursor van de op te vragen pagina bij `paginatie=cursor`, zoals teruggegeven in `next` en `previous`."
+                ),
+                "schema": {"type": "string"},
+            },
+            {
+                "name": keyset_paginator.ordering_query_param,
+                "required": False,
+                "in": "query",
+                "description": _(
+                    "Het veld waarop gesorteerd wordt bij `paginatie=cursor`."
+                ),
+                "schema": {
+                    "type": "string",
+                    "enum": list(keyset_paginator.ordering_fields),
+                    "default": "aanmaak_datum",
+                },
+            },
+        ]
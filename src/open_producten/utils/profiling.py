@@ -0,0 +1,261 @@
+"""
+Profiling of single requests, see ``RequestProfilingMiddleware``.
+
+The stack of the request thread is sampled from a background thread, which gives the
+time spent per function without the overhead of tracing every call. The samples are
+exported in the `speedscope <https://www.speedscope.app/>`_ format or summarised in an
+HTML report with the executed queries and, optionally, their query plans.
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.db import DatabaseError, connections, transaction
+from django.template.loader import render_to_string
+
+SAMPLE_INTERVAL = 0.001
+
+# the amount of functions and queries in the report
+REPORT_FUNCTIONS = 40
+EXPLAIN_QUERIES = 20
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class StackSampler:
+    """
+    Sample the stack of the current thread every ``interval`` seconds in the block.
+
+    The frames above the block (the server and the outer middleware) are left out.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        # (function, file, line) -> index
+        self.frames: dict[tuple[str, str, int], int] = {}
+        # the frame indexes from the outermost to the innermost frame
+        self.samples: list[list[int]] = []
+        self.weights: list[float] = []
+        self.duration = 0.0
+
+    def __enter__(self):
+        self.thread_id = threading.get_ident()
+        self.depth = self._get_depth(sys._getframe(1))
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self._run, daemon=True)
+        self.start = time.perf_counter()
+        self.sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.sampler.join()
+        self.duration = time.perf_counter() - self.start
+
+    @staticmethod
+    def _get_depth(frame) -> int:
+        depth = 0
+        while frame is not None:
+            depth += 1
+            frame = frame.f_back
+        return depth
+
+    def _run(self):
+        last = self.start
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_qualname, code.co_filename, code.co_firstlineno)
+                stack.append(self.frames.setdefault(key, len(self.frames)))
+                frame = frame.f_back
+            stack.reverse()
+
+            del stack[: self.depth]
+            self.samples.append(stack)
+            self.weights.append(now - last)
+            last = now
+
+    def get_functions(self) -> list[dict]:
+        """
+        Return the total and self time of every function, the slowest first.
+        """
+        total = defaultdict(float)
+        own = defaultdict(float)
+        for stack, weight in zip(self.samples, self.weights):
+            for index in set(stack):
+                total[index] += weight
+            if stack:
+                own[stack[-1]] += weight
+
+        frames = list(self.frames)
+        functions = [
+            {
+                "name": frames[index][0],
+                "file": f"{short_path(frames[index][1])}:{frames[index][2]}",
+                "total_ms": total[index] * 1000,
+                "self_ms": own[index] * 1000,
+            }
+            for index in total
+        ]
+        return sorted(functions, key=lambda f: (-f["total_ms"], -f["self_ms"]))
+
+    def get_speedscope(self, name: str) -> dict:
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "open-producten",
+            "shared": {
+                "frames": [
+                    {"name": function, "file": file, "line": line}
+                    for function, file, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(self.weights),
+                    "samples": self.samples,
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+def short_path(path: str) -> str:
+    for prefix in sorted(sys.path, key=len, reverse=True):
+        if prefix and path.startswith(prefix):
+            return str(Path(path).relative_to(prefix))
+    return path
+
+
+@dataclass
+class Query:
+    alias: str
+    sql: str
+    params: object
+    many: bool
+    duration: float
+
+
+@dataclass
+class QueryRecorder:
+    queries: list[Query] = field(default_factory=list)
+
+    @contextmanager
+    def record(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(self._wrapper(connection.alias))
+                )
+            yield self
+
+    def _wrapper(self, alias: str):
+        def execute_wrapper(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                self.queries.append(
+                    Query(alias, sql, params, many, time.perf_counter() - start)
+                )
+
+        return execute_wrapper
+
+    def get_statements(self) -> list[dict]:
+        """
+        Return the executed statements with their count and duration, the slowest
+        first. The statements have placeholders instead of the parameters.
+        """
+        statements = {}
+        for query in self.queries:
+            statement = statements.setdefault(
+                query.sql, {"sql": query.sql, "count": 0, "duration_ms": 0.0}
+            )
+            statement["count"] += 1
+            statement["duration_ms"] += query.duration * 1000
+        return sorted(statements.values(), key=lambda s: -s["duration_ms"])
+
+    def explain(self, amount: int = EXPLAIN_QUERIES) -> list[dict]:
+        """
+        Return the ``EXPLAIN (ANALYZE, BUFFERS)`` plans of the slowest distinct select
+        statements. The statements are executed again in a transaction that is rolled
+        back, a statement that cannot be explained gets the error instead of a plan.
+        """
+        plans = []
+        for query in sorted(self.queries, key=lambda q: -q.duration):
+            if len(plans) == amount:
+                break
+            if (
+                query.many
+                or not query.sql.lstrip().upper().startswith("SELECT")
+                or any(plan["sql"] == query.sql for plan in plans)
+            ):
+                continue
+
+            plan, error = "", ""
+            try:
+                with transaction.atomic(using=query.alias):
+                    with connections[query.alias].cursor() as cursor:
+                        cursor.execute(
+                            f"EXPLAIN (ANALYZE, BUFFERS) {query.sql}", query.params
+                        )
+                        plan = "\n".join(row[0] for row in cursor.fetchall())
+                    transaction.set_rollback(True, using=query.alias)
+            except DatabaseError as exc:
+                error = str(exc)
+
+            plans.append(
+                {
+                    "sql": query.sql,
+                    "duration_ms": query.duration * 1000,
+                    "plan": plan,
+                    "error": error,
+                }
+            )
+        return plans
+
+
+@dataclass
+class RequestProfile:
+    name: str
+    sampler: StackSampler
+    recorder: QueryRecorder
+    plans: list[dict] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.sampler.duration * 1000
+
+    def get_speedscope(self) -> dict:
+        return self.sampler.get_speedscope(self.name)
+
+    def render_html(self) -> str:
+        statements = self.recorder.get_statements()
+        return render_to_string(
+            "utils/profiel.html",
+            {
+                "name": self.name,
+                "duration_ms": self.duration_ms,
+                "samples": len(self.sampler.samples),
+                "queries": len(self.recorder.queries),
+                "db_ms": sum(statement["duration_ms"] for statement in statements),
+                "functions": self.sampler.get_functions()[:REPORT_FUNCTIONS],
+                "statements": statements,
+                "plans": self.plans,
+            },
+        )
@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+from django.db.models import Q
+from django.test import TestCase
+
+from open_producten.producttypen.models import ContentElement, Prijs
+from open_producten.producttypen.tests.factories import (
+    ContentElementFactory,
+    ContentLabelFactory,
+    PrijsFactory,
+    PrijsOptieFactory,
+)
+
+from ..filters import filter_exists, parse_json_attr, split_multi_valued_lookup
+
+
+class TestSplitMultiValuedLookup(TestCase):
+    def test_reverse_foreign_key(self):
+        outer_path, field, lookup = split_multi_valued_lookup(
+            Prijs, "prijsopties__bedrag__gte"
+        )
+
+        self.assertEqual(outer_path, "pk")
+        self.assertEqual(field.name, "prijsopties")
+        self.assertEqual(lookup, "bedrag__gte")
+
+    def test_many_to_many_on_primary_key(self):
+        outer_path, field, lookup = split_multi_valued_lookup(
+            ContentElement, "labels__in"
+        )
+
+        self.assertEqual(outer_path, "pk")
+        self.assertEqual(field.name, "labels")
+        self.assertEqual(lookup, "pk__in")
+
+    def test_after_foreign_key(self):
+        outer_path, field, lookup = split_multi_valued_lookup(
+            Prijs, "product_type__translations__naam"
+        )
+
+        self.assertEqual(outer_path, "product_type")
+        self.assertEqual(field.name, "translations")
+        self.assertEqual(lookup, "naam")
+
+    def test_single_valued(self):
+        self.assertIsNone(split_multi_valued_lookup(Prijs, "product_type__code"))
+        self.assertIsNone(split_multi_valued_lookup(Prijs, "actief_vanaf__gte"))
+
+
+class TestFilterExists(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.prijs = PrijsFactory.create()
+        PrijsOptieFactory.create(prijs=self.prijs, bedrag=Decimal(10))
+        PrijsOptieFactory.create(prijs=self.prijs, bedrag=Decimal(30))
+        self.other_prijs = PrijsFactory.create()
+        PrijsOptieFactory.create(prijs=self.other_prijs, bedrag=Decimal(50))
+
+    def test_filter_exists(self):
+        queryset = filter_exists(Prijs.objects.all(), prijsopties__bedrag__lte=40)
+
+        self.assertQuerySetEqual(queryset, [self.prijs])
+        self.assertIn("EXISTS", str(queryset.query))
+
+    def test_lookups_apply_to_same_object(self):
+        queryset = filter_exists(
+            Prijs.objects.all(), prijsopties__bedrag=10, prijsopties__beschrijving="x"
+        )
+        self.assertQuerySetEqual(queryset, [])
+
+    def test_conditions(self):
+        queryset = filter_exists(
+            Prijs.objects.all(),
+            Q(prijsopties__bedrag=50) | Q(prijsopties__bedrag=10),
+            prijsopties__bedrag__lte=40,
+        )
+
+        self.assertQuerySetEqual(queryset, [self.prijs])
+        self.assertIn("EXISTS", str(queryset.query))
+
+    def test_exclude(self):
+        queryset = filter_exists(
+            Prijs.objects.all(), exclude=True, prijsopties__bedrag=10
+        )
+
+        self.assertQuerySetEqual(queryset, [self.other_prijs])
+
+    def test_many_to_many(self):
+        element = ContentElementFactory.create()
+        element.labels.add(
+            ContentLabelFactory.create(naam="a"), ContentLabelFactory.create(naam="b")
+        )
+        ContentElementFactory.create()
+
+        queryset = filter_exists(ContentElement.objects.all(), labels__naam__in="ab")
+
+        self.assertQuerySetEqual(queryset, [element])
+
+    def test_single_valued_lookups_are_not_a_subquery(self):
+        queryset = filter_exists(
+            Prijs.objects.all(), product_type__code=self.prijs.product_type.code
+        )
+
+        self.assertQuerySetEqual(queryset, [self.prijs])
+        self.assertNotIn("EXISTS", str(queryset.query))
+
+
+class TestParseJsonAttr(TestCase):
+    def test_parse(self):
+        self.assertEqual(
+            parse_json_attr("persoon__leeftijd__gte__18"),
+            (["persoon", "leeftijd"], "gte", "18"),
+        )
+
+    def test_value_with_separator(self):
+        self.assertEqual(
+            parse_json_attr("naam__exact__a__b"), (["naam"], "exact", "a__b")
+        )
+
+    def test_without_operator(self):
+        with self.assertRaises(ValueError):
+            parse_json_attr("naam__a")
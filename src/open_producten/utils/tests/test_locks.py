@@ -0,0 +1,29 @@
+from django.db import connections
+from django.test import TransactionTestCase
+
+from ..locks import _lock_key, advisory_lock
+
+
+class TestAdvisoryLock(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_connection = connections.create_connection("default")
+        self.addCleanup(self.other_connection.close)
+
+    def _lock_from_other_connection(self, name):
+        with self.other_connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [_lock_key(name)])
+            return cursor.fetchone()[0]
+
+    def test_lock_is_acquired_and_released(self):
+        with advisory_lock("test") as acquired:
+            self.assertTrue(acquired)
+            self.assertFalse(self._lock_from_other_connection("test"))
+
+        self.assertTrue(self._lock_from_other_connection("test"))
+
+    def test_lock_is_not_acquired_when_held_elsewhere(self):
+        self.assertTrue(self._lock_from_other_connection("test"))
+
+        with advisory_lock("test") as acquired:
+            self.assertFalse(acquired)
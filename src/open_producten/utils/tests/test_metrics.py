@@ -0,0 +1,187 @@
+import time
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+
+from notifications_api_common.tasks import send_notification
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+from open_producten.celery import add_published_at, task_finished, task_started
+from open_producten.logging.tasks import prune_logs
+from open_producten.producten.tests.factories import ProductFactory
+from open_producten.producttypen.tests.factories import JsonSchemaFactory, ThemaFactory
+
+from .cases import BaseApiTestCase
+
+
+def get_sample_value(name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@override_settings(PROMETHEUS_METRICS=True)
+class TestMetricsEndpoint(BaseApiTestCase):
+    path = reverse_lazy("metrics")
+
+    def test_metrics(self):
+        ThemaFactory.create()
+        self.client.get(reverse("thema-list"))
+
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            'open_producten_request_duration_seconds_count{method="GET",'
+            'status="200",view="thema-list:list"}',
+            response.content.decode(),
+        )
+
+    def test_request_queries(self):
+        labels = {"view": "thema-list:list"}
+        count = get_sample_value("open_producten_request_queries_count", labels)
+        queries = get_sample_value("open_producten_request_queries_sum", labels)
+
+        self.client.get(reverse("thema-list"))
+
+        self.assertEqual(
+            get_sample_value("open_producten_request_queries_count", labels),
+            count + 1,
+        )
+        self.assertGreater(
+            get_sample_value("open_producten_request_queries_sum", labels), queries
+        )
+
+    def test_streaming_response_is_observed_when_consumed(self):
+        ProductFactory.create_batch(2)
+        labels = {"view": "product-export:export"}
+        count = get_sample_value("open_producten_request_queries_count", labels)
+        queries = get_sample_value("open_producten_request_queries_sum", labels)
+
+        response = self.client.get(reverse("product-export"))
+
+        self.assertEqual(
+            get_sample_value("open_producten_request_queries_count", labels), count
+        )
+
+        with CaptureQueriesContext(connection) as export_queries:
+            b"".join(response.streaming_content)
+
+        self.assertEqual(
+            get_sample_value("open_producten_request_queries_count", labels),
+            count + 1,
+        )
+        self.assertGreater(
+            get_sample_value("open_producten_request_queries_sum", labels),
+            queries + len(export_queries),
+        )
+
+
+class TestMetricsEndpointDisabled(BaseApiTestCase):
+    def test_not_found(self):
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestValidatorCacheMetrics(TestCase):
+    def test_hits_and_misses(self):
+        schema = JsonSchemaFactory.create(schema={"type": "object", "minProperties": 1})
+        hits, misses = (
+            get_sample_value(
+                "open_producten_cache_requests_total",
+                {"cache": "json_schema_validators", "result": result},
+            )
+            for result in ("hit", "miss")
+        )
+
+        schema.validate({"a": 1})
+        schema.validate({"b": 2})
+
+        self.assertEqual(
+            get_sample_value(
+                "open_producten_cache_requests_total",
+                {"cache": "json_schema_validators", "result": "miss"},
+            ),
+            misses + 1,
+        )
+        self.assertEqual(
+            get_sample_value(
+                "open_producten_cache_requests_total",
+                {"cache": "json_schema_validators", "result": "hit"},
+            ),
+            hits + 1,
+        )
+
+
+class TestTaskMetrics(TestCase):
+    def run_task(self, task, state, queued=5):
+        headers = {}
+        add_published_at(headers=headers)
+        task.push_request(published_at=headers["published_at"] - queued)
+        try:
+            task_started(task=task)
+            task_finished(task=task, state=state)
+        finally:
+            task.pop_request()
+
+    def test_task_duration(self):
+        labels = {"task": prune_logs.name, "state": "SUCCESS"}
+        count = get_sample_value(
+            "open_producten_celery_task_duration_seconds_count", labels
+        )
+        queued = get_sample_value(
+            "open_producten_celery_task_queue_duration_seconds_sum",
+            {"task": prune_logs.name},
+        )
+
+        self.run_task(prune_logs, "SUCCESS")
+
+        self.assertEqual(
+            get_sample_value(
+                "open_producten_celery_task_duration_seconds_count", labels
+            ),
+            count + 1,
+        )
+        self.assertGreaterEqual(
+            get_sample_value(
+                "open_producten_celery_task_queue_duration_seconds_sum",
+                {"task": prune_logs.name},
+            ),
+            queued + 5,
+        )
+
+    def test_notification_failures(self):
+        def get_failures(final):
+            return get_sample_value(
+                "open_producten_notification_failures_total", {"final": final}
+            )
+
+        retries, failures = get_failures("false"), get_failures("true")
+        sent = get_sample_value(
+            "open_producten_notification_dispatch_duration_seconds_count",
+            {"state": "SUCCESS"},
+        )
+
+        self.run_task(send_notification, "RETRY")
+        self.run_task(send_notification, "FAILURE")
+        self.run_task(send_notification, "SUCCESS")
+
+        self.assertEqual(get_failures("false"), retries + 1)
+        self.assertEqual(get_failures("true"), failures + 1)
+        self.assertEqual(
+            get_sample_value(
+                "open_producten_notification_dispatch_duration_seconds_count",
+                {"state": "SUCCESS"},
+            ),
+            sent + 1,
+        )
+
+    def test_published_at_header(self):
+        headers = {}
+
+        add_published_at(headers=headers)
+
+        self.assertAlmostEqual(headers["published_at"], time.time(), delta=5)
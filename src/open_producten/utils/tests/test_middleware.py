@@ -0,0 +1,119 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from rest_framework import status
+
+from open_producten.accounts.models import User
+from open_producten.producten.tests.factories import ProductFactory
+from open_producten.producttypen.tests.factories import ThemaFactory
+
+from ..middleware import record_request_stats
+from .cases import BaseApiTestCase
+
+
+def parse_server_timing(header: str) -> dict[str, str]:
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+@override_settings(REQUEST_INSTRUMENTATION=True)
+class TestRequestInstrumentationMiddleware(BaseApiTestCase):
+    path = reverse_lazy("thema-list")
+
+    def setUp(self):
+        super().setUp()
+        ThemaFactory.create_batch(3)
+
+    def test_server_timing_for_staff_users(self):
+        User.objects.filter(username="testuser").update(is_staff=True)
+
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = parse_server_timing(response["Server-Timing"])
+        self.assertEqual(list(metrics), ["db", "serializer", "total"])
+        self.assertRegex(metrics["db"]["desc"], r'^"\d+ queries"$')
+        self.assertGreater(float(metrics["serializer"]["dur"]), 0)
+        self.assertGreaterEqual(
+            float(metrics["total"]["dur"]), float(metrics["db"]["dur"])
+        )
+
+    def test_no_server_timing_for_other_users(self):
+        response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
+
+    def test_request_is_logged(self):
+        with self.assertLogs("open_producten.utils.middleware", "INFO") as logs:
+            self.client.get(self.path)
+
+        [record] = logs.records
+        stats = record.request_stats
+        self.assertEqual(stats["view"], "thema-list:list")
+        self.assertEqual(stats["status"], 200)
+        self.assertGreater(stats["queries"], 0)
+        self.assertIn("view=thema-list:list", record.getMessage())
+
+    @override_settings(SLOW_REQUEST_QUERY_THRESHOLD=1)
+    def test_slow_request_is_logged(self):
+        with self.assertLogs(
+            "open_producten.utils.middleware.slow_requests", "WARNING"
+        ) as logs:
+            self.client.get(self.path)
+
+        [record] = logs.records
+        self.assertTrue(record.getMessage().startswith("Slow request: "))
+        self.assertIn("duplicates", record.request_stats)
+
+    def test_fast_request_is_not_logged_as_slow(self):
+        with self.assertNoLogs("open_producten.utils.middleware.slow_requests"):
+            self.client.get(self.path)
+
+    def test_streaming_response_is_logged_when_consumed(self):
+        User.objects.filter(username="testuser").update(is_staff=True)
+        ProductFactory.create_batch(2)
+
+        with self.assertLogs("open_producten.utils.middleware", "INFO") as logs:
+            response = self.client.get(reverse_lazy("product-export"))
+            self.assertEqual(logs.records, [])
+
+            with CaptureQueriesContext(connection) as queries:
+                b"".join(response.streaming_content)
+
+        [record] = logs.records
+        self.assertEqual(record.request_stats["view"], "product-export:export")
+        # the queries of the view and of the export
+        self.assertGreater(record.request_stats["queries"], len(queries))
+        self.assertGreater(len(queries), 0)
+        # the headers are sent before the content is generated
+        self.assertNotIn("Server-Timing", response)
+
+
+class TestMiddlewareDisabled(BaseApiTestCase):
+    def test_no_server_timing(self):
+        User.objects.filter(username="testuser").update(is_staff=True)
+
+        response = self.client.get(reverse_lazy("thema-list"))
+
+        self.assertNotIn("Server-Timing", response)
+
+
+class TestRecordRequestStats(TestCase):
+    def test_duplicated_statements(self):
+        with record_request_stats() as stats:
+            with connection.cursor() as cursor:
+                for i in range(3):
+                    cursor.execute("SELECT %s", [i])
+                cursor.execute("SELECT 1")
+
+        self.assertEqual(stats.queries, 4)
+        self.assertGreater(stats.db_time, 0)
+        self.assertGreaterEqual(stats.total_time, stats.db_time)
+        [(sql, count, duration)] = stats.get_duplicates(5)
+        self.assertEqual((sql, count), ("SELECT %s", 3))
@@ -0,0 +1,260 @@
+import json
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse, reverse_lazy
+
+from django_webtest import WebTest
+from maykin_2fa.test import disable_admin_mfa
+from rest_framework import status
+
+from open_producten.accounts.models import User
+from open_producten.accounts.tests.factories import UserFactory
+from open_producten.producttypen.tests.factories import ThemaFactory
+
+from ..models import RequestProfiel
+from ..profiling import Query, QueryRecorder, StackSampler
+from .cases import BaseApiTestCase
+
+
+def busy(amount: int) -> int:
+    return sum(i * i for i in range(amount))
+
+
+class TestStackSampler(TestCase):
+    def test_samples(self):
+        with StackSampler() as sampler:
+            busy(2_000_000)
+
+        self.assertGreater(len(sampler.samples), 0)
+        self.assertEqual(len(sampler.samples), len(sampler.weights))
+        names = [function["name"] for function in sampler.get_functions()]
+        self.assertIn("busy", names)
+        # the frames above the block are left out
+        self.assertNotIn("TestStackSampler.test_samples", names)
+
+    def test_speedscope(self):
+        with StackSampler() as sampler:
+            busy(1_000_000)
+
+        speedscope = sampler.get_speedscope("test")
+
+        [profile] = speedscope["profiles"]
+        self.assertEqual(profile["type"], "sampled")
+        self.assertEqual(len(profile["samples"]), len(profile["weights"]))
+        frames = speedscope["shared"]["frames"]
+        for sample in profile["samples"]:
+            for index in sample:
+                self.assertLess(index, len(frames))
+
+
+class TestQueryRecorder(TestCase):
+    def test_explain(self):
+        ThemaFactory.create()
+        recorder = QueryRecorder()
+
+        with recorder.record():
+            list(User.objects.all())
+            User.objects.update(first_name="test")
+
+        [plan] = recorder.explain()
+        self.assertIn('FROM "accounts_user"', plan["sql"])
+        self.assertIn("actual time", plan["plan"])
+        self.assertEqual(
+            [statement["count"] for statement in recorder.get_statements()], [1, 1]
+        )
+
+    def test_explain_error(self):
+        recorder = QueryRecorder()
+        recorder.queries.append(
+            Query("default", 'SELECT * FROM "bestaat_niet"', (), False, 0.1)
+        )
+        with recorder.record():
+            list(User.objects.all())
+
+        plans = recorder.explain()
+
+        self.assertEqual([bool(plan["error"]) for plan in plans], [True, False])
+        self.assertIn('"bestaat_niet" does not exist', plans[0]["error"])
+        self.assertEqual(plans[0]["plan"], "")
+        # the failed statement is rolled back, the connection can still be used
+        self.assertIn("actual time", plans[1]["plan"])
+        self.assertFalse(User.objects.exists())
+
+
+@override_settings(REQUEST_PROFILING=True)
+class TestRequestProfilingMiddleware(BaseApiTestCase):
+    path = reverse_lazy("thema-list")
+
+    def setUp(self):
+        super().setUp()
+        User.objects.filter(username="testuser").update(is_staff=True)
+        ThemaFactory.create_batch(3)
+
+    def test_html(self):
+        response = self.client.get(self.path, {"profiel": "html"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
+        content = response.content.decode()
+        self.assertIn("<h2>Functies</h2>", content)
+        self.assertIn("thema", content)
+        self.assertNotIn("<h2>Query plans</h2>", content)
+
+    def test_header(self):
+        response = self.client.get(self.path, HTTP_X_PROFIEL="html")
+
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
+
+    def test_speedscope(self):
+        response = self.client.get(self.path, HTTP_X_PROFIEL="speedscope")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("attachment", response["Content-Disposition"])
+        speedscope = json.loads(response.content)
+        self.assertEqual(
+            speedscope["$schema"], "https://www.speedscope.app/file-format-schema.json"
+        )
+        self.assertEqual(speedscope["name"], f"GET {self.path}")
+
+    def test_explain(self):
+        response = self.client.get(
+            self.path, {"profiel": "html", "profiel_explain": "true"}
+        )
+
+        content = response.content.decode()
+        self.assertIn("<h2>Query plans</h2>", content)
+        self.assertIn("Buffers:", content)
+
+    def test_explain_error_in_report(self):
+        with patch(
+            "open_producten.utils.profiling.QueryRecorder.explain",
+            return_value=[
+                {"sql": "SELECT 1", "duration_ms": 1.0, "plan": "", "error": "kan niet"}
+            ],
+        ):
+            response = self.client.get(
+                self.path, {"profiel": "html", "profiel_explain": "true"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("EXPLAIN mislukt: kan niet", response.content.decode())
+
+    def test_unsafe_method_is_stored(self):
+        response = self.client.post(
+            f"{self.path}?profiel=html&profiel_explain=true", {}, format="json"
+        )
+
+        # the response of the view, not the report
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("naam", response.json())
+
+        profiel = RequestProfiel.objects.get()
+        self.assertEqual(profiel.methode, "POST")
+        self.assertEqual(response["X-Profiel"].split("/")[-3], str(profiel.pk))
+        self.assertNotIn("<h2>Query plans</h2>", profiel.rapport)
+
+    def test_save(self):
+        response = self.client.get(self.path, {"profiel": "opslaan", "page": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+        # the profiling parameters do not reach the view
+        self.assertNotIn("profiel", response.json()["next"] or "")
+
+        profiel = RequestProfiel.objects.get()
+        self.assertEqual(profiel.gebruiker.username, "testuser")
+        self.assertEqual(profiel.methode, "GET")
+        self.assertEqual(profiel.pad, f"{self.path}?page=1")
+        self.assertEqual(profiel.status_code, 200)
+        self.assertGreater(profiel.aantal_queries, 0)
+        self.assertIn("<h2>Queries</h2>", profiel.rapport)
+        self.assertEqual(len(profiel.speedscope["profiles"]), 1)
+        self.assertEqual(
+            response["X-Profiel"],
+            "http://testserver"
+            + reverse("admin:utils_requestprofiel_change", args=[profiel.pk]),
+        )
+
+    def test_no_profile_for_other_users(self):
+        User.objects.filter(username="testuser").update(is_staff=False)
+
+        response = self.client.get(self.path, {"profiel": "html"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_no_profile_for_invalid_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token invalid")
+
+        response = self.client.get(self.path, {"profiel": "html"})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TestRequestProfilingDisabled(BaseApiTestCase):
+    def test_no_profile(self):
+        User.objects.filter(username="testuser").update(is_staff=True)
+
+        response = self.client.get(reverse("thema-list"), {"profiel": "html"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 0)
+        self.assertFalse(RequestProfiel.objects.exists())
+
+
+@disable_admin_mfa()
+class TestRequestProfielAdmin(WebTest):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.superuser = UserFactory.create(superuser=True)
+        cls.profiel = RequestProfiel.objects.create(
+            methode="GET",
+            pad="/producttypen/api/v1/producttypen?keywords=parkeren",
+            status_code=200,
+            duur=12.5,
+            aantal_queries=4,
+            rapport="<h1>rapport</h1>",
+            speedscope={"name": "GET /producttypen/api/v1/producttypen"},
+        )
+
+    def test_changelist(self):
+        response = self.app.get(
+            reverse("admin:utils_requestprofiel_changelist"), user=self.superuser
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            reverse("admin:utils_requestprofiel_rapport", args=[self.profiel.pk]),
+            response.text,
+        )
+
+    def test_rapport(self):
+        response = self.app.get(
+            reverse("admin:utils_requestprofiel_rapport", args=[self.profiel.pk]),
+            user=self.superuser,
+        )
+
+        self.assertEqual(response.text, "<h1>rapport</h1>")
+
+    def test_speedscope(self):
+        response = self.app.get(
+            reverse("admin:utils_requestprofiel_speedscope", args=[self.profiel.pk]),
+            user=self.superuser,
+        )
+
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertEqual(response.json, self.profiel.speedscope)
+
+    def test_download_requires_login(self):
+        self.app.get(
+            reverse("admin:utils_requestprofiel_rapport", args=[self.profiel.pk]),
+            status=302,
+        )
+
+    def test_no_add_permission(self):
+        self.app.get(
+            reverse("admin:utils_requestprofiel_add"), user=self.superuser, status=403
+        )
@@ -54,3 +54,13 @@ validate_postal_code = CustomRegexValidator(
         "Invalid postal code. A postal code must consist of 4 numbers followed by a space and two capital letters (e.g. 1234 AB)."
     ),
 )
+
+# path of an attribute in a json object, nested keys are separated by `__`
+JSON_PAD_REGEX = r"[^\s_]+(?:_[^\s_]+)*(?:__[^\s_]+(?:_[^\s_]+)*)*"
+
+validate_json_pad = RegexValidator(
+    regex=f"^{JSON_PAD_REGEX}$",
+    message=_(
+        "Ongeldig pad. Een pad bestaat uit sleutels zonder spaties, geneste sleutels worden gescheiden door `__` (bijvoorbeeld `persoon__leeftijd`)."
+    ),
+)
@@ -1,16 +1,27 @@
+import hashlib
+
 from django import http
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max
 from django.template import TemplateDoesNotExist, loader
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
 from django.views.generic import TemplateView
 
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from rest_framework import status
 from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from .filters import split_multi_valued_lookup
+from .metrics import get_registry
+from .pagination import OptionalKeysetPagination
+
 
 @requires_csrf_token
 def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
@@ -33,7 +44,133 @@ def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
     return http.HttpResponseServerError(template.render(context))
 
 
-class OrderedModelViewSet(ModelViewSet):
+def metrics(request):
+    """
+    The Prometheus metrics, see ``PROMETHEUS_METRICS``.
+    """
+    if not settings.PROMETHEUS_METRICS:
+        raise http.Http404()
+
+    return http.HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
+
+
+class ConditionalGetMixin:
+    # Support conditional requests (If-None-Match / If-Modified-Since) on the list and
+    # retrieve actions. (No docstring, it would end up in the API schema of every
+    # viewset.)
+    #
+    # The validators are computed with a single aggregate query over the
+    # `conditional_get_fields` timestamps, so a matching request gets a 304 without the
+    # objects being fetched or serialized. The query runs for every list and retrieve
+    # request, also when the client sent no validators, on top of the queries of the
+    # response itself. Related timestamps (e.g.
+    # `product_type__update_datum`) can be added for data of related objects that is
+    # part of the response. Viewsets of models without an `update_datum` are left
+    # untouched.
+
+    conditional_get_fields: tuple[str, ...] = ("update_datum",)
+
+    def conditional_get_enabled(self) -> bool:
+        if not self.conditional_get_fields:
+            return False
+        try:
+            self.queryset.model._meta.get_field(
+                self.conditional_get_fields[0].split("__")[0]
+            )
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def get_conditional_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.detail:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        return queryset
+
+    def get_conditional_validators(self, queryset):
+        """
+        Return the ``(etag, last_modified)`` of the queryset, ``None`` when it is empty
+        for a detail action so the regular 404 is returned.
+        """
+        # a join on a multi-valued relation repeats the objects, only then the count
+        # needs the (more expensive) distinct
+        distinct = any(
+            split_multi_valued_lookup(queryset.model, field)
+            for field in self.conditional_get_fields
+        )
+        result = queryset.order_by().aggregate(
+            _count=Count("pk", distinct=distinct),
+            **{
+                f"_{index}": Max(field)
+                for index, field in enumerate(self.conditional_get_fields)
+            },
+        )
+        count = result.pop("_count")
+        if self.detail and not count:
+            return None
+
+        timestamps = [value for value in result.values() if value is not None]
+        last_modified = max(timestamps) if timestamps else None
+
+        key = "\n".join(
+            [
+                self.request.get_full_path(),
+                self.request.LANGUAGE_CODE,
+                str(count),
+                *(value.isoformat() if value else "" for value in result.values()),
+            ]
+        )
+        etag = quote_etag(hashlib.sha256(key.encode()).hexdigest()[:32])
+        return etag, last_modified
+
+    def conditional_get(self, handler, request, *args, **kwargs):
+        if not self.conditional_get_enabled():
+            return handler(request, *args, **kwargs)
+
+        validators = self.get_conditional_validators(self.get_conditional_queryset())
+        if validators is None:
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = validators
+        # Last-Modified only has a resolution of seconds and does not change when an
+        # object is removed from a list, so lists are only validated with the ETag.
+        if not self.detail:
+            last_modified = None
+
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified and int(last_modified.timestamp()),
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+            if last_modified:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+            patch_vary_headers(response, ("Accept-Language",))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        # cursor pagination is used to page through large collections without a
+        # count, so the collection validator is not computed for it
+        if isinstance(
+            self.paginator, OptionalKeysetPagination
+        ) and self.paginator.uses_keyset(request):
+            return super().list(request, *args, **kwargs)
+        return self.conditional_get(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_get(super().retrieve, request, *args, **kwargs)
+
+
+class OrderedModelViewSet(ConditionalGetMixin, ModelViewSet):
     def get_queryset(self):
         return self.queryset.order_by("id")
 